@@ -1,28 +1,26 @@
-import os
+import glob
+
+from line_stream import dedupe_lines, rewrite
+from log_audit import guard
 
 app_path = 'src/App.tsx'
 
-with open(app_path, 'r') as f:
-    lines = f.readlines()
-
-new_lines = []
-seen_ns_log = False
-seen_strat_log = False
-
-for line in lines:
-    if 'console.log("Button clicked in 01. Design: Update North Star");' in line:
-        if seen_ns_log:
-            continue # Skip duplicate
-        seen_ns_log = True
-    
-    if 'console.log("Button clicked in 01. Design: Add Strategy");' in line:
-        if seen_strat_log:
-            continue
-        seen_strat_log = True
-        
-    new_lines.append(line)
-
-with open(app_path, 'w') as f:
-    f.writelines(new_lines)
+# Keep only the first copy of each injected log line; streamed line by line
+DUPLICATE_LOGS = (
+    'console.log("Button clicked in 01. Design: Update North Star");',
+    'console.log("Button clicked in 01. Design: Add Strategy");',
+)
+
+rewrite(app_path, dedupe_lines(DUPLICATE_LOGS), opener=open)
 
 print("Cleaned up duplicate logs")
+
+# Logs on render and realtime paths (every fetch a postgres_changes event
+# triggers) go behind import.meta.env.DEV so production builds drop them;
+# see log_audit.py for the classification
+DATA_PATHS = [app_path, *sorted(glob.glob('src/hooks/*.ts')), *sorted(glob.glob('src/contexts/*.tsx')),
+              'src/lib/supabase.ts']
+
+guarded = [site for path in DATA_PATHS for site in guard(path, opener=open)]
+
+print(f"Guarded {len(guarded)} hot log(s) behind import.meta.env.DEV")
@@ -1,20 +1,12 @@
-import os
+from patch_engine import Patch, PatchSet
+from tsx_index import TsxIndex
 
 app_path = 'src/App.tsx'
 
-with open(app_path, 'r') as f:
-    content = f.read()
-
 # 1. Branding: GrowthOS -> Growth Lab
 branding_search = "<span style={{ fontWeight: 800, fontSize: '18px', letterSpacing: '-0.5px' }}>GrowthOS</span>"
 branding_replace = "<span style={{ fontWeight: 800, fontSize: '18px', letterSpacing: '-0.5px' }}>Growth Lab</span>"
 
-if branding_search in content:
-    content = content.replace(branding_search, branding_replace)
-    print("Updated Branding to Growth Lab")
-else:
-    print("Could not find Branding tag")
-
 # 2. Add Logging and Functional Updates
 
 # handleAddObjective
@@ -22,57 +14,78 @@ start_obj = "  const handleAddObjective = () => {"
 replace_obj = """  const handleAddObjective = () => {
     console.log("Button clicked in 01. Design: New Objective");"""
 
-if start_obj in content and "Button clicked" not in content:
-    content = content.replace(start_obj, replace_obj)
-    print("Updated handleAddObjective logging")
-
-
 # handleUpdateNorthStar
 # Search for the block start and replace the whole function logic or just insert log.
 # User wants functional update too.
+# The setState replacement is limited to the function body (the `within`
+# range), located with the TSX brace index so nested braces cannot throw
+# off the match.
 ns_search_start = "  const handleUpdateNorthStar = () => {"
-ns_search_end = "  };"
-# This is risky with simple replace if there are nested braces matching end.
-# But indentation is key.
-# I'll just replace the start and the setState part.
-
-if ns_search_start in content:
-    content = content.replace(ns_search_start, """  const handleUpdateNorthStar = () => {
-    console.log("Button clicked in 01. Design: Update North Star");""")
-    
-    # Replace setState block
-    state_search = """    setNorthStar({
+ns_replace_start = """  const handleUpdateNorthStar = () => {
+    console.log("Button clicked in 01. Design: Update North Star");"""
+
+state_search = """    setNorthStar({
       ...northStar,
       name: newName || northStar.name,
       currentValue: parseFloat(newCurrent.replace(/,/g, '')) || northStar.currentValue,
       targetValue: parseFloat(newTarget.replace(/,/g, '')) || northStar.targetValue
     });"""
-    
-    state_replace = """    setNorthStar(prev => ({
+
+state_replace = """    setNorthStar(prev => ({
       ...prev,
       name: newName || prev.name,
       currentValue: parseFloat(newCurrent.replace(/,/g, '')) || prev.currentValue,
       targetValue: parseFloat(newTarget.replace(/,/g, '')) || prev.targetValue
     }));"""
-    
-    if state_search in content:
-        content = content.replace(state_search, state_replace)
-        print("Updated setNorthStar to functional update")
-    else:
-        print("Could not find setNorthStar block")
-        
-    print("Updated handleUpdateNorthStar logging")
-
 
 # handleAddStrategy
 start_strat = "  const handleAddStrategy = (objectiveId: string) => {"
 replace_strat = """  const handleAddStrategy = (objectiveId: string) => {
     console.log("Button clicked in 01. Design: Add Strategy");"""
 
-if start_strat in content:
-    content = content.replace(start_strat, replace_strat)
-    print("Updated handleAddStrategy logging")
 
+def north_star_body(content):
+    """The body of handleUpdateNorthStar, or None when the handler isn't there."""
+    if ns_search_start not in content:
+        return None
+    body = TsxIndex(content).function_body('handleUpdateNorthStar')
+    return None if body is None else (body.start, body.end)
+
+
+PATCHES = PatchSet([
+    Patch(branding_search, branding_replace, name='branding'),
+    Patch(start_obj, replace_obj, name='objective log', unless="Button clicked"),
+    Patch(ns_search_start, ns_replace_start, name='north star log'),
+    Patch(state_search, state_replace, name='north star state', within=north_star_body),
+    Patch(start_strat, replace_strat, name='strategy log'),
+])
+
+TARGETS = {app_path: PATCHES}
+
+if __name__ == '__main__':
+    with open(app_path, 'r') as f:
+        content = f.read()
+
+    result = PATCHES.apply(content)
+    applied = result.applied
+
+    if applied['branding']:
+        print("Updated Branding to Growth Lab")
+    else:
+        print("Could not find Branding tag")
+
+    if applied['objective log']:
+        print("Updated handleAddObjective logging")
+
+    if applied['north star log']:
+        if applied['north star state']:
+            print("Updated setNorthStar to functional update")
+        else:
+            print("Could not find setNorthStar block")
+        print("Updated handleUpdateNorthStar logging")
+
+    if applied['strategy log']:
+        print("Updated handleAddStrategy logging")
 
-with open(app_path, 'w') as f:
-    f.write(content)
+    with open(app_path, 'w') as f:
+        f.write(result.content)
@@ -1,10 +1,7 @@
-import os
+from patch_engine import Patch, PatchSet
 
 file_path = 'src/App.tsx'
 
-with open(file_path, 'r') as f:
-    content = f.read()
-
 # Locate the bad block
 # It starts with {[ and then the map
 bad_block = """                    {[
@@ -32,10 +29,20 @@ good_block = """                    {(['impact', 'confidence', 'ease'] as const)
                       </div>
                     )})}"""
 
-if bad_block in content:
-    content = content.replace(bad_block, good_block)
-    with open(file_path, 'w') as f:
-        f.write(content)
-    print("Fixed syntax error")
-else:
-    print("Could not find bad block to fix")
+PATCHES = PatchSet([
+    Patch(bad_block, good_block, name='ice score map'),
+])
+
+TARGETS = {file_path: PATCHES}
+
+if __name__ == '__main__':
+    with open(file_path, 'r') as f:
+        content = f.read()
+
+    result = PATCHES.apply(content)
+    if result.changed:
+        with open(file_path, 'w') as f:
+            f.write(result.content)
+        print("Fixed syntax error")
+    else:
+        print("Could not find bad block to fix")
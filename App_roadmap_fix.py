@@ -1,12 +1,9 @@
-import os
+from patch_engine import Patch, PatchSet
 
 app_path = 'src/App.tsx'
 roadmap_path = 'src/RoadmapView.tsx'
 
 # 1. Update App.tsx Handlers
-with open(app_path, 'r') as f:
-    app_content = f.read()
-
 old_handlers = """  const handleAddObjective = () => {
     const title = window.prompt("Enter New Objective Title:");
     if (!title) return;
@@ -63,18 +60,11 @@ new_handlers = """  const handleAddObjective = () => {
     setStrategies(prev => [...prev, newStrategy]);
   };"""
 
-if old_handlers in app_content:
-    app_content = app_content.replace(old_handlers, new_handlers)
-    with open(app_path, 'w') as f:
-        f.write(app_content)
-    print("Updated App.tsx handlers")
-else:
-    print("Could not find App.tsx handlers to update")
+APP_PATCHES = PatchSet([
+    Patch(old_handlers, new_handlers, name='handlers'),
+])
 
 # 2. Update RoadmapView.tsx (North Star + Empty State)
-with open(roadmap_path, 'r') as f:
-    roadmap_content = f.read()
-
 # Update North Star Edit Logic to strip commas
 old_ns_edit = """    onUpdateNorthStar({
       ...northStar,
@@ -90,8 +80,6 @@ new_ns_edit = """    onUpdateNorthStar({
       targetValue: parseFloat(newTarget.replace(/,/g, '')) || northStar.targetValue
     });"""
 
-roadmap_content = roadmap_content.replace(old_ns_edit, new_ns_edit)
-
 # Add Empty State
 # Find start of list
 list_start = """      {/* Objectives List */}
@@ -116,8 +104,30 @@ list_start_with_empty = """      {/* Objectives List */}
         )}
         {objectives.map(objective => {"""
 
-roadmap_content = roadmap_content.replace(list_start, list_start_with_empty)
+ROADMAP_PATCHES = PatchSet([
+    Patch(old_ns_edit, new_ns_edit, name='north star edit'),
+    Patch(list_start, list_start_with_empty, name='empty state'),
+])
+
+TARGETS = {app_path: APP_PATCHES, roadmap_path: ROADMAP_PATCHES}
+
+if __name__ == '__main__':
+    with open(app_path, 'r') as f:
+        app_content = f.read()
+
+    result = APP_PATCHES.apply(app_content)
+    if result.changed:
+        with open(app_path, 'w') as f:
+            f.write(result.content)
+        print("Updated App.tsx handlers")
+    else:
+        print("Could not find App.tsx handlers to update")
+
+    with open(roadmap_path, 'r') as f:
+        roadmap_content = f.read()
+
+    roadmap_content = ROADMAP_PATCHES.apply(roadmap_content).content
 
-with open(roadmap_path, 'w') as f:
-    f.write(roadmap_content)
-print("Updated RoadmapView.tsx")
+    with open(roadmap_path, 'w') as f:
+        f.write(roadmap_content)
+    print("Updated RoadmapView.tsx")
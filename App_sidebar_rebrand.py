@@ -1,10 +1,7 @@
-import os
+from patch_engine import Patch, PatchSet
 
 app_path = 'src/App.tsx'
 
-with open(app_path, 'r') as f:
-    content = f.read()
-
 # 1. Replace Sidebar Block
 old_sidebar = """        <button 
           className={'tab ' + (view === 'board' ? 'active' : '')} 
@@ -78,12 +75,6 @@ new_sidebar = """        <button
           <span style={{ fontWeight: 500 }}>04. Learning</span>
         </button>"""
 
-if old_sidebar in content:
-    content = content.replace(old_sidebar, new_sidebar)
-    print("Replaced sidebar buttons")
-else:
-    print("Could not find sidebar buttons block")
-
 # 2. Replace Header Titles
 old_header = """           <h2 style={{ fontSize: '18px' }}>
               {view === 'board' && 'Experiment Board'}
@@ -99,11 +90,28 @@ new_header = """           <h2 style={{ fontSize: '18px' }}>
               {view === 'library' && '04. Learning'}
            </h2>"""
 
-if old_header in content:
-    content = content.replace(old_header, new_header)
-    print("Replaced header titles")
-else:
-    print("Could not find header titles block")
+PATCHES = PatchSet([
+    Patch(old_sidebar, new_sidebar, name='sidebar'),
+    Patch(old_header, new_header, name='header'),
+])
+
+TARGETS = {app_path: PATCHES}
+
+if __name__ == '__main__':
+    with open(app_path, 'r') as f:
+        content = f.read()
+
+    result = PATCHES.apply(content)
+
+    if result.applied['sidebar']:
+        print("Replaced sidebar buttons")
+    else:
+        print("Could not find sidebar buttons block")
+
+    if result.applied['header']:
+        print("Replaced header titles")
+    else:
+        print("Could not find header titles block")
 
-with open(app_path, 'w') as f:
-    f.write(content)
+    with open(app_path, 'w') as f:
+        f.write(result.content)
@@ -1,4 +1,4 @@
-import os
+from minimal_write import report, write_minimal
 
 roadmap_path = 'src/RoadmapView.tsx'
 
@@ -240,6 +240,8 @@ export const RoadmapView: React.FC<RoadmapViewProps> = ({
 };
 """
 
-with open(roadmap_path, 'w') as f:
-    f.write(new_content)
-print("Restored RoadmapView.tsx to Clean Architecture")
+# Only rewrite what differs from the file on disk (no write at all if identical)
+hunks = write_minimal(roadmap_path, new_content, opener=open)
+report(roadmap_path, hunks)
+if hunks:
+    print("Restored RoadmapView.tsx to Clean Architecture")
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Benchmark harness for the fix scripts and the batch runner.
+
+    python bench_patches.py                                  # 1k/10k/100k lines
+    python bench_patches.py --sizes 1000,10000 --repeat 5
+    python bench_patches.py --baseline bench_baseline.json --threshold 0.25
+
+Synthetic fixtures are built from the real src/App.tsx and
+src/RoadmapView.tsx by appending renamed copies of their top-level JSX
+components (Kanban card and column, table, drawer/modals, the App and
+RoadmapView components themselves) until the target line count is reached.
+Every unit is run in-process against those fixtures through patch_runner's
+FileCache, so nothing on disk is modified.
+
+Each (unit, size) pair records the best wall time over --repeat runs and
+the peak traced memory of one extra run. The JSON report is written to
+--output; with --baseline, any timing slower than baseline * (1 + threshold)
+is reported as a regression and the script exits with status 1.
+"""
+import argparse
+import contextlib
+import io
+import json
+import platform
+import re
+import sys
+import time
+import tracemalloc
+
+from patch_runner import FileCache, discover, run_unit, run_units
+from tsx_index import TsxIndex
+
+FIXTURE_SOURCES = ('src/App.tsx', 'src/RoadmapView.tsx')
+DEFAULT_SIZES = (1000, 10000, 100000)
+
+
+def component_blocks(content):
+    """Top-level `const Name = ... => { ... }` declarations that render JSX."""
+    index = TsxIndex(content)
+    tokens = index.tokens
+    blocks = []
+    for i, token in enumerate(tokens):
+        if token.text != 'const' or index.enclosing(token.start) is not None:
+            continue
+        name = tokens[i + 1].text
+        body = index.function_body(name)
+        if body is None or not any(body.start < el.start < body.end for el in index.elements()):
+            continue
+        end = body.end + 1 if content.startswith(';', body.end) else body.end
+        blocks.append((name, content[token.start:end]))
+    return blocks
+
+
+def build_fixture(content, lines):
+    """Grow content to at least `lines` lines with renamed component copies."""
+    blocks = component_blocks(content)
+    if not blocks:
+        return content
+    names = re.compile(r'\b(' + '|'.join(re.escape(name) for name, _ in blocks) + r')\b')
+    pieces = [content]
+    total = content.count('\n')
+    copy = 0
+    while total < lines:
+        copy += 1
+        for _, block in blocks:
+            renamed = names.sub(lambda m: f"{m.group(1)}_{copy}", block)
+            pieces.append('\n\n' + renamed + '\n')
+            total += renamed.count('\n') + 3
+            if total >= lines:
+                break
+    return ''.join(pieces)
+
+
+def make_fixtures(sizes):
+    sources = {}
+    for path in FIXTURE_SOURCES:
+        with open(path, 'r') as f:
+            sources[path] = f.read()
+    return {size: {path: build_fixture(content, size) for path, content in sources.items()}
+            for size in sizes}
+
+
+def fresh_cache(fixture):
+    cache = FileCache()
+    for path, content in fixture.items():
+        key = cache.key(path)
+        cache.files[key] = content
+        cache.original[key] = content
+    return cache
+
+
+def measure(run, fixture, repeat):
+    """Best wall time over `repeat` runs, plus peak traced memory of one run."""
+    timings = []
+    for _ in range(repeat):
+        cache = fresh_cache(fixture)
+        with contextlib.redirect_stdout(io.StringIO()):
+            started = time.perf_counter()
+            run(cache)
+            timings.append(time.perf_counter() - started)
+
+    cache = fresh_cache(fixture)
+    tracemalloc.start()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            run(cache)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return min(timings), peak
+
+
+def benchmark(units, sizes, repeat):
+    fixtures = make_fixtures(sizes)
+    results = []
+    for size, fixture in fixtures.items():
+        lines = {path: content.count('\n') + 1 for path, content in fixture.items()}
+        print(f"📏 {size} lines target: " + ', '.join(f"{p} = {n}" for p, n in lines.items()))
+
+        jobs = [(unit, lambda cache, unit=unit: run_unit(unit, cache)) for unit in units]
+        jobs.append(('patch_runner (batch)', lambda cache: run_units(units, cache)))
+        for name, run in jobs:
+            try:
+                seconds, peak = measure(run, fixture, repeat)
+            except Exception as exc:
+                print(f"   ❌ {name}: {exc!r}")
+                results.append({'unit': name, 'size': size, 'error': repr(exc)})
+                continue
+            print(f"   {name:<28} {seconds * 1000:10.1f} ms {peak / 1024:10.0f} KiB peak")
+            results.append({'unit': name, 'size': size, 'lines': lines,
+                            'seconds': seconds, 'peak_bytes': peak})
+    return results
+
+
+def regressions(results, baseline, threshold):
+    previous = {(r['unit'], r['size']): r for r in baseline.get('results', []) if 'seconds' in r}
+    slower = []
+    for result in results:
+        before = previous.get((result['unit'], result['size']))
+        if before and 'seconds' in result and result['seconds'] > before['seconds'] * (1 + threshold):
+            slower.append((result, before))
+    return slower
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the patch scripts on synthetic large fixtures.")
+    parser.add_argument('units', nargs='*', help="Fix scripts to time (default: every App_*/Roadmap_* script)")
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)), help="Comma-separated target line counts")
+    parser.add_argument('--repeat', type=int, default=3, help="Timed runs per measurement (best is kept)")
+    parser.add_argument('--output', default='bench_report.json', help="Where to write the JSON report")
+    parser.add_argument('--baseline', help="Previous report to compare against")
+    parser.add_argument('--threshold', type=float, default=0.2, help="Allowed slowdown vs the baseline (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    units = args.units or discover()
+    sizes = [int(size) for size in args.sizes.split(',')]
+    results = benchmark(units, sizes, args.repeat)
+
+    report = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'repeat': args.repeat,
+        'threshold': args.threshold,
+        'results': results,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n📄 Report written to {args.output}")
+
+    if not args.baseline:
+        return 0
+    with open(args.baseline, 'r') as f:
+        baseline = json.load(f)
+    slower = regressions(results, baseline, args.threshold)
+    for result, before in slower:
+        ratio = result['seconds'] / before['seconds']
+        print(f"🐢 {result['unit']} @ {result['size']} lines: "
+              f"{before['seconds'] * 1000:.1f} ms -> {result['seconds'] * 1000:.1f} ms ({ratio:.2f}x)")
+    if slower:
+        print(f"❌ {len(slower)} regression(s) over {args.threshold:.0%}")
+        return 1
+    print("✅ No regressions against baseline")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Change-feed coalescing for experiment realtime updates.
+
+useExperiments.ts refetches `select('*')` for the whole project on every
+postgres_changes event, and again after each of its own writes, so a
+drag of an ICE slider becomes one full reload per event. ChangeFeed sits
+between the row-level change stream and the clients instead:
+
+* events are grouped per project and held for a short debounce window
+  (flushed when the project has been quiet for `debounce` seconds, or at
+  the latest `max_delay` seconds after the first event);
+* all events for one row inside a window collapse into a single patch:
+  insert+update -> insert, insert+delete -> nothing, update+update ->
+  update, update+delete -> delete;
+* updates carry only the columns that differ from the last row the
+  clients were sent, so a slider drag is one {impact, ice_score} patch.
+
+Clients apply the patches to their local rows with apply_patches()
+instead of reloading the project.
+
+Events use the Supabase realtime payload shape:
+
+    {'table': 'experiments', 'eventType': 'UPDATE', 'new': {...}, 'old': {...}}
+
+LocalBroker is an in-process stand-in for the realtime server, enough to
+drive the feed from tests or the demo:
+
+    python change_feed.py --demo
+"""
+import argparse
+import collections
+import queue
+import sys
+import threading
+import time
+
+CHANGES_TOPIC = 'postgres_changes'
+
+Change = collections.namedtuple('Change', 'table op key project_id row')
+
+
+def patch_topic(project_id):
+    return f"patches:{project_id}"
+
+
+class LocalBroker:
+    """Minimal in-process pub/sub: each subscriber gets its own queue."""
+
+    def __init__(self):
+        self.subscribers = collections.defaultdict(list)
+        self.lock = threading.Lock()
+
+    def subscribe(self, topic):
+        inbox = queue.Queue()
+        with self.lock:
+            self.subscribers[topic].append(inbox)
+        return inbox
+
+    def publish(self, topic, message):
+        with self.lock:
+            inboxes = list(self.subscribers.get(topic, ()))
+        for inbox in inboxes:
+            inbox.put(message)
+
+
+class PendingRow:
+    """Net effect of every event seen for one row in the current window."""
+
+    __slots__ = ('existed', 'replaced', 'row')
+
+    def __init__(self, existed):
+        self.existed = existed   # row was known to clients before the window
+        self.replaced = False    # deleted and inserted again: send the whole row
+        self.row = None          # latest full row, None once deleted
+
+
+class Window:
+    __slots__ = ('opened', 'touched', 'rows')
+
+    def __init__(self, now):
+        self.opened = now
+        self.touched = now
+        self.rows = {}           # (table, key) -> PendingRow, in arrival order
+
+
+class Coalescer:
+    """Buffers changes per project and turns each window into minimal patches."""
+
+    def __init__(self, debounce=0.05, max_delay=0.5, snapshot=()):
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.known = {}          # (table, key) -> last row sent to clients
+        self.windows = {}        # project id -> Window
+        self.events = 0
+        self.patches = 0
+        for table, row in snapshot:
+            self.known[(table, row['id'])] = dict(row)
+
+    def parse(self, event):
+        table = event.get('table', 'experiments')
+        op = event['eventType'].upper()
+        new, old = event.get('new') or {}, event.get('old') or {}
+        key = new.get('id', old.get('id'))
+        project_id = new.get('project_id', old.get('project_id'))
+        if project_id is None:
+            # DELETE payloads only carry the primary key unless REPLICA IDENTITY FULL
+            project_id = self.project_of(table, key)
+        return Change(table, op, key, project_id, new if op != 'DELETE' else None)
+
+    def project_of(self, table, key):
+        slot = (table, key)
+        for project_id, window in self.windows.items():
+            if slot in window.rows:
+                return project_id
+        return (self.known.get(slot) or {}).get('project_id')
+
+    def add(self, event, now=None):
+        now = time.monotonic() if now is None else now
+        change = self.parse(event)
+        window = self.windows.get(change.project_id)
+        if window is None:
+            window = self.windows[change.project_id] = Window(now)
+        window.touched = now
+        self.events += 1
+
+        slot = (change.table, change.key)
+        pending = window.rows.get(slot)
+        if pending is None:
+            pending = window.rows[slot] = PendingRow(slot in self.known)
+        if change.op == 'DELETE':
+            pending.row = None
+            pending.replaced = pending.existed
+        elif pending.row is None or change.op == 'INSERT':
+            if change.op == 'INSERT':
+                pending.replaced = pending.existed
+            pending.row = dict(change.row)
+        else:
+            pending.row.update(change.row)
+        return change
+
+    def deadline(self, project_id):
+        window = self.windows[project_id]
+        return min(window.touched + self.debounce, window.opened + self.max_delay)
+
+    def next_deadline(self):
+        return min((self.deadline(project_id) for project_id in self.windows), default=None)
+
+    def ready(self, now=None):
+        now = time.monotonic() if now is None else now
+        return [project_id for project_id in self.windows if self.deadline(project_id) <= now]
+
+    def flush(self, project_id):
+        """Close a project's window; returns its patches (possibly empty)."""
+        window = self.windows.pop(project_id)
+        patches = []
+        for (table, key), pending in window.rows.items():
+            patch = self.diff(table, key, pending)
+            if patch is not None:
+                patches.append(patch)
+        self.patches += len(patches)
+        return patches
+
+    def flush_ready(self, now=None):
+        return [(project_id, self.flush(project_id)) for project_id in self.ready(now)]
+
+    def diff(self, table, key, pending):
+        slot = (table, key)
+        before = self.known.get(slot)
+        if pending.row is None:
+            self.known.pop(slot, None)
+            return {'table': table, 'op': 'delete', 'id': key} if pending.existed else None
+        self.known[slot] = pending.row
+        if before is None or pending.replaced:
+            return {'table': table, 'op': 'insert', 'id': key, 'values': pending.row}
+        values = {column: value for column, value in pending.row.items() if before.get(column) != value}
+        if not values:
+            return None
+        return {'table': table, 'op': 'update', 'id': key, 'values': values}
+
+
+class ChangeFeed:
+    """Consumes CHANGES_TOPIC from a broker and publishes coalesced patches per project."""
+
+    def __init__(self, broker, coalescer=None):
+        self.broker = broker
+        self.coalescer = coalescer or Coalescer()
+        self.inbox = broker.subscribe(CHANGES_TOPIC)
+        self.stopped = threading.Event()
+        self.thread = None
+
+    def publish_ready(self, now=None):
+        for project_id, patches in self.coalescer.flush_ready(now):
+            if patches:
+                self.broker.publish(patch_topic(project_id), patches)
+
+    def run(self):
+        while not self.stopped.is_set():
+            deadline = self.coalescer.next_deadline()
+            timeout = 0.1 if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                self.coalescer.add(self.inbox.get(timeout=timeout))
+            except queue.Empty:
+                pass
+            # Also checked after every event, so a steady stream still
+            # flushes once max_delay has passed
+            self.publish_ready()
+
+    def start(self):
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+        return self.thread
+
+    def stop(self):
+        """Stop the worker, then publish every open window, including events still queued."""
+        self.stopped.set()
+        # The coalescer is only touched by run(); wait for it before flushing here
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        while True:
+            try:
+                self.coalescer.add(self.inbox.get_nowait())
+            except queue.Empty:
+                break
+        for project_id in list(self.coalescer.windows):
+            patches = self.coalescer.flush(project_id)
+            if patches:
+                self.broker.publish(patch_topic(project_id), patches)
+
+
+def apply_patches(rows, patches):
+    """Client side: apply patches to {(table, id): row} in place."""
+    for patch in patches:
+        slot = (patch['table'], patch['id'])
+        if patch['op'] == 'delete':
+            rows.pop(slot, None)
+        elif patch['op'] == 'insert':
+            rows[slot] = dict(patch['values'])
+        else:
+            rows.setdefault(slot, {'id': patch['id']}).update(patch['values'])
+    return rows
+
+
+def demo():
+    project = 'project-1'
+    experiment = {'id': 'exp-1', 'project_id': project, 'title': 'Pricing page test',
+                  'impact': 5, 'confidence': 5, 'ease': 5, 'ice_score': 125}
+    broker = LocalBroker()
+    coalescer = Coalescer(snapshot=[('experiments', experiment)])
+    feed = ChangeFeed(broker, coalescer)
+    client = broker.subscribe(patch_topic(project))
+    client_rows = {('experiments', experiment['id']): dict(experiment)}
+    feed.start()
+
+    # An ICE slider drag, plus a card created and deleted again in the same burst
+    for impact in range(5, 11):
+        row = dict(experiment, impact=impact, ice_score=impact * 25)
+        broker.publish(CHANGES_TOPIC, {'table': 'experiments', 'eventType': 'UPDATE', 'new': row, 'old': {'id': 'exp-1'}})
+    draft = {'id': 'exp-2', 'project_id': project, 'title': 'Draft'}
+    broker.publish(CHANGES_TOPIC, {'table': 'experiments', 'eventType': 'INSERT', 'new': draft})
+    broker.publish(CHANGES_TOPIC, {'table': 'experiments', 'eventType': 'DELETE', 'old': {'id': 'exp-2', 'project_id': project}})
+
+    batch = client.get(timeout=2)
+    feed.stop()
+    apply_patches(client_rows, batch)
+    print(f"📡 {coalescer.events} change events -> {coalescer.patches} patch(es)")
+    for patch in batch:
+        print(f"   {patch['op']} {patch['table']}/{patch['id']}: {patch.get('values')}")
+    print(f"   client row: {client_rows[('experiments', 'exp-1')]}")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Coalesce row-level change events into per-project patches.")
+    parser.add_argument('--demo', action='store_true', help="Run a slider-drag burst through the local broker")
+    args = parser.parse_args(argv)
+    if args.demo:
+        return demo()
+    parser.print_help()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
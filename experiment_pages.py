@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Keyset-paginated experiment loading with column projection.
+
+fetchProjects and useExperiments select('*') every column of every
+experiment, including long text and visual_proof, ordered by ice_score.
+ExperimentPages loads a project a page at a time instead:
+
+* pages are ordered by (ice_score DESC, id DESC) and continued with
+  WHERE (ice_score, id) < (last ice_score, last id), so page 100 costs
+  the same as page 1 (no OFFSET), and rows don't shift between pages when
+  others are inserted; supabase/keyset_index.sql adds the matching index;
+* only CARD_COLUMNS (what the board and table render) are selected;
+* DETAIL_COLUMNS (hypothesis, key_learnings, visual_proof, ...) are
+  fetched by details() when the drawer opens, and cached.
+
+    pages = ExperimentPages(conn, project_id)
+    page = pages.page()                      # first page
+    page = pages.page(page.next_cursor)      # next one; None when done
+    pages.details(experiment_id)             # drawer fields
+
+    python experiment_pages.py --dsn postgresql://localhost/growth --project <uuid>
+    python experiment_pages.py --project <uuid> --print-sql
+
+Works with any DB-API connection using the %s paramstyle (psycopg 3 or
+psycopg2); the CLI needs psycopg 3.
+"""
+import argparse
+import base64
+import collections
+import json
+import sys
+
+try:
+    import psycopg
+except ImportError:
+    psycopg = None
+
+CARD_COLUMNS = (
+    'id', 'title', 'status', 'owner_name', 'owner_avatar', 'impact', 'confidence', 'ease',
+    'ice_score', 'funnel_stage', 'north_star_metric', 'linked_strategy_id', 'labels',
+    'start_date', 'end_date',
+)
+DETAIL_COLUMNS = (
+    'hypothesis', 'observation', 'problem', 'source', 'test_url', 'success_criteria',
+    'target_metric', 'key_learnings', 'visual_proof',
+)
+ALL_COLUMNS = frozenset(CARD_COLUMNS + DETAIL_COLUMNS + ('project_id', 'created_at', 'updated_at'))
+
+PAGE_SIZE = 50
+
+Page = collections.namedtuple('Page', 'rows next_cursor')
+
+
+def encode_cursor(row):
+    """Opaque continuation token for the last row of a page."""
+    raw = json.dumps([row['ice_score'], str(row['id'])]).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii')
+
+
+def decode_cursor(cursor):
+    ice_score, exp_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+    return ice_score, exp_id
+
+
+def checked(columns):
+    unknown = [column for column in columns if column not in ALL_COLUMNS]
+    if unknown:
+        raise ValueError(f"Unknown experiment column(s): {', '.join(unknown)}")
+    return columns
+
+
+def page_query(project_id, columns=CARD_COLUMNS, limit=PAGE_SIZE, cursor=None):
+    """SQL and parameters for one page; fetches limit + 1 rows to detect the end."""
+    select = list(checked(columns))
+    for key in ('ice_score', 'id'):
+        if key not in select:
+            select.append(key)
+    sql = f"SELECT {', '.join(select)} FROM experiments WHERE project_id = %s"
+    params = [project_id]
+    if cursor is not None:
+        sql += " AND (ice_score, id) < (%s, %s::uuid)"
+        params.extend(decode_cursor(cursor))
+    sql += " ORDER BY ice_score DESC, id DESC LIMIT %s"
+    params.append(limit + 1)
+    return sql, params
+
+
+def detail_query(ids, columns=DETAIL_COLUMNS):
+    sql = f"SELECT id, {', '.join(checked(columns))} FROM experiments WHERE id = ANY(%s::uuid[])"
+    return sql, [list(ids)]
+
+
+def fetch_dicts(conn, sql, params):
+    with conn.cursor() as cur:
+        cur.execute(sql, params)
+        names = [column[0] for column in cur.description]
+        return [dict(zip(names, row)) for row in cur.fetchall()]
+
+
+class ExperimentPages:
+    """Paged card rows for one project, with drawer fields loaded on demand."""
+
+    def __init__(self, conn, project_id, columns=CARD_COLUMNS, page_size=PAGE_SIZE):
+        self.conn = conn
+        self.project_id = project_id
+        self.columns = checked(tuple(columns))
+        self.page_size = page_size
+        self.loaded = {}     # experiment id -> detail fields
+
+    def page(self, cursor=None):
+        sql, params = page_query(self.project_id, self.columns, self.page_size, cursor)
+        rows = fetch_dicts(self.conn, sql, params)
+        if len(rows) <= self.page_size:
+            return Page(rows, None)
+        rows = rows[:self.page_size]
+        return Page(rows, encode_cursor(rows[-1]))
+
+    def __iter__(self):
+        cursor = None
+        while True:
+            page = self.page(cursor)
+            yield from page.rows
+            if page.next_cursor is None:
+                return
+            cursor = page.next_cursor
+
+    def details(self, *ids):
+        """Detail fields for one or more experiments; one query for all uncached ids."""
+        missing = [str(exp_id) for exp_id in ids if str(exp_id) not in self.loaded]
+        if missing:
+            sql, params = detail_query(missing)
+            for row in fetch_dicts(self.conn, sql, params):
+                self.loaded[str(row.pop('id'))] = row
+        found = [self.loaded.get(str(exp_id)) for exp_id in ids]
+        return found[0] if len(ids) == 1 else found
+
+    def forget(self, exp_id):
+        """Drop cached details, e.g. after the experiment was edited."""
+        self.loaded.pop(str(exp_id), None)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Page through a project's experiments by ICE score.")
+    parser.add_argument('--dsn', help="Postgres connection string")
+    parser.add_argument('--project', required=True, help="Project id")
+    parser.add_argument('--page-size', type=int, default=PAGE_SIZE)
+    parser.add_argument('--print-sql', action='store_true', help="Show the page and detail queries and exit")
+    args = parser.parse_args(argv)
+
+    if args.print_sql or not args.dsn:
+        sample = encode_cursor({'ice_score': 336, 'id': '00000000-0000-0000-0000-000000000000'})
+        for sql, params in (page_query(args.project, limit=args.page_size),
+                            page_query(args.project, limit=args.page_size, cursor=sample),
+                            detail_query(['<id>'])):
+            print(f"{sql};\n   -- {params}")
+        return 0
+    if psycopg is None:
+        print("❌ psycopg is not installed: pip install \"psycopg[binary]\"")
+        return 1
+
+    with psycopg.connect(args.dsn) as conn:
+        pages = ExperimentPages(conn, args.project, page_size=args.page_size)
+        cursor, number = None, 0
+        while True:
+            page = pages.page(cursor)
+            number += 1
+            size = len(json.dumps(page.rows, default=str))
+            print(f"📄 page {number}: {len(page.rows)} rows, {size / 1024:.1f} KiB")
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
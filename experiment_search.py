@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Full-text search over experiment titles, hypotheses and learnings.
+
+The app searches with `title.toLowerCase().includes(query)` for every
+experiment on every keystroke and never looks at hypothesis, keyLearnings,
+observation or problem. SearchIndex is an inverted index over those fields:
+
+* tokens are accent-folded and case-folded, so "busqueda" finds
+  "búsqueda" and "Conversión" matches "conversion";
+* results are ranked with BM25, with the title weighted above body text;
+* the last query word is treated as a prefix, so partial input already
+  matches while the user types, and complete() suggests words;
+* add() / remove() update postings in place: an edited experiment costs
+  only its own terms, never a rebuild.
+
+    index = SearchIndex.from_store(store)        # or SearchIndex(); index.add(id, experiment)
+    index.search('friccion conver')              # [(experiment id, score), ...]
+    index.complete('conv')                       # ['conversión', 'conversacionales', ...]
+
+    python experiment_search.py portfolio.json "tasa de conversion"
+    python experiment_search.py portfolio.json --complete conv
+
+The same class indexes project names for PortfolioView with
+SearchIndex(fields={'name': 1.0}).
+"""
+import argparse
+import bisect
+import json
+import math
+import re
+import sys
+import time
+import unicodedata
+from collections import Counter
+
+# Experiment field -> weight applied to its term frequencies
+FIELD_WEIGHTS = {
+    'title': 3.0,
+    'hypothesis': 1.0,
+    'keyLearnings': 1.5,
+    'observation': 1.0,
+    'problem': 1.0,
+}
+
+WORD = re.compile(r'\w+')
+
+
+def fold(word):
+    """Lowercase and strip accents: 'Conversión' -> 'conversion'."""
+    decomposed = unicodedata.normalize('NFKD', word.casefold())
+    return ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def tokenize(text):
+    """(folded term, surface word) pairs for every word in text."""
+    if not text:
+        return []
+    return [(fold(word), word) for word in WORD.findall(unicodedata.normalize('NFC', text.lower()))]
+
+
+class SearchIndex:
+    """Incrementally maintained BM25 inverted index."""
+
+    def __init__(self, fields=FIELD_WEIGHTS, k1=1.2, b=0.75):
+        self.fields = dict(fields)
+        self.k1 = k1
+        self.b = b
+        self.postings = {}     # term -> {doc id: weighted term frequency}
+        self.documents = {}    # doc id -> Counter of its weighted terms
+        self.lengths = {}      # doc id -> weighted length
+        self.total_length = 0.0
+        self.terms = []        # sorted vocabulary, for prefix lookups
+        self.surface = {}      # term -> first spelling seen, for completions
+
+    @classmethod
+    def from_store(cls, store, **kwargs):
+        index = cls(**kwargs)
+        for view in store:
+            index.add(view.id, {name: getattr(view, name) for name in index.fields})
+        return index
+
+    def __len__(self):
+        return len(self.documents)
+
+    def __contains__(self, doc_id):
+        return doc_id in self.documents
+
+    # -- Updates ---------------------------------------------------------------
+
+    def add(self, doc_id, record):
+        """Index (or re-index) a document from a dict holding the indexed fields."""
+        if doc_id in self.documents:
+            self.remove(doc_id)
+        counts = Counter()
+        for name, weight in self.fields.items():
+            for term, word in tokenize(record.get(name)):
+                counts[term] += weight
+                self.surface.setdefault(term, word)
+        for term, tf in counts.items():
+            postings = self.postings.get(term)
+            if postings is None:
+                postings = self.postings[term] = {}
+                bisect.insort(self.terms, term)
+            postings[doc_id] = tf
+        self.documents[doc_id] = counts
+        self.lengths[doc_id] = length = sum(counts.values())
+        self.total_length += length
+
+    def remove(self, doc_id):
+        counts = self.documents.pop(doc_id, None)
+        if counts is None:
+            return
+        for term in counts:
+            postings = self.postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self.postings[term]
+                del self.terms[bisect.bisect_left(self.terms, term)]
+                self.surface.pop(term, None)
+        self.total_length -= self.lengths.pop(doc_id)
+        if not self.documents:
+            self.total_length = 0.0     # drop float drift from the running sum
+
+    # -- Queries ---------------------------------------------------------------
+
+    def expand(self, prefix, limit=None):
+        """Vocabulary terms starting with prefix, in sorted order."""
+        start = bisect.bisect_left(self.terms, prefix)
+        found = []
+        for term in self.terms[start:]:
+            if not term.startswith(prefix) or (limit is not None and len(found) >= limit):
+                break
+            found.append(term)
+        return found
+
+    def idf(self, term):
+        df = len(self.postings.get(term, ()))
+        n = len(self.documents)
+        return math.log(1 + (n - df + 0.5) / (df + 0.5))
+
+    def search(self, query, limit=10, prefix=True):
+        """Documents ranked by BM25; with prefix=True the last word also matches as a prefix."""
+        words = [term for term, _ in tokenize(query)]
+        if not words or self.total_length <= 0:
+            # No documents, or only empty ones: nothing has a posting to score
+            return []
+        groups = [[term] for term in words]
+        if prefix:
+            groups[-1] = self.expand(words[-1], limit=50) or groups[-1]
+
+        # BM25 length normalisation k1 * (1 - b + b * length / average), split
+        # into a constant and a per-length factor so the inner loop stays small
+        k1 = self.k1
+        base = k1 * (1 - self.b)
+        per_length = k1 * self.b * len(self.documents) / self.total_length
+        lengths = self.lengths
+        scores = Counter()
+        for group in groups:
+            for term in dict.fromkeys(group):
+                postings = self.postings.get(term)
+                if not postings:
+                    continue
+                weight = self.idf(term) * (k1 + 1)
+                for doc_id, tf in postings.items():
+                    scores[doc_id] += weight * tf / (tf + base + per_length * lengths[doc_id])
+        return scores.most_common(limit)
+
+    def complete(self, prefix, limit=10):
+        """Most common indexed words starting with prefix (accent-insensitive)."""
+        folded = fold(prefix)
+        candidates = self.expand(folded)
+        candidates.sort(key=lambda term: -len(self.postings[term]))
+        return [self.surface[term] for term in candidates[:limit]]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Search experiments in a Project JSON.")
+    parser.add_argument('source', help="Project JSON (one Project or a list)")
+    parser.add_argument('query', nargs='?', default='', help="Search text")
+    parser.add_argument('--complete', metavar='PREFIX', help="Suggest words for a prefix instead")
+    parser.add_argument('--limit', type=int, default=10)
+    args = parser.parse_args(argv)
+
+    with open(args.source, 'r') as f:
+        data = json.load(f)
+    projects = data if isinstance(data, list) else [data]
+    experiments = {exp['id']: exp for project in projects for exp in project.get('experiments') or []}
+
+    index = SearchIndex()
+    for exp_id, experiment in experiments.items():
+        index.add(exp_id, experiment)
+
+    started = time.perf_counter()
+    if args.complete:
+        results = index.complete(args.complete, args.limit)
+    else:
+        results = index.search(args.query, args.limit)
+    elapsed = time.perf_counter() - started
+
+    print(f"🔎 {len(index)} experiments, {len(index.terms)} terms, query took {elapsed * 1000:.2f} ms")
+    if args.complete:
+        print('   ' + ', '.join(results))
+    for exp_id, score in [] if args.complete else results:
+        print(f"   {score:6.2f}  {experiments[exp_id]['title']}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,479 @@
+#!/usr/bin/env python3
+"""
+Columnar in-memory store for Experiment records.
+
+A portfolio loaded as a list of dicts (the shape dbRowToExperiment and
+laboratorioPolancoData produce) pays for a dict, ~25 keys and a boxed
+object per field on every experiment. ExperimentStore keeps one column per
+field instead:
+
+* impact / confidence / ease / iceScore are typed `array` columns;
+* status, funnelStage, the owner fields and the other low-cardinality
+  strings are dictionary-encoded (one small int per row plus a shared
+  table of distinct values);
+* label lists are interned, so every experiment tagged ('Pricing', 'Web')
+  shares one tuple;
+* free text stays in plain lists.
+
+Rows are read back through ExperimentView, a __slots__ object created on
+demand, or converted to the src/types.ts dict with to_dict().
+
+status, funnelStage, linkedStrategyId and ownerName also keep hash
+indexes (code -> set of rows) that append/update/remove maintain, so the
+App.tsx views and the RoadmapView per-strategy lists are lookups that
+touch only the matching rows instead of a filter over every experiment:
+
+    store = ExperimentStore.from_project_json('portfolio.json')
+    store.where(status='Finished - Winner', funnelStage='Activation')
+    store.board()                       # {status: [...]} for BOARD_COLUMNS
+    store.by_strategy(strategy_ids)     # {strategy id: [...]}
+
+    python experiment_store.py --synthetic 200000   # memory vs a list of dicts
+"""
+import argparse
+import json
+import random
+import sys
+import time
+import tracemalloc
+from array import array
+
+NUMBER_DEFAULTS = {'impact': 5, 'confidence': 5, 'ease': 5, 'iceScore': 125}
+
+# field -> column kind, in src/types.ts order
+FIELDS = {
+    'id': 'text',
+    'title': 'text',
+    'status': 'category',
+    'ownerName': 'category',
+    'ownerAvatar': 'category',
+    'hypothesis': 'text',
+    'impact': 'small',
+    'confidence': 'small',
+    'ease': 'small',
+    'iceScore': 'score',
+    'funnelStage': 'category',
+    'northStarMetric': 'category',
+    'linkedStrategyId': 'category',
+    'startDate': 'category',
+    'endDate': 'category',
+    'testUrl': 'text',
+    'keyLearnings': 'text',
+    'visualProof': 'list',
+    'observation': 'text',
+    'problem': 'text',
+    'source': 'category',
+    'labels': 'labels',
+    'successCriteria': 'text',
+    'targetMetric': 'category',
+}
+
+TYPECODES = {'small': 'B', 'score': 'H'}
+
+INDEXED = ('status', 'funnelStage', 'linkedStrategyId', 'ownerName')
+
+# Status groupings used by the App.tsx views
+EXPLORE_STATUSES = ('Idea', 'Prioritized', 'Live Testing', 'Analysis')
+BOARD_COLUMNS = ('Prioritized', 'Building', 'Live Testing', 'Analysis')
+FINISHED_STATUSES = ('Finished - Winner', 'Finished - Loser', 'Finished - Inconclusive')
+
+
+class Categorical:
+    """Dictionary encoding: each distinct value is stored once, rows hold its code.
+
+    Code 0 is reserved for a missing value (None).
+    """
+
+    def __init__(self):
+        self.values = [None]
+        self.codes = {None: 0}
+
+    def encode(self, value):
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def decode(self, code):
+        return self.values[code]
+
+    def __len__(self):
+        return len(self.values) - 1
+
+
+class LabelSets(Categorical):
+    """Categorical over label tuples, with the label strings themselves interned."""
+
+    def encode(self, labels):
+        if not labels:
+            return 0
+        return super().encode(tuple(sys.intern(label) for label in labels))
+
+
+class HashIndex:
+    """Categorical code -> set of live rows, for one indexed field."""
+
+    def __init__(self):
+        self.rows = {}
+
+    def add(self, code, row):
+        self.rows.setdefault(code, set()).add(row)
+
+    def discard(self, code, row):
+        rows = self.rows.get(code)
+        if rows is not None:
+            rows.discard(row)
+            if not rows:
+                del self.rows[code]
+
+    def lookup(self, codes):
+        found = [self.rows[code] for code in codes if code in self.rows]
+        if len(found) == 1:
+            return found[0]
+        return set().union(*found)
+
+
+def flatten(experiment):
+    """Experiment dict -> {field: value} keyed like FIELDS."""
+    owner = experiment.get('owner') or {}
+    row = {name: experiment.get(name) for name in FIELDS}
+    row['ownerName'] = owner.get('name') or ''
+    row['ownerAvatar'] = owner.get('avatar') or ''
+    for name, default in NUMBER_DEFAULTS.items():
+        row[name] = row[name] or default
+    return row
+
+
+def db_row_to_experiment(row):
+    """Python port of dbRowToExperiment in ProjectContext.tsx."""
+    return {
+        'id': row['id'],
+        'title': row['title'],
+        'status': row['status'],
+        'owner': {'name': row.get('owner_name') or '', 'avatar': row.get('owner_avatar') or ''},
+        'hypothesis': row.get('hypothesis') or '',
+        'observation': row.get('observation') or None,
+        'problem': row.get('problem') or None,
+        'source': row.get('source') or None,
+        'labels': row.get('labels') or None,
+        'impact': row.get('impact') or 5,
+        'confidence': row.get('confidence') or 5,
+        'ease': row.get('ease') or 5,
+        'iceScore': row.get('ice_score') or 125,
+        'funnelStage': row.get('funnel_stage') or 'Acquisition',
+        'northStarMetric': row.get('north_star_metric') or '',
+        'linkedStrategyId': row.get('linked_strategy_id') or None,
+        'startDate': row.get('start_date') or None,
+        'endDate': row.get('end_date') or None,
+        'testUrl': row.get('test_url') or None,
+        'successCriteria': row.get('success_criteria') or None,
+        'targetMetric': row.get('target_metric') or None,
+        'keyLearnings': row.get('key_learnings') or None,
+        'visualProof': row.get('visual_proof') or None,
+    }
+
+
+class ExperimentView:
+    """Lazy read-only view of one row; attributes are the FIELDS names."""
+
+    __slots__ = ('store', 'row')
+
+    def __init__(self, store, row):
+        self.store = store
+        self.row = row
+
+    def __getattr__(self, name):
+        if name not in FIELDS:
+            raise AttributeError(name)
+        return self.store.value(self.row, name)
+
+    @property
+    def owner(self):
+        return {'name': self.ownerName, 'avatar': self.ownerAvatar}
+
+    def to_dict(self):
+        return self.store.to_dict(self.row)
+
+    def __repr__(self):
+        return f"<ExperimentView {self.id!r} {self.title!r}>"
+
+
+class ExperimentStore:
+    """Column-per-field storage for experiments, addressed by row number or id."""
+
+    def __init__(self, experiments=(), indexed=INDEXED):
+        self.columns = {}
+        self.tables = {}
+        for name, kind in FIELDS.items():
+            if kind in TYPECODES:
+                self.columns[name] = array(TYPECODES[kind])
+            elif kind in ('category', 'labels'):
+                self.tables[name] = LabelSets() if kind == 'labels' else Categorical()
+                self.columns[name] = array('I')
+            else:
+                self.columns[name] = []
+        self.indexes = {name: HashIndex() for name in indexed}
+        self.alive = bytearray()
+        self.rows = {}
+        self.extend(experiments)
+
+    @classmethod
+    def from_db_rows(cls, rows):
+        return cls(db_row_to_experiment(row) for row in rows)
+
+    @classmethod
+    def from_project_json(cls, path):
+        with open(path, 'r') as f:
+            data = json.load(f)
+        projects = data if isinstance(data, list) else [data]
+        return cls(exp for project in projects for exp in project.get('experiments') or [])
+
+    # -- Writes ---------------------------------------------------------------
+
+    def append(self, experiment):
+        """Add an Experiment dict; returns its row number."""
+        row = len(self.alive)
+        if experiment['id'] in self.rows:
+            raise KeyError(f"Duplicate experiment id {experiment['id']!r}")
+        for name, value in flatten(experiment).items():
+            self.columns[name].append(self.encode(name, value))
+        for name, index in self.indexes.items():
+            index.add(self.columns[name][row], row)
+        self.alive.append(1)
+        self.rows[experiment['id']] = row
+        return row
+
+    def extend(self, experiments):
+        for experiment in experiments:
+            self.append(experiment)
+
+    def update(self, exp_id, **fields):
+        """Overwrite fields of one experiment (FIELDS names, owner as ownerName/ownerAvatar)."""
+        row = self.rows[exp_id]
+        for name, value in fields.items():
+            if name == 'id':
+                raise KeyError("Experiment ids cannot be changed")
+            code = self.encode(name, value)
+            index = self.indexes.get(name)
+            if index is not None:
+                index.discard(self.columns[name][row], row)
+                index.add(code, row)
+            self.columns[name][row] = code
+        return row
+
+    def remove(self, exp_id):
+        """Tombstone a row; its slot stays so other row numbers remain valid."""
+        row = self.rows.pop(exp_id)
+        self.alive[row] = 0
+        for name, index in self.indexes.items():
+            index.discard(self.columns[name][row], row)
+        return row
+
+    def encode(self, name, value):
+        table = self.tables.get(name)
+        if table is not None:
+            return table.encode(value)
+        if FIELDS[name] == 'list' and value is not None:
+            return tuple(value)
+        return value
+
+    # -- Reads ----------------------------------------------------------------
+
+    def value(self, row, name):
+        stored = self.columns[name][row]
+        table = self.tables.get(name)
+        return table.decode(stored) if table is not None else stored
+
+    def column(self, name):
+        """Decoded values of one field for every live row."""
+        table = self.tables.get(name)
+        values = self.columns[name]
+        for row in self.live_rows():
+            yield table.decode(values[row]) if table is not None else values[row]
+
+    def live_rows(self):
+        alive = self.alive
+        return (row for row in range(len(alive)) if alive[row])
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __contains__(self, exp_id):
+        return exp_id in self.rows
+
+    def __iter__(self):
+        return (ExperimentView(self, row) for row in self.live_rows())
+
+    def __getitem__(self, exp_id):
+        return ExperimentView(self, self.rows[exp_id])
+
+    def get(self, exp_id, default=None):
+        row = self.rows.get(exp_id)
+        return default if row is None else ExperimentView(self, row)
+
+    # -- Indexed queries ------------------------------------------------------
+
+    def rows_where(self, **criteria):
+        """Sorted live rows matching every criterion.
+
+        Each value is a single value or a list/tuple/set of accepted values.
+        Indexed fields are answered from their index (smallest set first);
+        any other field filters the candidates found so far.
+        """
+        found = []
+        scans = {}
+        for name, wanted in criteria.items():
+            values = wanted if isinstance(wanted, (list, tuple, set, frozenset)) else (wanted,)
+            index = self.indexes.get(name)
+            if index is None:
+                scans[name] = set(values)
+                continue
+            codes = self.tables[name].codes
+            found.append(index.lookup(codes[value] for value in values if value in codes))
+
+        if found:
+            found.sort(key=len)
+            rows = found[0].intersection(*found[1:])
+        else:
+            rows = self.live_rows()
+        if scans:
+            rows = [row for row in rows
+                    if all(self.value(row, name) in values for name, values in scans.items())]
+        return sorted(rows)
+
+    def where(self, **criteria):
+        return [ExperimentView(self, row) for row in self.rows_where(**criteria)]
+
+    def count(self, **criteria):
+        if len(criteria) == 1:
+            (name, value), = criteria.items()
+            if name in self.indexes and not isinstance(value, (list, tuple, set, frozenset)):
+                code = self.tables[name].codes.get(value)
+                return len(self.indexes[name].rows.get(code, ()))
+        return len(self.rows_where(**criteria))
+
+    def group_by(self, name, values, **criteria):
+        """{value: [views]} for each of `values`, optionally narrowed by criteria."""
+        return {value: self.where(**{name: value}, **criteria) for value in values}
+
+    def board(self, search=''):
+        """Kanban columns: BOARD_COLUMNS -> experiments, like boardExperiments in App.tsx."""
+        return {status: matching(views, search)
+                for status, views in self.group_by('status', BOARD_COLUMNS).items()}
+
+    def explore(self, search=''):
+        """Explore table rows (exploreExperiments), best ICE first."""
+        views = matching(self.where(status=EXPLORE_STATUSES), search)
+        return sorted(views, key=lambda exp: exp.iceScore, reverse=True)
+
+    def archive(self, result='All', stage='All', search=''):
+        """Learning library (libraryExperiments), most recently finished first."""
+        statuses = {'Winners': 'Finished - Winner', 'Losers': 'Finished - Loser'}.get(result, FINISHED_STATUSES)
+        criteria = {'status': statuses}
+        if stage != 'All':
+            criteria['funnelStage'] = stage
+        views = matching(self.where(**criteria), search, 'keyLearnings')
+        return sorted(views, key=lambda exp: exp.endDate or '', reverse=True)
+
+    def by_strategy(self, strategy_ids):
+        """Roadmap lookup: strategy id -> linked experiments."""
+        return self.group_by('linkedStrategyId', strategy_ids)
+
+    def to_dict(self, row):
+        """Rebuild the src/types.ts Experiment for a row, omitting unset optionals."""
+        experiment = {}
+        for name in FIELDS:
+            value = self.value(row, name)
+            if isinstance(value, tuple):
+                value = list(value)
+            if value is not None:
+                experiment[name] = value
+        experiment['owner'] = {'name': experiment.pop('ownerName'), 'avatar': experiment.pop('ownerAvatar')}
+        return experiment
+
+    def to_dicts(self):
+        return [self.to_dict(row) for row in self.live_rows()]
+
+
+def matching(views, search, *extra_fields):
+    """Case-insensitive title (or extra field) search, as in the App.tsx filters."""
+    if not search:
+        return views
+    needle = search.lower()
+    fields = ('title',) + extra_fields
+    return [view for view in views
+            if any(needle in (getattr(view, name) or '').lower() for name in fields)]
+
+
+# -- Memory comparison ---------------------------------------------------------
+
+STATUSES = ('Idea', 'Prioritized', 'Building', 'Live Testing', 'Analysis',
+            'Finished - Winner', 'Finished - Loser', 'Finished - Inconclusive')
+FUNNEL_STAGES = ('Acquisition', 'Activation', 'Retention', 'Referral', 'Revenue')
+LABELS = ('Pricing', 'Onboarding', 'Web', 'Mobile', 'Email', 'SEO', 'Paid', 'UX')
+
+
+def synthetic_experiments(n, seed=0):
+    rng = random.Random(seed)
+    owners = [(f"Owner {i}", f"https://i.pravatar.cc/150?u={i}") for i in range(40)]
+    strategies = [f"strategy-{i}" for i in range(60)]
+    for i in range(n):
+        impact, confidence, ease = (rng.randint(1, 10) for _ in range(3))
+        name, avatar = rng.choice(owners)
+        yield {
+            'id': f"exp-{i}",
+            'title': f"Experiment {i}",
+            'status': rng.choice(STATUSES),
+            'owner': {'name': name, 'avatar': avatar},
+            'hypothesis': f"If we change variant {i} then conversion improves",
+            'impact': impact, 'confidence': confidence, 'ease': ease,
+            'iceScore': impact * confidence * ease,
+            'funnelStage': rng.choice(FUNNEL_STAGES),
+            'northStarMetric': 'Monthly Revenue',
+            'linkedStrategyId': rng.choice(strategies),
+            'labels': sorted(rng.sample(LABELS, rng.randint(0, 3))) or None,
+            'startDate': f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+        }
+
+
+def traced(build):
+    tracemalloc.start()
+    try:
+        started = time.perf_counter()
+        result = build()
+        elapsed = time.perf_counter() - started
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, size, elapsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare ExperimentStore memory against a list of dicts.")
+    parser.add_argument('source', nargs='?', help="Project JSON (one Project or a list)")
+    parser.add_argument('--synthetic', type=int, default=50000, help="Random experiments when no file is given")
+    args = parser.parse_args(argv)
+
+    if args.source:
+        with open(args.source, 'r') as f:
+            data = json.load(f)
+        projects = data if isinstance(data, list) else [data]
+        experiments = lambda: (exp for project in projects for exp in project.get('experiments') or [])
+    else:
+        experiments = lambda: synthetic_experiments(args.synthetic)
+
+    dicts, dict_bytes, dict_time = traced(lambda: [json.loads(json.dumps(exp)) for exp in experiments()])
+    del dicts
+    store, store_bytes, store_time = traced(lambda: ExperimentStore(experiments()))
+
+    print(f"📦 {len(store)} experiments")
+    print(f"   list of dicts:   {dict_bytes / 2**20:8.1f} MiB  ({dict_time:.2f}s)")
+    print(f"   ExperimentStore: {store_bytes / 2**20:8.1f} MiB  ({store_time:.2f}s)")
+    if store_bytes:
+        print(f"   {dict_bytes / store_bytes:.1f}x smaller")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Codemod: hoist constant inline style objects out of render.
+
+Every `style={{ ... }}` literal allocates a new object on each render of
+the element that carries it, which for Kanban cards and roadmap rows is
+every card on every board update. Styles whose values are all literals
+don't need that: this codemod moves them to module-level frozen constants
+
+    <div style={{ display: 'flex', gap: '8px' }}>
+    ->
+    const KANBAN_CARD_DIV_STYLE = Object.freeze<React.CSSProperties>({ display: 'flex', gap: '8px' });
+    <div style={KANBAN_CARD_DIV_STYLE}>
+
+identical literals share one constant. With --css, constant styles on
+elements without a className become generated classes in a stylesheet
+instead (note: inline styles beat every stylesheet rule, classes don't, so
+check the result against index.css). Styles that read variables are left
+in place and listed per property with the identifiers they depend on.
+
+    python hoist_styles.py                    # dry run over App.tsx and RoadmapView.tsx
+    python hoist_styles.py --write
+    python hoist_styles.py src/PortfolioView.tsx --write --css src/hoisted-styles.css
+
+Run it after the App_*/Roadmap_* fixers: they match the inline literals.
+"""
+import argparse
+import collections
+import os
+import re
+import sys
+
+from minimal_write import report, write_minimal
+from patch_engine import Patch, splice
+from tsx_index import TsxIndex
+
+DEFAULT_TARGETS = ('src/App.tsx', 'src/RoadmapView.tsx')
+LITERAL_IDENTS = {'true', 'false', 'null', 'undefined'}
+# CSS properties whose bare numbers carry no unit
+UNITLESS = {'opacity', 'zIndex', 'fontWeight', 'lineHeight', 'flex', 'flexGrow', 'flexShrink', 'order',
+            'zoom', 'gridRow', 'gridColumn', 'columnCount', 'aspectRatio'}
+Property = collections.namedtuple('Property', 'key value free')
+HEADER = "// Constant inline styles hoisted by hoist_styles.py: allocated once, not on every render"
+
+
+class StyleLiteral:
+    """One `style={{...}}` attribute value and what it depends on."""
+
+    def __init__(self, index, container, obj):
+        self.container = container      # the JSX `{...}` expression container
+        self.obj = obj                  # the object literal inside it
+        self.element = index.enclosing(container.start, kind='jsx')
+        self.text = index.text[obj.start:obj.end]
+        self.properties = properties(index, obj)
+
+    @property
+    def constant(self):
+        return all(not prop.free for prop in self.properties)
+
+    def key(self):
+        return re.sub(r'\s+', ' ', self.text)
+
+
+def snake(name):
+    return re.sub(r'(?<=[a-z0-9])(?=[A-Z])', '_', name).replace('.', '_').replace('-', '_').upper()
+
+
+def css_class(constant):
+    return constant.replace('_STYLE', '').lower().replace('_', '-')
+
+
+def kebab(name):
+    dashed = re.sub(r'(?=[A-Z])', '-', name).lower()
+    return '-' + dashed.lstrip('-') if re.match(r'(Webkit|Moz|ms)[A-Z]', name) else dashed
+
+
+def properties(index, obj):
+    """Property(key, value, free identifiers) for each top-level entry of an object literal."""
+    tokens, text = index.tokens, index.text
+    found, key, free, value_start = [], None, [], None
+
+    def close(end):
+        value = text[value_start:end].strip() if value_start is not None else key
+        found.append(Property(key, value, free))
+
+    for i in range(index.token_at(obj.start) + 1, len(tokens)):
+        token = tokens[i]
+        if token.start >= obj.inner_end:
+            break
+        if token.kind == 'comment':
+            continue
+        top = index.enclosing(token.start) is obj
+        if top and token.text == ',':
+            close(token.start)
+            key, free, value_start = None, [], None
+            continue
+        following = tokens[i + 1].text if i + 1 < len(tokens) else ''
+        if top and key is None:
+            key = token.text.strip('\'"')
+            if following != ':' and token.kind == 'ident':
+                free.append(token.text)      # shorthand `{ color }`
+            continue
+        if top and value_start is None and token.text == ':':
+            value_start = token.end
+            continue
+        if token.kind == 'ident' and token.text not in LITERAL_IDENTS:
+            previous = tokens[i - 1].text
+            if previous not in ('.', '?.') and not (following == ':' and previous in (',', '{')):
+                free.append(token.text)
+    if key is not None:
+        close(obj.inner_end)
+    return found
+
+
+def style_literals(index):
+    tokens = index.tokens
+    for i, token in enumerate(tokens[:-2]):
+        if token.kind != 'jsx-attr' or token.text != 'style' or tokens[i + 1].text != '{':
+            continue
+        container = index.by_start[tokens[i + 1].start]
+        obj = index.by_start.get(tokens[i + 2].start)
+        if tokens[i + 2].text != '{' or obj is None or obj.parent is not container:
+            continue
+        if index.text[container.inner_start:obj.start].strip() or index.text[obj.end:container.inner_end].strip():
+            continue                         # style={{...}.something} or similar
+        yield StyleLiteral(index, container, obj)
+
+
+def component_name(index, pos):
+    """Name of the top-level const/function declaration containing pos."""
+    outer = index.enclosing(pos)
+    if outer is None:
+        return 'Module'
+    while outer.parent is not None:
+        outer = outer.parent
+    tokens = index.tokens
+    i = index.token_at(outer.start)
+    for j in range(i - 1, max(i - 60, 0), -1):
+        if tokens[j].kind == 'ident' and tokens[j - 1].text in ('const', 'function', 'let'):
+            return tokens[j].text
+        if index.enclosing(tokens[j].start) is None and tokens[j].text == ';':
+            break
+    return 'Module'
+
+
+def insertion_point(index):
+    """Offset just after the last top-level import statement (0 without imports)."""
+    tokens = index.tokens
+    end = None
+    for i, token in enumerate(tokens):
+        if token.kind == 'ident' and token.text == 'import' and index.enclosing(token.start) is None:
+            semi = index.next_token(i, ';')
+            if semi is not None:
+                end = tokens[semi].end
+    if end is None:
+        return 0
+    newline = index.text.find('\n', end)
+    return len(index.text) if newline < 0 else newline + 1
+
+
+def has_attribute(index, element, name):
+    """True if the element's own opening tag sets `name`, before or after its style."""
+    tokens = index.tokens
+    for i in range(index.token_at(element.start), len(tokens)):
+        token = tokens[i]
+        if token.start >= element.inner_start:
+            break
+        if token.kind == 'jsx-attr' and token.text == name and index.enclosing(token.start) is element:
+            return True
+    return False
+
+
+def css_rule(class_name, literal):
+    lines = []
+    for prop in literal.properties:
+        value = prop.value
+        if value[:1] in '\'"':
+            value = value[1:-1]
+        elif prop.key not in UNITLESS and re.fullmatch(r'-?\d+(\.\d+)?', value) and value != '0':
+            value += 'px'
+        lines.append(f"  {kebab(prop.key)}: {value};")
+    return f".{class_name} {{\n" + '\n'.join(lines) + "\n}\n"
+
+
+def hoist(content, path, css_path=None):
+    """Returns (new content, hoisted count, dynamic literals, css rules)."""
+    index = TsxIndex(content)
+    literals = list(style_literals(index))
+    taken = set(index.identifiers)
+    names, declarations, rules, edits, dynamic = {}, [], [], [], []
+    uses_react = re.search(r'^import React\b', content, re.M) is not None
+    style_type = 'React.CSSProperties' if uses_react else 'CSSProperties'
+
+    for literal in literals:
+        if not literal.constant:
+            dynamic.append(literal)
+            continue
+        element = literal.element.name if literal.element is not None else 'element'
+        has_class = literal.element is not None and has_attribute(index, literal.element, 'className')
+
+        as_class = bool(css_path) and not has_class
+        key = (as_class, literal.key())
+        name = names.get(key)
+        if name is None:
+            base = f"{snake(component_name(index, literal.obj.start))}_{snake(element)}_STYLE"
+            name, n = base, 1
+            while name in taken:
+                n += 1
+                name = f"{base}_{n}"
+            taken.add(name)
+            names[key] = name
+            if as_class:
+                rules.append(css_rule(css_class(name), literal))
+            else:
+                declarations.append(f"const {name} = Object.freeze<{style_type}>({reindent(literal.text)});")
+
+        if as_class:
+            # Replace the whole `style={{...}}` attribute with a class
+            attr = index.tokens[index.token_at(literal.container.start) - 1]
+            replacement = f'className="{css_class(name)}"'
+            edits.append((attr.start, literal.container.end, Patch(content[attr.start:literal.container.end], replacement)))
+        else:
+            edits.append((literal.container.inner_start, literal.container.inner_end,
+                          Patch(literal.text, name)))
+
+    header = []
+    if rules:
+        relative = os.path.relpath(css_path, os.path.dirname(path)).replace(os.sep, '/')
+        header.append(f"import '{relative if relative.startswith('.') else './' + relative}';\n")
+    if declarations:
+        if not uses_react:
+            header.append("import type { CSSProperties } from 'react';\n")
+        header.append('\n' + HEADER + '\n' + '\n'.join(declarations) + '\n')
+    if header:
+        at = insertion_point(index)
+        edits.append((at, at, Patch('', ''.join(header), name='hoisted styles')))
+    edits.sort(key=lambda edit: (edit[0], edit[1]))
+    return splice(content, edits), len(literals) - len(dynamic), dynamic, rules
+
+
+def reindent(text):
+    """Move a multi-line literal from JSX depth to module level."""
+    lines = text.split('\n')
+    if len(lines) == 1:
+        return text
+    body = lines[1:-1]
+    depth = min((len(line) - len(line.lstrip()) for line in body if line.strip()), default=0)
+    return '\n'.join([lines[0]] + ['  ' + line[depth:] for line in body] + [lines[-1].strip()])
+
+
+def line_of(content, pos):
+    return content.count('\n', 0, pos) + 1
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Hoist constant inline style objects to module scope.")
+    parser.add_argument('paths', nargs='*', default=list(DEFAULT_TARGETS), help="TSX files to rewrite")
+    parser.add_argument('--write', action='store_true', help="Write the files (default: report only)")
+    parser.add_argument('--css', metavar='FILE', help="Emit generated classes into this stylesheet where possible")
+    parser.add_argument('--quiet', action='store_true', help="Don't list dynamic styles per property")
+    args = parser.parse_args(argv)
+
+    all_rules = []
+    for path in args.paths:
+        with open(path, 'r') as f:
+            content = f.read()
+        new, hoisted, dynamic, rules = hoist(content, path, args.css)
+        all_rules.extend(rules)
+        print(f"🎨 {path}: {hoisted} constant style literal(s) hoisted, {len(dynamic)} dynamic left in place")
+        if not args.quiet:
+            for literal in dynamic:
+                where = line_of(content, literal.obj.start)
+                for prop in literal.properties:
+                    if prop.free:
+                        print(f"   {path}:{where} {prop.key}: depends on {', '.join(dict.fromkeys(prop.free))}")
+        if args.write:
+            report(path, write_minimal(path, new))
+
+    if args.write and all_rules:
+        with open(args.css, 'a') as f:
+            f.write('\n' + '\n'.join(all_rules))
+        print(f"📝 {len(all_rules)} class(es) appended to {args.css}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Vectorized ICE scoring and re-ranking for whole portfolios.
+
+App.tsx recomputes `impact * confidence * ease` one experiment at a time
+and re-sorts the full table on every render. ScoreBoard keeps the inputs
+of every experiment as NumPy columns, so scores, ice-high/medium/low
+buckets and top-K rankings are computed for the whole backlog at once.
+
+    python ice_scoring.py portfolio.json --top 20
+    python ice_scoring.py portfolio.json --model rice --top 10
+    python ice_scoring.py --synthetic 100000 --model pie
+
+Models (all inputs are the 1-10 sliders the app already stores):
+
+* ice:  impact * confidence * ease (what the app and the DB store)
+* rice: reach * impact * confidence / effort, with confidence as a
+  fraction (confidence / 10) and effort read as the inverse of ease
+  (11 - ease). Reach defaults to 1 when the data has none.
+* pie:  (potential + importance + ease) / 3, read as impact, confidence
+  and ease.
+
+Needs NumPy (pip install numpy).
+"""
+import argparse
+import json
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Same cut-offs as IceBadge.getICEColor in App.tsx
+ICE_THRESHOLDS = (250, 500)
+BUCKETS = ('ice-low', 'ice-medium', 'ice-high')
+
+
+def ice(board):
+    return board.impact * board.confidence * board.ease
+
+
+def rice(board):
+    effort = 11.0 - board.ease
+    return board.reach * board.impact * (board.confidence / 10.0) / effort
+
+
+def pie(board):
+    return (board.impact + board.confidence + board.ease) / 3.0
+
+
+MODELS = {'ice': ice, 'rice': rice, 'pie': pie}
+
+
+class ScoreBoard:
+    """Impact/confidence/ease (and optional reach) columns for a set of experiments."""
+
+    def __init__(self, ids, impact, confidence, ease, reach=None):
+        if np is None:
+            raise RuntimeError("ScoreBoard needs NumPy: pip install numpy")
+        self.ids = list(ids)
+        self.position = {exp_id: i for i, exp_id in enumerate(self.ids)}
+        self.impact = np.asarray(impact, dtype=np.int32)
+        self.confidence = np.asarray(confidence, dtype=np.int32)
+        self.ease = np.asarray(ease, dtype=np.int32)
+        self.reach = np.ones(len(self.ids), dtype=np.float64) if reach is None else np.asarray(reach, dtype=np.float64)
+        self.scores = {}
+
+    @classmethod
+    def from_experiments(cls, experiments):
+        """Build from Experiment dicts (src/types.ts field names)."""
+        experiments = list(experiments)
+        return cls(
+            [exp['id'] for exp in experiments],
+            [exp.get('impact') or 5 for exp in experiments],
+            [exp.get('confidence') or 5 for exp in experiments],
+            [exp.get('ease') or 5 for exp in experiments],
+            [exp.get('reach') or 1 for exp in experiments],
+        )
+
+    @classmethod
+    def random(cls, n, seed=0):
+        rng = np.random.default_rng(seed)
+        return cls([f"exp-{i}" for i in range(n)],
+                   *(rng.integers(1, 11, n) for _ in range(3)),
+                   reach=rng.integers(1, 1000, n))
+
+    def __len__(self):
+        return len(self.ids)
+
+    def score(self, model='ice'):
+        """Scores for every row under `model`, cached until the inputs change."""
+        if model not in self.scores:
+            self.scores[model] = MODELS[model](self)
+        return self.scores[model]
+
+    def update(self, exp_id, **fields):
+        """Change inputs of one experiment and patch cached scores in place."""
+        i = self.position[exp_id]
+        for name, value in fields.items():
+            getattr(self, name)[i] = value
+        for model, scores in self.scores.items():
+            scores[i] = MODELS[model](Row(self, i))
+
+    def buckets(self, model='ice', thresholds=None):
+        """Bucket index per row: 0 low, 1 medium, 2 high.
+
+        ICE uses the app's fixed 250/500 thresholds. Other models default
+        to the same share of the ICE range (percentile cut-offs taken from
+        this board's ICE distribution).
+        """
+        scores = self.score(model)
+        if thresholds is None:
+            if model == 'ice':
+                thresholds = ICE_THRESHOLDS
+            else:
+                shares = [float((self.score('ice') < t).mean()) * 100 for t in ICE_THRESHOLDS]
+                thresholds = np.percentile(scores, shares)
+        return np.searchsorted(np.asarray(thresholds), scores, side='right')
+
+    def bucket_counts(self, model='ice', thresholds=None):
+        counts = np.bincount(self.buckets(model, thresholds), minlength=len(BUCKETS))
+        return dict(zip(BUCKETS, counts.tolist()))
+
+    def top(self, k, model='ice', descending=True):
+        """Indices of the k best rows, ordered; O(n + k log k) via argpartition."""
+        scores = self.score(model)
+        keyed = -scores if descending else scores
+        k = min(k, len(scores))
+        if k == 0:
+            return np.empty(0, dtype=np.intp)
+        if k < len(scores):
+            # Everything tied with the k-th score is a candidate, so ties
+            # resolve by original order like the stable sort in App.tsx
+            kth = keyed[np.argpartition(keyed, k - 1)[k - 1]]
+            chosen = np.flatnonzero(keyed <= kth)
+        else:
+            chosen = np.arange(len(scores))
+        return chosen[np.lexsort((chosen, keyed[chosen]))][:k]
+
+    def ranking(self, k, model='ice', descending=True):
+        scores = self.score(model)
+        return [(self.ids[i], float(scores[i])) for i in self.top(k, model, descending)]
+
+
+class Row:
+    """Scalar view of one row, so MODELS can score a single experiment."""
+
+    def __init__(self, board, i):
+        self.impact = board.impact[i]
+        self.confidence = board.confidence[i]
+        self.ease = board.ease[i]
+        self.reach = board.reach[i]
+
+
+def load_experiments(path):
+    with open(path, 'r') as f:
+        data = json.load(f)
+    projects = data if isinstance(data, list) else [data]
+    return [exp for project in projects for exp in project.get('experiments') or []]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score and rank a whole backlog with NumPy.")
+    parser.add_argument('source', nargs='?', help="Project JSON (one Project or a list)")
+    parser.add_argument('--synthetic', type=int, help="Score N random experiments instead of a file")
+    parser.add_argument('--model', choices=sorted(MODELS), default='ice')
+    parser.add_argument('--top', type=int, default=10, help="How many experiments to list")
+    args = parser.parse_args(argv)
+
+    if np is None:
+        print("❌ NumPy is not installed: pip install numpy")
+        return 1
+    if args.synthetic:
+        board = ScoreBoard.random(args.synthetic)
+    elif args.source:
+        board = ScoreBoard.from_experiments(load_experiments(args.source))
+    else:
+        parser.error("Pass a Project JSON file or --synthetic N")
+
+    started = time.perf_counter()
+    board.score(args.model)
+    counts = board.bucket_counts(args.model)
+    ranking = board.ranking(args.top, args.model)
+    elapsed = time.perf_counter() - started
+
+    print(f"📊 {len(board)} experiments scored with {args.model.upper()} in {elapsed * 1000:.1f} ms")
+    print("   " + ', '.join(f"{name}: {count}" for name, count in counts.items()))
+    for place, (exp_id, score) in enumerate(ranking, 1):
+        print(f"   {place:>3}. {exp_id:<40} {score:10.1f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Bulk project importer: the server-side counterpart of ProjectContext.createProject.
+
+createProject inserts the project through an RPC, then objectives,
+strategies and experiments as dependent round-trips, and rebuilds the
+old -> new ID maps by array-index alignment. This tool instead takes a
+Project JSON (the shape of src/types.ts), assigns every row its UUID up
+front so the whole object graph resolves locally, and streams each table
+into Postgres with one COPY, sent in large batches, inside a single
+transaction.
+
+    python import_project.py portfolio.json --dsn postgresql://localhost/growth --owner <user uuid>
+    python import_project.py portfolio.json --emit-sql import.sql     # for psql -f, no driver needed
+    python import_project.py portfolio.json --dry-run
+
+The JSON file may hold one Project or a list of them. Loading into a
+database needs psycopg 3 (pip install "psycopg[binary]").
+
+The repo carries two experiment table layouts. supabase/migration.sql
+(the default, and what pg_harness.py loads) stores ice_score as a plain
+column and visual_proof as text[]; supabase-schema.sql computes ice_score
+(GENERATED ALWAYS) and stores visual_proof as JSONB. With --dsn the
+layout is read from information_schema; for --emit-sql pick it with
+--schema. Generated columns are left out of the COPY column list.
+"""
+import argparse
+import collections
+import json
+import sys
+import time
+import uuid
+
+try:
+    import psycopg
+except ImportError:
+    psycopg = None
+
+BATCH_ROWS = 5000
+
+PROJECT_COLUMNS = ('id', 'name', 'logo', 'industry', 'nsm_name', 'nsm_value', 'nsm_target',
+                   'nsm_unit', 'nsm_type')
+MEMBER_COLUMNS = ('project_id', 'user_id', 'role')
+OBJECTIVE_COLUMNS = ('id', 'project_id', 'title', 'description', 'status', 'progress')
+STRATEGY_COLUMNS = ('id', 'project_id', 'objective_id', 'title', 'target_metric')
+EXPERIMENT_COLUMNS = (
+    'id', 'project_id', 'title', 'status', 'owner_name', 'owner_avatar', 'hypothesis',
+    'observation', 'problem', 'source', 'labels', 'impact', 'confidence', 'ease', 'ice_score',
+    'funnel_stage', 'north_star_metric', 'linked_strategy_id', 'start_date', 'end_date',
+    'test_url', 'success_criteria', 'target_metric', 'key_learnings', 'visual_proof',
+)
+
+
+# Columns COPY must skip (GENERATED ALWAYS) and columns stored as json/jsonb
+Schema = collections.namedtuple('Schema', 'generated json')
+
+SCHEMAS = {
+    'migration': Schema(generated=frozenset(), json=frozenset()),
+    'schema': Schema(generated=frozenset({('experiments', 'ice_score')}),
+                     json=frozenset({('experiments', 'visual_proof')})),
+}
+DEFAULT_SCHEMA = 'migration'
+
+COLUMNS_QUERY = """
+    SELECT table_name, column_name, is_generated, data_type
+    FROM information_schema.columns
+    WHERE table_schema = 'public' AND table_name = ANY(%s)
+"""
+
+
+def schema_from_columns(columns):
+    """Schema from (table, column, is_generated, data_type) rows of information_schema.columns."""
+    generated, json_columns = set(), set()
+    for table, column, is_generated, data_type in columns:
+        if is_generated == 'ALWAYS':
+            generated.add((table, column))
+        if data_type in ('json', 'jsonb'):
+            json_columns.add((table, column))
+    return Schema(frozenset(generated), frozenset(json_columns))
+
+
+def detect_schema(conn):
+    tables = ['projects', 'project_members', 'objectives', 'strategies', 'experiments']
+    with conn.cursor() as cur:
+        cur.execute(COLUMNS_QUERY, (tables,))
+        return schema_from_columns(cur.fetchall())
+
+
+class ProjectGraph:
+    """All rows of one Project, with UUIDs assigned client-side."""
+
+    def __init__(self, project, owner_id=None):
+        metadata = project['metadata']
+        north_star = project.get('northStar') or {}
+        self.project_id = str(uuid.uuid4())
+        self.name = metadata['name']
+
+        self.projects = [(
+            self.project_id, metadata['name'], metadata.get('logo'), metadata.get('industry'),
+            north_star.get('name'), north_star.get('currentValue', 0), north_star.get('targetValue', 0),
+            north_star.get('unit', '$'), north_star.get('type', 'currency'),
+        )]
+        self.members = [(self.project_id, owner_id, 'admin')] if owner_id else []
+
+        # Old IDs are resolved by key, not by the order rows come back in
+        self.objective_ids = {obj['id']: str(uuid.uuid4()) for obj in project.get('objectives') or []}
+        self.objectives = [
+            (self.objective_ids[obj['id']], self.project_id, obj['title'], obj.get('description'),
+             obj.get('status') or 'Active', obj.get('progress') or 0)
+            for obj in project.get('objectives') or []
+        ]
+
+        self.strategy_ids = {}
+        self.strategies = []
+        for strategy in project.get('strategies') or []:
+            parent = self.objective_ids.get(strategy.get('parentObjectiveId'))
+            if parent is None:
+                continue  # same rule as createProject: only insert if the parent exists
+            new_id = self.strategy_ids[strategy['id']] = str(uuid.uuid4())
+            self.strategies.append((new_id, self.project_id, parent, strategy['title'],
+                                    strategy.get('targetMetric')))
+
+        self.experiments = [self.experiment_row(exp) for exp in project.get('experiments') or []]
+
+    def experiment_row(self, exp):
+        owner = exp.get('owner') or {}
+        return (
+            str(uuid.uuid4()), self.project_id, exp['title'], exp.get('status') or 'Idea',
+            owner.get('name') or '', owner.get('avatar') or '', exp.get('hypothesis') or '',
+            exp.get('observation'), exp.get('problem'), exp.get('source'), exp.get('labels'),
+            exp.get('impact') or 5, exp.get('confidence') or 5, exp.get('ease') or 5,
+            exp.get('iceScore') or 125, exp.get('funnelStage') or 'Acquisition',
+            exp.get('northStarMetric'), self.strategy_ids.get(exp.get('linkedStrategyId')),
+            exp.get('startDate'), exp.get('endDate'), exp.get('testUrl'), exp.get('successCriteria'),
+            exp.get('targetMetric'), exp.get('keyLearnings'), exp.get('visualProof'),
+        )
+
+    def tables(self, schema=SCHEMAS[DEFAULT_SCHEMA]):
+        """(table, columns, rows) in foreign-key order, laid out for the target schema."""
+        return [layout(table, columns, rows, schema) for table, columns, rows in (
+            ('projects', PROJECT_COLUMNS, self.projects),
+            ('project_members', MEMBER_COLUMNS, self.members),
+            ('objectives', OBJECTIVE_COLUMNS, self.objectives),
+            ('strategies', STRATEGY_COLUMNS, self.strategies),
+            ('experiments', EXPERIMENT_COLUMNS, self.experiments),
+        )]
+
+
+def layout(table, columns, rows, schema):
+    """Drop generated columns and JSON-encode json/jsonb ones."""
+    keep = [i for i, column in enumerate(columns) if (table, column) not in schema.generated]
+    as_json = {i for i, column in enumerate(columns) if (table, column) in schema.json}
+    if len(keep) == len(columns) and not as_json:
+        return table, columns, rows
+    rows = [tuple(JsonValue(row[i]) if i in as_json and row[i] is not None else row[i] for i in keep)
+            for row in rows]
+    return table, tuple(columns[i] for i in keep), rows
+
+
+# -- COPY text format ---------------------------------------------------------
+
+COPY_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+
+
+def array_literal(values):
+    items = []
+    for value in values:
+        if value is None:
+            items.append('NULL')
+        else:
+            items.append('"' + str(value).replace('\\', '\\\\').replace('"', '\\"') + '"')
+    return '{' + ','.join(items) + '}'
+
+
+class JsonValue:
+    """A value COPY should write as JSON text (json/jsonb columns)."""
+
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __repr__(self):
+        return f"JsonValue({self.value!r})"
+
+
+def copy_field(value):
+    if value is None:
+        return '\\N'
+    if isinstance(value, JsonValue):
+        return json.dumps(value.value, ensure_ascii=False).translate(COPY_ESCAPES)
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    if isinstance(value, (list, tuple)):
+        value = array_literal(value)
+    return str(value).translate(COPY_ESCAPES)
+
+
+def copy_batches(rows, batch_rows=BATCH_ROWS):
+    """Yield COPY text-format chunks of up to batch_rows rows each."""
+    batch = []
+    for row in rows:
+        batch.append('\t'.join(copy_field(value) for value in row) + '\n')
+        if len(batch) >= batch_rows:
+            yield ''.join(batch)
+            batch = []
+    if batch:
+        yield ''.join(batch)
+
+
+def copy_statement(table, columns):
+    return f"COPY public.{table} ({', '.join(columns)}) FROM STDIN"
+
+
+# -- Sinks --------------------------------------------------------------------
+
+def load(conn, graphs, batch_rows=BATCH_ROWS, schema=None):
+    """Stream every graph into Postgres in one transaction (schema read from the database by default)."""
+    schema = schema or detect_schema(conn)
+    with conn.transaction():
+        with conn.cursor() as cur:
+            for graph in graphs:
+                for table, columns, rows in graph.tables(schema):
+                    if not rows:
+                        continue
+                    with cur.copy(copy_statement(table, columns)) as copy:
+                        for chunk in copy_batches(rows, batch_rows):
+                            copy.write(chunk)
+
+
+def emit_sql(f, graphs, batch_rows=BATCH_ROWS, schema=SCHEMAS[DEFAULT_SCHEMA]):
+    """Write a psql script with one COPY block per table."""
+    f.write("BEGIN;\n")
+    for graph in graphs:
+        f.write(f"\n-- {graph.name} ({graph.project_id})\n")
+        for table, columns, rows in graph.tables(schema):
+            if not rows:
+                continue
+            f.write(copy_statement(table, columns) + ";\n")
+            for chunk in copy_batches(rows, batch_rows):
+                f.write(chunk)
+            f.write("\\.\n")
+    f.write("\nCOMMIT;\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk-load Project JSON into Postgres with COPY.")
+    parser.add_argument('source', help="JSON file with a Project or a list of Projects")
+    parser.add_argument('--dsn', help="Postgres connection string")
+    parser.add_argument('--owner', help="auth.users id to add as project admin")
+    parser.add_argument('--emit-sql', metavar='FILE', help="Write a psql COPY script instead of connecting")
+    parser.add_argument('--batch-rows', type=int, default=BATCH_ROWS, help="Rows per COPY write")
+    parser.add_argument('--schema', choices=sorted(SCHEMAS),
+                        help="Table layout for --emit-sql: 'migration' (supabase/migration.sql, default) or "
+                             "'schema' (supabase-schema.sql); --dsn reads it from the database")
+    parser.add_argument('--dry-run', action='store_true', help="Only report what would be loaded")
+    args = parser.parse_args(argv)
+
+    with open(args.source, 'r') as f:
+        data = json.load(f)
+    projects = data if isinstance(data, list) else [data]
+
+    started = time.perf_counter()
+    graphs = [ProjectGraph(project, args.owner) for project in projects]
+    for graph in graphs:
+        counts = ', '.join(f"{len(rows)} {table}" for table, _, rows in graph.tables()[2:])
+        print(f"📦 {graph.name}: {counts}")
+
+    if args.dry_run:
+        return 0
+    if args.emit_sql:
+        with open(args.emit_sql, 'w') as f:
+            emit_sql(f, graphs, args.batch_rows, SCHEMAS[args.schema or DEFAULT_SCHEMA])
+        print(f"📝 Wrote {args.emit_sql}")
+    elif args.dsn:
+        if psycopg is None:
+            print("❌ psycopg is not installed: pip install \"psycopg[binary]\" (or use --emit-sql)")
+            return 1
+        with psycopg.connect(args.dsn) as conn:
+            load(conn, graphs, args.batch_rows, SCHEMAS[args.schema] if args.schema else None)
+        print(f"✅ Loaded {len(graphs)} project(s) in {time.perf_counter() - started:.2f}s")
+    else:
+        parser.error("Pass --dsn, --emit-sql or --dry-run")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
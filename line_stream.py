@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Streaming, line-oriented rewrite passes (App_cleanup_logs.py style).
+
+Strip-style passes don't need the whole file in memory. Each transform is
+a generator that takes an iterable of lines and yields lines; rewrite()
+chains them so every transform runs in the same single pass, reading the
+file line by line and writing to a temp file that is atomically renamed
+over the original. Memory stays constant in the file size, and the file
+is left untouched when no line changed.
+
+    from line_stream import rewrite, dedupe_lines, strip_debug_logs
+    rewrite('src/App.tsx', strip_debug_logs(), dedupe_lines(markers), opener=open)
+
+    python line_stream.py 'src/**/*.tsx' --strip-debug --strip-emoji --drop-render-log
+
+Transforms only see one line at a time, so a console.log call spread over
+several lines is left alone.
+"""
+import argparse
+import builtins
+import glob
+import hashlib
+import os
+import re
+import shutil
+import sys
+import tempfile
+
+CONSOLE_CALL = re.compile(r'^\s*console\.(?:log|debug|info)\(')
+STATEMENT_END = re.compile(r'\s*;?\s*$')
+EMOJI_PREFIX = re.compile(
+    r'''(console\.\w+\(\s*['"`])[\u2190-\u21ff\u2300-\u27bf\u2b00-\u2bff\U0001f000-\U0001faff\ufe0f\u200d]+\s*''')
+# With its `if (...)` guard, if any: removing only the call would hand the
+# guard the next statement as its body
+RENDER_LOG = re.compile(
+    r'''\s*(?:if\s*\((?:[^()]|\([^()]*\))*\)\s*)?console\.log\(\s*["']App rendering["']\s*\);?''')
+
+
+# -- Transforms --------------------------------------------------------------
+
+def dedupe_lines(markers):
+    """Drop every line containing a marker after the first such line."""
+    def transform(lines):
+        seen = set()
+        for line in lines:
+            hit = next((marker for marker in markers if marker in line), None)
+            if hit is not None:
+                if hit in seen:
+                    continue
+                seen.add(hit)
+            yield line
+    return transform
+
+
+def call_end(line, start):
+    """Offset just past the paren closing the one before `start`, or None if it is not on this line."""
+    depth = 1
+    i = start
+    while i < len(line):
+        char = line[i]
+        if char in '\'"`':
+            # Skip the literal; parens inside strings don't count
+            i += 1
+            while i < len(line) and line[i] != char:
+                i += 2 if line[i] == '\\' else 1
+            if i >= len(line):
+                return None
+        elif char in '([{':
+            depth += 1
+        elif char in ')]}':
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return None
+
+
+def is_console_statement(line):
+    """True if the line is one console.log/debug/info call and nothing else.
+
+    `console.log(x); doThing();` and `console.log(a), b();` are not: the
+    call's own closing paren has to end the statement.
+    """
+    match = CONSOLE_CALL.match(line)
+    if match is None:
+        return False
+    end = call_end(line, match.end())
+    return end is not None and STATEMENT_END.match(line, end) is not None
+
+
+def strip_debug_logs():
+    """Drop lines that consist of a single console.log/debug/info call."""
+    def transform(lines):
+        for line in lines:
+            if not is_console_statement(line):
+                yield line
+    return transform
+
+
+def strip_emoji_prefixes():
+    """console.log('📦 Supabase response:', ...) -> console.log('Supabase response:', ...)"""
+    def transform(lines):
+        for line in lines:
+            yield EMOJI_PREFIX.sub(r'\1', line)
+    return transform
+
+
+def remove_pattern(pattern):
+    """Delete every match of a regex from each line, dropping lines left blank."""
+    regex = re.compile(pattern)
+
+    def transform(lines):
+        for line in lines:
+            stripped = regex.sub('', line)
+            if stripped == line or stripped.strip():
+                yield stripped
+    return transform
+
+
+def drop_render_log():
+    """Remove console.log("App rendering"), and any if (...) guarding it, wherever it sits on a line."""
+    return remove_pattern(RENDER_LOG)
+
+
+# -- Pipeline ----------------------------------------------------------------
+
+def pipeline(lines, transforms):
+    for transform in transforms:
+        lines = transform(lines)
+    return lines
+
+
+def hashed(lines, digest):
+    for line in lines:
+        digest.update(line.encode('utf-8'))
+        yield line
+
+
+def rewrite(path, *transforms, opener=builtins.open):
+    """Run the fused transforms over path in one pass; True if the file changed.
+
+    With the builtin open the file is streamed to a temp file and renamed
+    into place. Any other opener (patch_runner's in-memory cache) is used
+    for both reading and writing instead.
+    """
+    before, after = hashlib.sha256(), hashlib.sha256()
+
+    if opener is not builtins.open:
+        with opener(path, 'r', encoding='utf-8') as f:
+            lines = list(pipeline(hashed(f, before), transforms))
+        changed = hashlib.sha256(''.join(lines).encode('utf-8')).digest() != before.digest()
+        if changed:
+            with opener(path, 'w', encoding='utf-8') as f:
+                f.writelines(lines)
+        return changed
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix='.stream-', dir=directory)
+    try:
+        with open(path, 'r', encoding='utf-8', newline='') as src, \
+                os.fdopen(fd, 'w', encoding='utf-8', newline='') as dst:
+            for line in hashed(pipeline(hashed(src, before), transforms), after):
+                dst.write(line)
+        if before.digest() == after.digest():
+            os.unlink(tmp_path)
+            return False
+        shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+        return True
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Streaming strip passes over TS/TSX files.")
+    parser.add_argument('patterns', nargs='+', help="Files or globs, e.g. 'src/**/*.tsx'")
+    parser.add_argument('--strip-debug', action='store_true', help="Drop single-line console.log/debug/info calls")
+    parser.add_argument('--strip-emoji', action='store_true', help="Strip emoji prefixes from log messages")
+    parser.add_argument('--drop-render-log', action='store_true', help='Remove console.log("App rendering")')
+    parser.add_argument('--dedupe', action='append', default=[], help="Keep only the first line containing this text")
+    args = parser.parse_args(argv)
+
+    transforms = []
+    if args.drop_render_log:
+        transforms.append(drop_render_log())
+    if args.strip_debug:
+        transforms.append(strip_debug_logs())
+    if args.strip_emoji:
+        transforms.append(strip_emoji_prefixes())
+    if args.dedupe:
+        transforms.append(dedupe_lines(args.dedupe))
+    if not transforms:
+        parser.error("No transform selected")
+
+    paths = sorted({path for pattern in args.patterns for path in glob.glob(pattern, recursive=True)})
+    changed = [path for path in paths if rewrite(path, *transforms)]
+    for path in changed:
+        print(f"✂️  {path}")
+    print(f"{len(changed)} of {len(paths)} file(s) changed")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+Audit console logging by how often it runs, and guard the hot sites.
+
+Every console.* call under src/ is classified by the code path it sits on:
+
+    render    top level of a component or hook body, or a useMemo callback
+    realtime  a .on()/onAuthStateChange/subscribe callback, or a function
+              one of those calls (fetchExperiments runs on every
+              postgres_changes event, not just on mount)
+    effect    a useEffect/useLayoutEffect callback
+    handler   anything else inside a function: user actions, async flows
+    module    module top level, runs once
+
+A named function is as hot as the hottest place that calls it or passes it
+along. Each site also gets a payload estimate from its arguments: text,
+scalar, row, or result set (`data` from an awaited supabase query without
+.single()). Devtools retain every logged object, so a result set logged
+per realtime event costs more than the query that fetched it.
+
+guard() puts the render and realtime console.log/info/debug calls behind
+the compile-time flag App.tsx already uses for its render log:
+
+    if (import.meta.env.DEV) console.log('📦 Supabase response:', { data, error });
+
+Vite replaces import.meta.env.DEV with false in production builds and the
+minifier drops the dead branch together with its arguments. warn/error
+calls are reported but never guarded. App_cleanup_logs.py runs guard()
+over App.tsx and the data hooks.
+
+    python log_audit.py                                  # ranked report for src/
+    python log_audit.py 'src/hooks/*.ts' --write
+    python log_audit.py --write --hot render,realtime,effect
+"""
+import argparse
+import builtins
+import collections
+import glob
+import re
+import sys
+
+from minimal_write import report, write_minimal
+from patch_engine import Patch, splice
+from tsx_index import TsxIndex
+
+DEFAULT_GLOB = 'src/**/*.ts*'
+GUARD = 'import.meta.env.DEV'
+FREQUENCIES = ('module', 'handler', 'effect', 'realtime', 'render')    # coldest to hottest
+PAYLOADS = ('text', 'scalar', 'row', 'result set')
+HOT = ('render', 'realtime')
+GUARDABLE = {'log', 'info', 'debug'}
+CALLBACK_FREQUENCY = {
+    'useEffect': 'effect', 'useLayoutEffect': 'effect',
+    'useMemo': 'render',
+    'on': 'realtime', 'onAuthStateChange': 'realtime', 'subscribe': 'realtime',
+}
+# Callbacks that run when (and as often as) the code around them does
+INLINE_CALLBACKS = {'map', 'forEach', 'filter', 'flatMap', 'reduce', 'some', 'every', 'find', 'sort',
+                    'then', 'catch', 'finally'}
+STATEMENT_BOUNDARY = {';', '{', '}', 'else'}
+# `const { data, error } = await supabase.from(...)...`
+QUERY_RESULT = re.compile(r'(?:const|let)\s*\{([^{}]*)\}\s*=\s*await\s+supabase([^;]*)')
+
+Function = collections.namedtuple('Function', 'start body_start body_end name callee')
+LogSite = collections.namedtuple('LogSite', 'path line method start frequency payload guarded text')
+
+
+class LogAudit:
+    """Log sites of one file, with the frequency of the code path each sits on."""
+
+    def __init__(self, path, content, flag=GUARD):
+        self.path = path
+        self.content = content
+        self.flag = flag
+        self.index = TsxIndex(content)
+        self.functions = list(self.find_functions())
+        self.hotness = {}
+
+    # -- functions -----------------------------------------------------------
+
+    def find_functions(self):
+        tokens, index = self.index.tokens, self.index
+        for i, token in enumerate(tokens):
+            if token.text == '=>':
+                first = self.arrow_start(i)
+                body = index.by_start.get(tokens[i + 1].start) if tokens[i + 1].text == '{' else None
+                if body is not None:
+                    yield self.function(first, body.start, body.end)
+                    continue
+                # Expression body: runs to the end of the enclosing brackets or the line
+                outer = index.enclosing(token.start)
+                if outer is not None:
+                    end = outer.inner_end
+                else:
+                    end = self.content.find('\n', token.end)
+                    end = len(self.content) if end < 0 else end
+                yield self.function(first, token.end, end)
+            elif token.kind == 'ident' and token.text == 'function':
+                j = i + 1
+                name = tokens[j].text if tokens[j].kind == 'ident' else None
+                while tokens[j].text != '(':
+                    j += 1
+                params = index.by_start[tokens[j].start]
+                body = None
+                for t in tokens[index.token_at(params.end - 1) + 1:]:
+                    if t.text == ';' and index.enclosing(t.start) is params.parent:
+                        break               # overload signature
+                    if t.text == '{' and t.start in index.by_start and index.by_start[t.start].parent is params.parent:
+                        body = index.by_start[t.start]
+                        break
+                if body is not None:
+                    yield Function(i, body.start, body.end, name, self.callee(i))
+
+    def arrow_start(self, arrow):
+        """Token index of the first token of the arrow function whose `=>` is at arrow."""
+        tokens, index = self.index.tokens, self.index
+        i = arrow - 1
+        if tokens[i].kind != 'ident':
+            # `(a, b) =>` or `(a): Type =>`: back to the parameter list
+            while tokens[i].text != ')':
+                i -= 1
+            i = index.token_at(index.enclosing(tokens[i].start).start)
+        if i and tokens[i - 1].text == 'async':
+            i -= 1
+        return i
+
+    def function(self, first, body_start, body_end):
+        tokens = self.index.tokens
+        name = None
+        if first >= 2 and tokens[first - 1].text == '=':
+            j = first - 2
+            while j > 0 and tokens[j - 1].text not in ('const', 'let', 'var', ';', '{', '}'):
+                j -= 1
+            if tokens[j].kind == 'ident' and tokens[j - 1].text in ('const', 'let', 'var'):
+                name = tokens[j].text
+        return Function(first, body_start, body_end, name, self.callee(first))
+
+    def callee(self, first):
+        """Name of the call a function literal is passed to, 'jsx' for an attribute value, else None."""
+        tokens, index = self.index.tokens, self.index
+        if not first:
+            return None
+        before = tokens[first - 1]
+        if before.text in ('(', ','):
+            args = index.enclosing(before.start)
+            if args is not None and args.kind == '(':
+                return tokens[index.token_at(args.start) - 1].text
+        if before.text == '{' and first >= 2 and tokens[first - 2].kind == 'jsx-attr':
+            return 'jsx'
+        return None
+
+    def function_at(self, pos):
+        """Innermost function whose body contains pos."""
+        inner = None
+        for function in self.functions:
+            if function.body_start <= pos < function.body_end:
+                if inner is None or function.body_start >= inner.body_start:
+                    inner = function
+        return inner
+
+    # -- frequency -----------------------------------------------------------
+
+    def frequency(self, pos, seen=()):
+        function = self.function_at(pos)
+        if function is None:
+            return 'module'
+        if function.callee in CALLBACK_FREQUENCY:
+            return CALLBACK_FREQUENCY[function.callee]
+        call_site = self.index.tokens[function.start].start
+        if function.callee in INLINE_CALLBACKS:
+            return self.frequency(call_site, seen)
+        name = function.name
+        if name is None and function.callee == 'useCallback':
+            name = self.declared_name(function.start)
+        if name is not None:
+            if self.function_at(call_site) is None and re.match(r'[A-Z]|use[A-Z]', name):
+                return 'render'
+            return self.callers(name, seen)
+        return 'handler'
+
+    def declared_name(self, first):
+        """`fetchProjects` for the callback of `const fetchProjects = useCallback(async () => ...`."""
+        tokens, index = self.index.tokens, self.index
+        call = index.token_at(index.enclosing(tokens[first].start).start) - 1
+        if tokens[call - 1].text == '=' and tokens[call - 3].text in ('const', 'let'):
+            return tokens[call - 2].text
+        return None
+
+    def callers(self, name, seen):
+        """Hottest frequency among the places a named function is called or passed."""
+        if name in seen:
+            return 'handler'
+        if name not in self.hotness:
+            tokens = self.index.tokens
+            hottest = 'handler'
+            for i in self.index.identifiers.get(name, ()):
+                if tokens[i - 1].text in ('const', 'let', 'function', '.', '?.'):
+                    continue
+                if tokens[i + 1].text == '(':
+                    found = self.frequency(tokens[i].start, seen + (name,))
+                else:
+                    found = self.passed(i)
+                if FREQUENCIES.index(found) > FREQUENCIES.index(hottest):
+                    hottest = found
+            self.hotness[name] = hottest
+        return self.hotness[name]
+
+    def passed(self, i):
+        """Frequency of a function passed by name, e.g. `.on('postgres_changes', filter, refetch)`."""
+        tokens, index = self.index.tokens, self.index
+        args = index.enclosing(tokens[i].start)
+        if args is not None and args.kind == '(' and tokens[i - 1].text in ('(', ','):
+            callee = tokens[index.token_at(args.start) - 1].text
+            return CALLBACK_FREQUENCY.get(callee, 'handler')
+        return 'handler'
+
+    # -- payload -------------------------------------------------------------
+
+    def payload(self, call):
+        """Largest logged argument: text, scalar, row or result set."""
+        tokens = self.index.tokens
+        largest, in_template = 'text', False
+        for i in range(self.index.token_at(call.start) + 1, len(tokens)):
+            token = tokens[i]
+            if token.start >= call.inner_end:
+                break
+            if token.kind == 'template':
+                # `a ${ ... } b` is split into template tokens around the substitutions
+                in_template = not token.text.endswith('`') or token.text == '`'
+                continue
+            if token.kind != 'ident' or tokens[i - 1].text in ('.', '?.') or tokens[i + 1].text == ':':
+                continue
+            size = 'scalar' if in_template else self.size(token.text, call.start, tokens[i + 1].text)
+            if PAYLOADS.index(size) > PAYLOADS.index(largest):
+                largest = size
+        return largest
+
+    def size(self, name, pos, following):
+        if following in ('.', '?.', '('):
+            return 'scalar'         # data?.length, err.message, Date.now()
+        function = self.function_at(pos)
+        scope = self.content[function.body_start if function else 0:pos]
+        for bindings, query in reversed(QUERY_RESULT.findall(scope)):
+            bound = dict(reversed(binding.split(':')) if ':' in binding else (binding, binding)
+                         for binding in (part.strip().replace(' ', '') for part in bindings.split(',')))
+            if bound.get(name) == 'data':
+                return 'row' if re.search(r'\.(maybeS|s)ingle\(\)', query) else 'result set'
+            if name in bound:
+                return 'row'        # error, count
+        declared = re.search(rf'\b{re.escape(name)}\??\s*:\s*([\w<>\[\]| ]+)', self.content)
+        if declared is None:
+            return 'scalar'
+        if '[]' in declared.group(1):
+            return 'result set'
+        return 'scalar' if declared.group(1).split()[0] in ('string', 'number', 'boolean') else 'row'
+
+    # -- sites ---------------------------------------------------------------
+
+    def sites(self):
+        tokens = self.index.tokens
+        for i in self.index.identifiers.get('console', ()):
+            if tokens[i + 1].text != '.' or tokens[i + 3].text != '(':
+                continue
+            call = self.index.by_start[tokens[i + 3].start]
+            yield LogSite(self.path, self.content.count('\n', 0, tokens[i].start) + 1, tokens[i + 2].text,
+                          tokens[i].start, self.frequency(tokens[i].start), self.payload(call),
+                          self.guarded(i), ' '.join(self.content[tokens[i].start:call.end].split()))
+
+    def guarded(self, i):
+        """'yes' behind an `if (self.flag)`, 'no' for a plain statement, 'expr' inside an expression."""
+        tokens = self.index.tokens
+        previous = tokens[i - 1]
+        if previous.text == ')':
+            condition = self.index.enclosing(previous.start)
+            keyword = tokens[self.index.token_at(condition.start) - 1].text
+            if keyword == 'if' and self.flag in self.content[condition.start:condition.end]:
+                return 'yes'
+            if keyword in ('if', 'for', 'while'):
+                # `if (a) console.log(x) else ...`: a nested if would capture the else
+                return 'expr' if self.followed_by_else(i) else 'no'
+        if previous.text in STATEMENT_BOUNDARY or previous.kind == 'comment':
+            return 'no'
+        if '\n' in self.content[previous.end:tokens[i].start] and previous.text not in \
+                ('=>', '(', ',', '?', ':', '&&', '||', '??', '=', '!'):
+            return 'no'             # no-semicolon style, or after a bare `return`
+        return 'expr'
+
+    def followed_by_else(self, i):
+        tokens = self.index.tokens
+        j = self.index.token_at(self.index.by_start[tokens[i + 3].start].end - 1) + 1
+        if j < len(tokens) and tokens[j].text == ';':
+            j += 1
+        return j < len(tokens) and tokens[j].text == 'else'
+
+
+def audit(path, opener=builtins.open, flag=GUARD):
+    """(content, log sites) for one file."""
+    with opener(path, 'r') as f:
+        content = f.read()
+    return content, list(LogAudit(path, content, flag).sites())
+
+
+def guard(path, hot=HOT, flag=GUARD, opener=builtins.open):
+    """Put hot, unguarded console.log/info/debug statements behind `if (flag)`; returns the sites guarded."""
+    content, sites = audit(path, opener, flag)
+    targets = [site for site in sites
+               if site.frequency in hot and site.method in GUARDABLE and site.guarded == 'no']
+    if targets:
+        edits = [(site.start, site.start, Patch('', f"if ({flag}) ", name=f"guard {site.path}:{site.line}"))
+                 for site in targets]
+        report(path, write_minimal(path, splice(content, edits), opener=opener))
+    return targets
+
+
+def rank(sites):
+    return sorted(sites, key=lambda site: (-FREQUENCIES.index(site.frequency), -PAYLOADS.index(site.payload),
+                                           site.path, site.line))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Classify console logging by execution frequency and guard hot sites.")
+    parser.add_argument('patterns', nargs='*', default=[DEFAULT_GLOB], help="Files or globs (default: src/**/*.ts*)")
+    parser.add_argument('--hot', default=','.join(HOT), help="Frequencies to guard (default: render,realtime)")
+    parser.add_argument('--flag', default=GUARD, help=f"Compile-time condition for the guard (default: {GUARD})")
+    parser.add_argument('--write', action='store_true', help="Guard the hot sites (default: report only)")
+    args = parser.parse_args(argv)
+
+    hot = tuple(name.strip() for name in args.hot.split(','))
+    unknown = [name for name in hot if name not in FREQUENCIES]
+    if unknown:
+        parser.error(f"unknown frequency: {', '.join(unknown)} (choose from {', '.join(FREQUENCIES)})")
+
+    paths = sorted({path for pattern in args.patterns for path in glob.glob(pattern, recursive=True)
+                    if path.endswith(('.ts', '.tsx')) and not path.endswith('.d.ts')})
+    sites = [site for path in paths for site in audit(path, flag=args.flag)[1]]
+    for site in rank(sites):
+        hot_site = site.frequency in hot and site.method in GUARDABLE and site.guarded == 'no'
+        mark = '🔥' if hot_site else ('🛡️ ' if site.guarded == 'yes' else '  ')
+        print(f"{mark} {site.frequency:<8} {site.payload:<10} {site.path}:{site.line}  {site.text[:70]}")
+
+    counts = collections.Counter(site.frequency for site in sites)
+    print(f"\n📋 {len(sites)} log site(s): "
+          + ', '.join(f"{counts[name]} {name}" for name in reversed(FREQUENCIES) if counts[name]))
+    if args.write:
+        guarded = [site for path in paths for site in guard(path, hot, args.flag)]
+        print(f"✅ {len(guarded)} hot log site(s) now behind if ({args.flag})")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Codemod: memoize derived experiment lists and pure leaf components.
+
+App recomputes exploreExperiments, boardExperiments, libraryExperiments
+and tableExperiments on every render, so each keystroke in the search box
+filters and re-sorts the whole backlog. This codemod builds a PatchSet
+(patch_engine, as App_updater.py does) from the current source:
+
+* every `const x = <collection expression>;` at the top level of the
+  component (a .filter/.sort/.map/... chain, not a function or hook call)
+  becomes `const x = useMemo(() => <expression>, [deps])`, where deps are
+  the component-scope names the expression reads (useState setters are
+  stable and left out);
+* `const t = [...s].sort(cmp)` where `s = base.filter(pred)` and pred
+  reads state that cmp doesn't (searchQuery) is split into a sort of base
+  that only reruns when base or the sort order changes, and a filter of
+  that sorted list; filtering keeps order, so the rows are the same. s
+  is removed, so the predicate lives in one place; if anything else reads
+  s, t just becomes a useMemo sort of s;
+* leaf components (IceBadge, OwnerAvatar, ExperimentCard by default) are
+  wrapped in React.memo. Call sites that pass inline functions, object
+  literals or freshly filtered arrays are listed, since those props
+  defeat the memo.
+
+Declarations after an early `return` are skipped (hooks must not be
+conditional).
+
+    python memoize_app.py                     # dry run: show the patches
+    python memoize_app.py --write
+    python memoize_app.py --file src/RoadmapView.tsx --component RoadmapView --memo ''
+"""
+import argparse
+import re
+import sys
+
+from minimal_write import report, write_minimal
+from patch_engine import Patch, PatchSet
+from tsx_index import TsxIndex
+
+DEFAULT_FILE = 'src/App.tsx'
+DEFAULT_COMPONENT = 'App'
+MEMO_COMPONENTS = ('IceBadge', 'OwnerAvatar', 'ExperimentCard')
+COLLECTION_METHODS = {'filter', 'sort', 'map', 'reduce', 'slice', 'flatMap', 'concat', 'reverse', 'toSorted'}
+# Arrow functions, function expressions, object and array literals
+INLINE_VALUE = re.compile(r'(async\s+)?(\([^()]*\)|[\w$]+)\s*=>|function\b|[{\[]')
+NEW_COLLECTION = re.compile(r'\.(filter|map|sort|slice|concat|flatMap)\(')
+STABLE_HOOKS = {'useState': 1, 'useReducer': 1}      # hook -> index of the stable element
+
+
+class Declaration:
+    """`const <pattern> = <value>;` at one nesting level."""
+
+    def __init__(self, index, first, equals, last):
+        self.index = index
+        self.first = first          # token index of `const`
+        self.equals = equals        # token index of `=`
+        self.last = last            # token index of `;`
+        tokens = index.tokens
+        self.start = tokens[first].start
+        self.end = tokens[last].end
+        self.value_start = tokens[equals + 1].start
+        self.value = index.text[self.value_start:tokens[last].start].rstrip()
+        self.value_end = self.value_start + len(self.value)
+
+    @property
+    def text(self):
+        return self.index.text[self.start:self.end]
+
+    def names(self):
+        """Bound names, and the subset that is a stable hook result (setters)."""
+        tokens = self.index.tokens
+        head = tokens[self.first + 1]
+        if head.kind == 'ident':
+            return [head.text], set()
+        pattern = self.index.by_start[head.start]
+        bound, stable = [], set()
+        hook = tokens[self.equals + 1].text
+        position = 0
+        for i in range(self.first + 2, self.equals):
+            token = tokens[i]
+            if token.start >= pattern.inner_end:
+                break
+            if self.index.enclosing(token.start) is not pattern:
+                continue
+            if token.text == ',':
+                position += 1
+            elif token.kind == 'ident' and tokens[i + 1].text != ':':
+                bound.append(token.text)
+                if head.text == '[' and STABLE_HOOKS.get(hook) == position:
+                    stable.add(token.text)
+        return bound, stable
+
+    def is_collection(self):
+        """A .filter/.sort/... chain on a name or spread, not a function or hook."""
+        tokens = self.index.tokens
+        value = tokens[self.equals + 1:self.last]
+        if not value or (value[0].text != '[' and value[0].kind != 'ident'):
+            return False
+        if re.match(r'use[A-Z]', value[0].text):
+            return False
+        scope = self.index.enclosing(self.start)
+        if any(token.text == '=>' and self.index.enclosing(token.start) is scope for token in value):
+            return False            # the value itself is an arrow function
+        return any(token.text in COLLECTION_METHODS and value[i - 1].text in ('.', '?.')
+                   for i, token in enumerate(value) if i)
+
+
+def statements(index, body):
+    """Top-level `const ... = ...;` declarations and early returns in a block."""
+    tokens = index.tokens
+    i = index.token_at(body.start) + 1
+    declarations, first_return = [], None
+    while i < len(tokens) and tokens[i].start < body.inner_end:
+        token = tokens[i]
+        top = index.enclosing(token.start) is body
+        if top and token.kind == 'ident' and token.text == 'return' and first_return is None:
+            first_return = token.start
+        if top and token.kind == 'ident' and token.text in ('const', 'let'):
+            equals = last = None
+            j = i + 1
+            while j < len(tokens) and tokens[j].start < body.inner_end:
+                if index.enclosing(tokens[j].start) is body:
+                    if tokens[j].text == '=' and equals is None:
+                        equals = j
+                    elif tokens[j].text == ';':
+                        last = j
+                        break
+                    elif tokens[j].kind == 'ident' and tokens[j].text in ('const', 'let', 'return'):
+                        break           # no semicolon: leave it alone
+                j += 1
+            if equals is not None and last is not None:
+                declarations.append(Declaration(index, i, equals, last))
+                i = last
+        i += 1
+    return declarations, first_return
+
+
+def free_names(index, start, end):
+    """Identifiers read between start and end, in order of first use."""
+    tokens = index.tokens
+    names = []
+    i = index.token_at(start)
+    while i is not None and i < len(tokens) and tokens[i].start < end:
+        token = tokens[i]
+        if token.kind == 'ident':
+            previous = tokens[i - 1].text
+            following = tokens[i + 1].text if i + 1 < len(tokens) else ''
+            key = following == ':' and previous in ('{', ',')
+            if previous not in ('.', '?.') and not key and token.text not in names:
+                names.append(token.text)
+        i += 1
+    return names
+
+
+def call_args(declaration, method):
+    """The (...) interval of `<head>.method(...)` when that call ends the value."""
+    match = re.search(rf'\.{method}\(', declaration.value)
+    if match is None:
+        return None
+    args = declaration.index.by_start.get(declaration.value_start + match.end() - 1)
+    return args if args is not None and args.end == declaration.value_end else None
+
+
+def sort_split(index, table, source, deps):
+    """Rewrite `t = [...s].sort(cmp)` / `s = base.filter(pred)` as sort-then-filter.
+
+    Returns (replacement for t, Patch deleting s), or None. The filter moves
+    into t, so s is only removed, never duplicated; when anything else reads
+    s the split is not made and t becomes a plain useMemo over s.
+    """
+    sort = call_args(table, 'sort')
+    base = re.match(r'(\w+)\.filter\(', source.value)
+    filtered = call_args(source, 'filter')
+    if sort is None or base is None or filtered is None:
+        return None
+    name = source_name(source)
+    if any(not (source.first < i < source.last or table.first < i < table.last)
+           for i in index.identifiers.get(name, ())):
+        return None
+
+    comparator = index.text[sort.inner_start:sort.inner_end]
+    predicate = index.text[filtered.inner_start:filtered.inner_end]
+    sort_deps = [n for n in free_names(index, sort.start, sort.end) if n in deps]
+    filter_deps = [n for n in free_names(index, filtered.start, filtered.end) if n in deps]
+    if not set(filter_deps) - set(sort_deps):
+        return None
+    name = source_name(table)
+    order = f"{name}Order"
+    indent = ' ' * (table.start - index.text.rfind('\n', 0, table.start) - 1)
+    removed, comments = declaration_lines(index, source)
+    replacement = (f"const {order} = useMemo(() => [...{base.group(1)}].sort({comparator}), "
+                   f"[{', '.join(dict.fromkeys([base.group(1)] + sort_deps))}]);\n"
+                   f"{comments}{indent}const {name} = useMemo(() => {order}.filter({predicate}), "
+                   f"[{', '.join(dict.fromkeys([order] + filter_deps))}]);")
+    return replacement, Patch(removed, '', name=f"drop {source_name(source)}")
+
+
+def declaration_lines(index, declaration):
+    """(the declaration's whole lines with its leading comments and one trailing blank line, those comments)."""
+    text = index.text
+    start = text.rfind('\n', 0, declaration.start) + 1
+    while start:
+        above = text.rfind('\n', 0, start - 1) + 1
+        if not text[above:start].strip().startswith('//'):
+            break
+        start = above
+    comments = text[start:text.rfind('\n', 0, declaration.start) + 1]
+    end = text.find('\n', declaration.end) + 1 or len(text)
+    if text[end:].startswith('\n'):
+        end += 1
+    return text[start:end], comments
+
+
+def source_name(declaration):
+    return declaration.index.tokens[declaration.first + 1].text
+
+
+def memo_patch(index, name):
+    """React.memo around `const Name = (...) => ...;` at module level."""
+    tokens = index.tokens
+    for i in index.identifiers.get(name, ()):
+        if tokens[i - 1].text != 'const' or index.enclosing(tokens[i].start) is not None:
+            continue
+        declaration = module_declaration(index, i - 1)
+        if declaration is None or declaration.value.startswith(('React.memo(', 'memo(')):
+            return None
+        if '=>' not in declaration.value:
+            return None
+        prefix = declaration.text[:declaration.value_start - declaration.start]
+        return Patch(declaration.text, f"{prefix}React.memo({declaration.value});", name=f"React.memo {name}")
+    return None
+
+
+def module_declaration(index, first):
+    tokens = index.tokens
+    equals = None
+    for j in range(first + 1, len(tokens)):
+        if index.enclosing(tokens[j].start) is not None:
+            continue
+        if tokens[j].text == '=' and equals is None:
+            equals = j
+        elif tokens[j].text == ';':
+            return Declaration(index, first, equals, j) if equals is not None else None
+    return None
+
+
+def inline_props(index, name):
+    """(line, attribute) for props given a new function, object or array at <Name> call sites."""
+    found = []
+    tokens = index.tokens
+    for element in index.elements(name):
+        i = index.token_at(element.start) + 1
+        while tokens[i].start < element.inner_start - 1:
+            container = index.by_start.get(tokens[i + 1].start)
+            if tokens[i].kind == 'jsx-attr' and tokens[i + 1].text == '{' and container is not None:
+                inner = index.text[container.inner_start:container.inner_end].strip()
+                if INLINE_VALUE.match(inner) or NEW_COLLECTION.search(inner):
+                    found.append((index.text.count('\n', 0, element.start) + 1, tokens[i].text))
+            i += 1
+    return found
+
+
+def react_import_patch(content, *hooks):
+    match = re.search(r"^import React, \{([^}]*)\} from 'react';", content, re.M)
+    if match is None:
+        return None
+    names = [name.strip() for name in match.group(1).split(',') if name.strip()]
+    missing = [hook for hook in hooks if hook not in names]
+    if not missing:
+        return None
+    replace = f"import React, {{ {', '.join(names + missing)} }} from 'react';"
+    return Patch(match.group(), replace, name=f"import {', '.join(missing)}")
+
+
+def build_patches(content, component=DEFAULT_COMPONENT, memo=MEMO_COMPONENTS):
+    """Returns (PatchSet, notes) for the current source."""
+    index = TsxIndex(content)
+    body = index.function_body(component)
+    if body is None:
+        raise ValueError(f"Component {component} not found")
+    declarations, first_return = statements(index, body)
+
+    deps, stable = set(), set()
+    for declaration in declarations:
+        bound, setters = declaration.names()
+        deps.update(bound)
+        stable.update(setters)
+    deps -= stable
+
+    derived = {}
+    for declaration in declarations:
+        if declaration.value.startswith('useMemo(') or not declaration.is_collection():
+            continue
+        if index.tokens[declaration.first + 1].kind != 'ident':
+            continue
+        derived[source_name(declaration)] = declaration
+
+    splits = {}
+    for name, declaration in derived.items():
+        match = re.match(r'\[\.\.\.(\w+)\]\.sort\(', declaration.value)
+        if match and match.group(1) in derived:
+            split = sort_split(index, declaration, derived[match.group(1)], deps)
+            if split is not None:
+                splits[name] = (match.group(1), *split)
+    merged = {source for source, _, _ in splits.values()}
+
+    patches, notes = [], []
+    for name, declaration in derived.items():
+        if first_return is not None and declaration.start > first_return:
+            notes.append(f"⚠️  {name} is declared after an early return, not memoized")
+            continue
+        if name in merged:
+            continue                # moved into the sort-then-filter split below
+        if name in splits:
+            source, replace, removal = splits[name]
+            patches.append(removal)
+            notes.append(f"🔀 {name}: sorts {source}'s source once, then filters the sorted list ({source} removed)")
+        else:
+            used = [n for n in free_names(index, declaration.value_start, declaration.value_end)
+                    if n in deps and n != name]
+            prefix = declaration.text[:declaration.value_start - declaration.start]
+            replace = f"{prefix}useMemo(() => {declaration.value}, [{', '.join(used)}]);"
+            notes.append(f"🧠 {name}: useMemo([{', '.join(used)}])")
+        patches.append(Patch(declaration.text, replace, name=f"useMemo {name}"))
+
+    if patches:
+        hook_import = react_import_patch(content, 'useMemo')
+        if hook_import is not None:
+            patches.insert(0, hook_import)
+
+    for name in memo:
+        patch = memo_patch(index, name)
+        if patch is None:
+            continue
+        patches.append(patch)
+        notes.append(f"🧊 {name}: React.memo")
+        for line, prop in inline_props(index, name):
+            notes.append(f"   ⚠️  line {line}: <{name} {prop}={{...}}> is a new value every render, the memo won't hold")
+    return PatchSet(patches), notes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Wrap derived lists in useMemo and leaf components in React.memo.")
+    parser.add_argument('--file', default=DEFAULT_FILE)
+    parser.add_argument('--component', default=DEFAULT_COMPONENT, help="Component whose derived lists are memoized")
+    parser.add_argument('--memo', default=','.join(MEMO_COMPONENTS),
+                        help="Comma-separated components to wrap in React.memo ('' for none)")
+    parser.add_argument('--write', action='store_true', help="Write the file (default: dry run)")
+    args = parser.parse_args(argv)
+
+    with open(args.file, 'r') as f:
+        content = f.read()
+    memo = [name.strip() for name in args.memo.split(',') if name.strip()]
+    patches, notes = build_patches(content, args.component, memo)
+    for note in notes:
+        print(note)
+    if not patches.patches:
+        print(f"✅ {args.file}: nothing left to memoize")
+        return 0
+
+    result = patches.apply(content)
+    if result.missing:
+        print(f"❌ patches did not apply: {', '.join(result.missing)}")
+        return 1
+    if args.write:
+        report(args.file, write_minimal(args.file, result.content))
+    else:
+        print(f"🔍 dry run: {len(patches.patches)} patch(es) for {args.file}, use --write to apply")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 import re
 
+from pattern_registry import PatternRegistry
+
+PATTERNS = PatternRegistry()
+
 print("🔄 Reading original App.tsx...")
 with open('src/App.tsx', 'r') as f:
     content = f.read()
@@ -21,14 +25,14 @@ import { useNorthStar } from './hooks/useNorthStar';"""
 )
 
 # Change 2: Remove mock data import
-content = re.sub(
-    r"import { POLANCO_NORTH_STAR, POLANCO_OBJECTIVES, POLANCO_STRATEGIES, POLANCO_EXPERIMENTS } from './laboratorioPolancoData';",
-    "// MOCK DATA REMOVED - Using Supabase Enterprise",
-    content
+mock_import = PATTERNS.literal(
+    'mock import',
+    "import { POLANCO_NORTH_STAR, POLANCO_OBJECTIVES, POLANCO_STRATEGIES, POLANCO_EXPERIMENTS } from './laboratorioPolancoData';"
 )
+content = mock_import.sub("// MOCK DATA REMOVED - Using Supabase Enterprise", content)
 
 # Change 3: Replace the entire useState section with Supabase hooks
-old_state_section = r'''const App: React.FC = \(\) => \{ console\.log\("App rendering"\);
+old_state_section = r'''const App: React\.FC = \(\) => \{ console\.log\("App rendering"\);
   const \[view, setView\] = useState<'board' \| 'table' \| 'library' \| 'roadmap'>\('board'\);
   
   // Multi-Project State Management
@@ -81,7 +85,10 @@ new_state_section = '''const App: React.FC = () => {
   const [isCreateProjectOpen, setIsCreateProjectOpen] = useState(false);
   const [isSettingsOpen, setIsSettingsOpen] = useState(false);'''
 
-content = re.sub(old_state_section, new_state_section, content, flags=re.DOTALL)
+# Pure literal once unescaped, so the registry matches it without the regex engine
+state_section = PATTERNS.register('state section', old_state_section, re.DOTALL)
+content = state_section.sub(new_state_section, content)
+PATTERNS.save()
 
 print("✅ Migrations applied")
 print("💾 Writing new App.tsx...")
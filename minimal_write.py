@@ -0,0 +1,64 @@
+"""
+Diff-based write-back for scripts that regenerate a whole file.
+
+overwrite_roadmap.py and the Roadmap_*_fix.py scripts carry a complete copy
+of RoadmapView.tsx. Instead of truncating and rewriting the file every run,
+write_minimal() diffs the new content against what is on disk:
+
+* identical content is not written at all, so Vite's watcher and HMR
+  never see an event;
+* otherwise the file is opened in place, everything before the first
+  changed byte is left untouched, and only the tail from there is
+  rewritten.
+
+The changed hunks are returned (and printed by report()) so the script
+shows exactly what it replaced.
+
+Pass opener=open from a fix script so patch_runner's in-memory cache is
+used when the script runs as a batch unit.
+"""
+import builtins
+import difflib
+
+from patch_engine import common_prefix
+
+
+def diff_hunks(old, new):
+    """Line-level (tag, old_start, old_end, new_start, new_end) hunks, 0-based."""
+    matcher = difflib.SequenceMatcher(None, old.splitlines(True), new.splitlines(True), autojunk=False)
+    return [op for op in matcher.get_opcodes() if op[0] != 'equal']
+
+
+def write_minimal(path, content, opener=builtins.open):
+    """Bring the file at path to `content`, touching as little of it as possible.
+
+    Returns the diff hunks; an empty list means nothing was written.
+    """
+    new = content.encode('utf-8')
+    try:
+        f = opener(path, 'rb+')
+    except FileNotFoundError:
+        with opener(path, 'wb') as f:
+            f.write(new)
+        return diff_hunks('', content)
+
+    with f:
+        old = f.read()
+        if old == new:
+            return []
+        start = common_prefix(old, new)
+        f.seek(start)
+        f.write(new[start:])
+        f.truncate()
+    return diff_hunks(old.decode('utf-8'), content)
+
+
+def report(path, hunks):
+    if not hunks:
+        print(f"{path} already up to date, nothing written")
+        return
+    added = sum(j2 - j1 for _, _, _, j1, j2 in hunks)
+    removed = sum(i2 - i1 for _, i1, i2, _, _ in hunks)
+    print(f"{path}: {len(hunks)} hunk(s), +{added} -{removed} lines")
+    for tag, i1, i2, j1, j2 in hunks:
+        print(f"   {tag} lines {i1 + 1}-{i2} -> {j1 + 1}-{j2}")
@@ -1,4 +1,4 @@
-import os
+from minimal_write import report, write_minimal
 
 file_path = '/Users/andres/.gemini/antigravity/brain/50faad1d-d922-4d7a-8db6-b7755fdeb5db/growth-experiment-manager/src/RoadmapView.tsx'
 
@@ -258,7 +258,8 @@ export const RoadmapView: React.FC<RoadmapViewProps> = ({
 };
 """
 
-with open(file_path, 'w') as f:
-    f.write(content)
-
-print(f"Successfully overwrote {file_path}")
+# Only rewrite what differs from the file on disk (no write at all if identical)
+hunks = write_minimal(file_path, content, opener=open)
+report(file_path, hunks)
+if hunks:
+    print(f"Successfully overwrote {file_path}")
@@ -0,0 +1,238 @@
+"""
+Shared patch engine for the App_*.py / Roadmap_*.py fix scripts.
+
+Every search string of a fix script (plus any guard strings) is compiled
+into a single Aho-Corasick automaton, so the target file is scanned once
+no matter how many patches the script carries, and all edits are spliced
+in one pass.
+
+Searches are matched against the content as it was *before* the patch set
+ran (unlike a chain of content.replace calls, where a later replace sees
+the output of an earlier one). When two matches overlap, the one that
+starts first wins; on a tie the longer search wins.
+
+Usage:
+
+    from patch_engine import Patch, PatchSet
+
+    PATCHES = PatchSet([
+        Patch(old_block, new_block, name='sidebar'),
+        Patch(start_obj, replace_obj, name='objective log', unless='Button clicked'),
+    ])
+
+    result = PATCHES.apply(content)
+    if result.applied['sidebar']:
+        print("Replaced sidebar buttons")
+    content = result.content
+"""
+from collections import deque
+
+
+class Automaton:
+    """Aho-Corasick automaton over a fixed list of needles."""
+
+    def __init__(self, needles):
+        self.needles = list(needles)
+        self.goto = [{}]
+        self.fail = [0]
+        self.out = [()]
+
+        for index, needle in enumerate(self.needles):
+            if not needle:
+                raise ValueError("Cannot search for an empty string")
+            state = 0
+            for ch in needle:
+                nxt = self.goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.out.append(())
+                    self.goto[state][ch] = nxt
+                state = nxt
+            self.out[state] += (index,)
+
+        # Breadth-first pass to wire up failure links
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self.goto[state].items():
+                queue.append(nxt)
+                fallback = self.fail[state]
+                while fallback and ch not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[nxt] = self.goto[fallback].get(ch, 0)
+                self.out[nxt] += self.out[self.fail[nxt]]
+
+    def finditer(self, text, start=0, end=None):
+        """Yield (start, needle_index) for every (possibly overlapping) match."""
+        goto, fail, out, needles = self.goto, self.fail, self.out, self.needles
+        state = 0
+        for pos in range(start, len(text) if end is None else end):
+            ch = text[pos]
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for index in out[state]:
+                yield pos - len(needles[index]) + 1, index
+
+
+class Patch:
+    """One search/replace edit.
+
+    count  -- maximum number of replacements (None replaces every match,
+              like str.replace).
+    unless -- guard string; the patch is skipped when it already appears in
+              the file (replaces ad-hoc `if "..." not in content` checks).
+    within -- callable(content) -> (start, end) or None; only matches lying
+              inside that range are replaced, and none when it is None
+              (e.g. a function body located with tsx_index).
+    """
+
+    def __init__(self, search, replace, name=None, count=None, unless=None, within=None):
+        self.search = search
+        self.replace = replace
+        self.name = name or search.strip().splitlines()[0][:60]
+        self.count = count
+        self.unless = unless
+        self.within = within
+
+    def __repr__(self):
+        return f"Patch({self.name!r})"
+
+
+class Scan:
+    """Positions of every needle found by a single pass over a file."""
+
+    def __init__(self, needles, matches):
+        self.positions = {needle: [] for needle in needles}
+        for start, index in matches:
+            self.positions[needles[index]].append(start)
+
+    def __contains__(self, needle):
+        return bool(self.positions.get(needle))
+
+    def count(self, needle):
+        return len(self.positions.get(needle, ()))
+
+
+class PatchResult:
+    def __init__(self, content, applied, scan):
+        self.content = content
+        self.applied = applied
+        self.scan = scan
+
+    @property
+    def changed(self):
+        return any(self.applied.values())
+
+    @property
+    def missing(self):
+        return [name for name, hits in self.applied.items() if not hits]
+
+
+class PatchSet:
+    """A fix script's patches, compiled into one automaton."""
+
+    def __init__(self, patches, probes=()):
+        self.patches = list(patches)
+        names = [patch.name for patch in self.patches]
+        if len(set(names)) != len(names):
+            raise ValueError("Patch names must be unique within a PatchSet")
+
+        needles = []
+        for text in [p.search for p in self.patches] + [p.unless for p in self.patches if p.unless] + list(probes):
+            if text not in needles:
+                needles.append(text)
+        self.needles = needles
+        self.automaton = Automaton(needles)
+        self.longest = max((len(n) for n in needles), default=0)
+
+    def scan(self, content, start=0, end=None):
+        return Scan(self.needles, self.automaton.finditer(content, start, end))
+
+    def select(self, scan, content=None):
+        """Pick the non-overlapping (start, end, patch) edits a scan allows.
+
+        Patches with a `within` range need the scanned content.
+        """
+        candidates = []
+        for order, patch in enumerate(self.patches):
+            if patch.unless and patch.unless in scan:
+                continue
+            starts = scan.positions[patch.search]
+            if patch.within is not None and starts:
+                if content is None:
+                    raise ValueError(f"Patch {patch.name!r} is limited to a range and needs the content")
+                bounds = patch.within(content)
+                if bounds is None:
+                    continue
+                starts = [start for start in starts
+                          if bounds[0] <= start and start + len(patch.search) <= bounds[1]]
+            for start in starts:
+                candidates.append((start, -len(patch.search), order, patch))
+        candidates.sort(key=lambda c: c[:3])
+
+        edits = []
+        used = {}
+        cursor = 0
+        for start, _, _, patch in candidates:
+            if start < cursor:
+                continue
+            if patch.count is not None and used.get(patch.name, 0) >= patch.count:
+                continue
+            used[patch.name] = used.get(patch.name, 0) + 1
+            cursor = start + len(patch.search)
+            edits.append((start, cursor, patch))
+        return edits
+
+    def apply(self, content, start=0, end=None):
+        """Apply the patches to content, or only to content[start:end].
+
+        With a range, `unless` guards also only see that range.
+        """
+        scan = self.scan(content, start, end)
+        edits = self.select(scan, content)
+        return PatchResult(splice(content, edits), tally(self.patches, edits), scan)
+
+
+def splice(content, edits):
+    """Apply sorted, non-overlapping (start, end, patch) edits in one pass."""
+    pieces = []
+    cursor = 0
+    for start, end, patch in edits:
+        pieces.append(content[cursor:start])
+        pieces.append(patch.replace)
+        cursor = end
+    pieces.append(content[cursor:])
+    return ''.join(pieces)
+
+
+def tally(patches, edits):
+    applied = {patch.name: 0 for patch in patches}
+    for _, _, patch in edits:
+        applied[patch.name] += 1
+    return applied
+
+
+def common_prefix(a, b):
+    """Length of the common prefix, found with C-level slice comparisons."""
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[:mid] == b[:mid]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def common_suffix(a, b, limit):
+    low, high = 0, limit
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[len(a) - mid:] == b[len(b) - mid:]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
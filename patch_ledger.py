@@ -0,0 +1,122 @@
+"""
+Persistent ledger of patch units that are known to be no-ops.
+
+Entries are keyed by (patch id, content hash of the unit's target files).
+A patch id is the unit name plus a hash of its source, so editing a fix
+script invalidates everything it recorded. When the runner finds a
+matching entry it skips the unit entirely: one hash instead of re-running
+every search in the script. patch_runner --glob runs each unit once per
+file, so its entries are also scoped by the file the unit was pointed at.
+
+Entries that have not been hit for `max_age` seconds, or that belong to an
+older version of a script, are evicted when the ledger is saved.
+"""
+import hashlib
+import json
+import os
+import time
+
+LEDGER_PATH = '.patch_ledger.json'
+MAX_AGE = 14 * 24 * 3600
+MAX_ENTRIES = 1024
+
+
+def content_hash(content):
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def patch_id(unit_path):
+    with open(unit_path, 'rb') as f:
+        digest = hashlib.sha256(f.read()).hexdigest()[:16]
+    return f"{os.path.basename(unit_path)}@{digest}"
+
+
+def targets_hash(contents):
+    """Combine {relpath: content} into one hash, independent of order."""
+    digest = hashlib.sha256()
+    for path in sorted(contents):
+        digest.update(path.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(content_hash(contents[path]).encode('ascii'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+class PatchLedger:
+    def __init__(self, path=LEDGER_PATH, max_age=MAX_AGE, max_entries=MAX_ENTRIES):
+        self.path = path
+        self.max_age = max_age
+        self.max_entries = max_entries
+        self.targets = {}
+        self.entries = {}
+        self.load()
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            print(f"⚠️  Ignoring unreadable patch ledger {self.path}")
+            return
+        self.targets = data.get('targets', {})
+        self.entries = data.get('entries', {})
+
+    def targets_for(self, pid, scope=None):
+        """Files the unit touched the last time it ran, or None if unknown."""
+        return self.targets.get(scoped(pid, scope))
+
+    def is_noop(self, pid, digest, scope=None):
+        key = f"{scoped(pid, scope)}:{digest}"
+        if key not in self.entries:
+            return False
+        self.entries[key]['seen'] = time.time()
+        return True
+
+    def record_noop(self, pid, targets, digest, scope=None):
+        self.targets[scoped(pid, scope)] = sorted(targets)
+        self.entries[f"{scoped(pid, scope)}:{digest}"] = {'unit': pid, 'seen': time.time()}
+
+    def record_targets(self, pid, targets, scope=None):
+        self.targets[scoped(pid, scope)] = sorted(targets)
+
+    def evict(self, current_ids=None):
+        now = time.time()
+        live = {}
+        for key, entry in self.entries.items():
+            if now - entry['seen'] > self.max_age:
+                continue
+            if current_ids is not None and is_superseded(entry['unit'], current_ids):
+                continue
+            live[key] = entry
+        if len(live) > self.max_entries:
+            newest = sorted(live.items(), key=lambda item: item[1]['seen'], reverse=True)
+            live = dict(newest[:self.max_entries])
+        self.entries = live
+
+        units = {entry['unit'] for entry in live.values()}
+        if current_ids is not None:
+            units |= set(current_ids)
+        self.targets = {key: paths for key, paths in self.targets.items() if unscoped(key) in units}
+
+    def save(self, current_ids=None):
+        self.evict(current_ids)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({'targets': self.targets, 'entries': self.entries}, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+def scoped(pid, scope):
+    return pid if scope is None else f"{pid}|{scope}"
+
+
+def unscoped(key):
+    return key.split('|', 1)[0]
+
+
+def is_superseded(pid, current_ids):
+    """True when a newer version of the same script is in `current_ids`."""
+    name = pid.rsplit('@', 1)[0]
+    return pid not in current_ids and any(other.rsplit('@', 1)[0] == name for other in current_ids)
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Batch runner for the App_*.py / Roadmap_*.py fix scripts.
+
+Runs every fix script as an ordered patch unit inside one interpreter.
+The scripts keep calling open() as usual; the runner hands them an
+in-memory FileCache instead, so each target file is read from disk once,
+passed from unit to unit in memory, and written back exactly once at the
+end. If any unit fails nothing is written.
+
+Units that were a no-op on the exact same target contents are remembered
+in a PatchLedger (.patch_ledger.json) and skipped on the next run.
+
+With --glob the same units are fanned out over every matching file in a
+process pool. Each unit's hardcoded target (the first file it opens, e.g.
+'src/App.tsx') is retargeted to the worker's file, every file is patched
+independently, and the per-file results are merged into one report.
+
+    python patch_runner.py                      # every App_*/Roadmap_* script
+    python patch_runner.py App_ice_fix.py App_strict_fix.py
+    python patch_runner.py --dry-run
+    python patch_runner.py --no-ledger          # force every unit to run
+    python patch_runner.py App_cleanup_logs.py --glob 'src/**/*.tsx' --jobs 8
+"""
+import argparse
+import contextlib
+import glob
+import io
+import os
+import runpy
+import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+from minimal_write import write_minimal
+from patch_ledger import PatchLedger, patch_id, targets_hash
+
+UNIT_PATTERNS = ('App_*.py', 'Roadmap_*.py')
+
+
+class VirtualText(io.StringIO):
+    def __init__(self, cache, key, content, writable):
+        super().__init__(content)
+        self._cache = cache
+        self._key = key
+        self._writable = writable
+
+    def close(self):
+        if self._writable and not self.closed:
+            self._cache.store(self._key, self.getvalue())
+        super().close()
+
+
+class VirtualBinary(io.BytesIO):
+    def __init__(self, cache, key, content, writable):
+        super().__init__(content.encode('utf-8'))
+        self._cache = cache
+        self._key = key
+        self._writable = writable
+
+    def close(self):
+        if self._writable and not self.closed:
+            self._cache.store(self._key, self.getvalue().decode('utf-8'))
+        super().close()
+
+
+class FileCache:
+    """In-memory copy of every file the patch units open."""
+
+    def __init__(self):
+        self.files = {}
+        self.original = {}
+        self.disk_reads = 0
+        self.opened = set()
+
+    def key(self, path):
+        return os.path.abspath(os.fspath(path))
+
+    def begin_unit(self):
+        self.opened = set()
+
+    def read(self, path):
+        key = self.key(path)
+        if key not in self.files:
+            with open(key, 'r', encoding='utf-8') as f:
+                content = f.read()
+            self.disk_reads += 1
+            self.files[key] = content
+            self.original[key] = content
+        return self.files[key]
+
+    def store(self, path, content):
+        key = self.key(path)
+        if key not in self.original:
+            # Keep the on-disk baseline so rewriting identical content is not a change
+            try:
+                self.read(key)
+            except FileNotFoundError:
+                self.original[key] = None
+        self.files[key] = content
+
+    def open(self, path, mode='r', *args, **kwargs):
+        """Drop-in replacement for open() backed by the cache."""
+        key = self.key(path)
+        self.opened.add(key)
+        if 'w' in mode:
+            content = ''
+        elif 'x' in mode:
+            if key in self.files or os.path.exists(key):
+                raise FileExistsError(key)
+            content = ''
+        else:
+            content = self.read(key)
+
+        writable = any(flag in mode for flag in 'wax+')
+        cls = VirtualBinary if 'b' in mode else VirtualText
+        handle = cls(self, key, content, writable)
+        if 'a' in mode:
+            handle.seek(0, io.SEEK_END)
+        return handle
+
+    def dirty(self):
+        return [key for key, content in self.files.items() if content != self.original[key]]
+
+    def flush(self):
+        """Write every changed file to disk, once, from its first changed byte."""
+        written = []
+        for key in self.dirty():
+            write_minimal(key, self.files[key])
+            self.original[key] = self.files[key]
+            written.append(key)
+        return written
+
+
+class RetargetedCache(FileCache):
+    """FileCache that points each unit's primary target at one file.
+
+    Only that file is ever written; edits a unit makes to any other file
+    are dropped, since other workers may be patching them concurrently.
+    """
+
+    def __init__(self, target):
+        super().__init__()
+        self.target = self.key(target)
+        self.primary = None
+
+    def begin_unit(self):
+        super().begin_unit()
+        self.primary = None
+
+    def open(self, path, mode='r', *args, **kwargs):
+        key = self.key(path)
+        if self.primary is None:
+            self.primary = key
+        if key == self.primary:
+            path = self.target
+        return super().open(path, mode, *args, **kwargs)
+
+    def dirty(self):
+        return [key for key in super().dirty() if key == self.target]
+
+    def ignored(self):
+        return [key for key in super().dirty() if key != self.target]
+
+
+def discover(patterns=UNIT_PATTERNS):
+    units = []
+    for pattern in patterns:
+        units.extend(glob.glob(pattern))
+    return sorted(set(units))
+
+
+def run_unit(path, cache):
+    """Execute one fix script as __main__ with open() routed through the cache."""
+    runpy.run_path(path, init_globals={'open': cache.open}, run_name='__main__')
+
+
+def run_units(units, cache, ledger=None, scope=None):
+    skipped = 0
+    for unit in units:
+        pid = patch_id(unit)
+        targets = ledger.targets_for(pid, scope) if ledger else None
+        if targets is not None:
+            try:
+                digest = targets_hash({path: cache.read(path) for path in targets})
+            except FileNotFoundError:
+                digest = None
+            if digest and ledger.is_noop(pid, digest, scope):
+                print(f"⏭  {unit} (unchanged)")
+                skipped += 1
+                continue
+
+        print(f"▶ {unit}")
+        before = dict(cache.files)
+        cache.begin_unit()
+        run_unit(unit, cache)
+
+        if ledger is None or not cache.opened:
+            continue
+        touched = {os.path.relpath(key): key for key in cache.opened}
+        inputs = {rel: before.get(key, cache.original.get(key)) for rel, key in touched.items()}
+        if any(content is None for content in inputs.values()):
+            continue
+        if all(cache.files.get(key) == inputs[rel] for rel, key in touched.items()):
+            ledger.record_noop(pid, touched, targets_hash(inputs), scope)
+        else:
+            ledger.record_targets(pid, touched, scope)
+    return skipped
+
+
+def patch_file(target, units, use_ledger=True, dry_run=False):
+    """Process-pool worker: run every unit against one file."""
+    cache = RetargetedCache(target)
+    ledger = PatchLedger() if use_ledger else None
+    output = io.StringIO()
+    report = {'file': target, 'error': None, 'written': False, 'ignored': []}
+    try:
+        with contextlib.redirect_stdout(output):
+            # One ledger entry per (unit, file): every worker runs the same unit ids
+            report['skipped'] = run_units(units, cache, ledger, scope=os.path.relpath(target))
+    except Exception:
+        report['error'] = traceback.format_exc()
+    else:
+        report['written'] = bool(cache.dirty() if dry_run else cache.flush())
+        report['ignored'] = [os.path.relpath(key) for key in cache.ignored()]
+    report['output'] = output.getvalue()
+    if ledger is not None:
+        report['ledger'] = (ledger.targets, ledger.entries)
+    return report
+
+
+def run_glob(pattern, units, jobs=None, use_ledger=True, dry_run=False):
+    files = sorted(path for path in glob.glob(pattern, recursive=True) if os.path.isfile(path))
+    if not files:
+        print(f"No files match {pattern}")
+        return 1
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        reports = list(pool.map(patch_file, files, [units] * len(files),
+                                [use_ledger] * len(files), [dry_run] * len(files)))
+
+    if use_ledger:
+        ledger = PatchLedger()
+        for report in reports:
+            targets, entries = report['ledger']
+            ledger.targets.update(targets)
+            ledger.entries.update(entries)
+        ledger.save(current_ids=[patch_id(unit) for unit in units])
+
+    failed = [r for r in reports if r['error']]
+    changed = [r for r in reports if r['written']]
+    for report in reports:
+        if not (report['error'] or report['written'] or report['ignored']):
+            continue
+        print(f"\n📄 {report['file']}")
+        for line in report['output'].splitlines():
+            print(f"   {line}")
+        for path in report['ignored']:
+            print(f"   ⚠️  Ignored edits to {path} (only the target file is written in --glob mode)")
+        if report['error']:
+            print(report['error'])
+
+    verb = "would change" if dry_run else "written"
+    print(f"\n✅ {len(files)} file(s), {len(units)} unit(s): {len(changed)} {verb}, {len(failed)} failed")
+    for report in changed:
+        print(f"   {report['file']}")
+    return 1 if failed else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Apply the App_*/Roadmap_* fixes in one process.")
+    parser.add_argument('units', nargs='*', help="Fix scripts to run, in order (default: every App_*/Roadmap_* script)")
+    parser.add_argument('--exclude', action='append', default=[], help="Skip a fix script (repeatable)")
+    parser.add_argument('--dry-run', action='store_true', help="Run every unit but do not write any file")
+    parser.add_argument('--no-ledger', action='store_true', help="Ignore the no-op ledger and run every unit")
+    parser.add_argument('--glob', help="Apply the units to every file matching this pattern (e.g. 'src/**/*.tsx')")
+    parser.add_argument('--jobs', type=int, default=None, help="Worker processes for --glob (default: one per core)")
+    args = parser.parse_args(argv)
+
+    units = args.units or discover()
+    units = [unit for unit in units if os.path.basename(unit) not in args.exclude]
+
+    if args.glob:
+        return run_glob(args.glob, units, args.jobs, not args.no_ledger, args.dry_run)
+
+    cache = FileCache()
+    ledger = None if args.no_ledger else PatchLedger()
+    try:
+        skipped = run_units(units, cache, ledger)
+    except Exception:
+        traceback.print_exc()
+        print("❌ Patch unit failed, no files were written")
+        return 1
+
+    if ledger is not None:
+        ledger.save(current_ids=[patch_id(unit) for unit in units])
+
+    if args.dry_run:
+        written = cache.dirty()
+        print(f"\n🧪 Dry run: {len(written)} file(s) would change")
+    else:
+        written = cache.flush()
+        print(f"\n✅ {len(units)} unit(s), {skipped} skipped, {cache.disk_reads} read(s), {len(written)} write(s)")
+    for key in written:
+        print(f"   {os.path.relpath(key)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
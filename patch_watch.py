@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Watch mode for the PatchSet-based fix scripts.
+
+    python patch_watch.py App_updater.py App_emergency_fix.py App_roadmap_fix.py
+
+Loads the TARGETS of each unit (see patch_engine), applies them once, then
+keeps every target file and its anchor index in memory. On each save only
+the edited byte range is rescanned, the index is shifted around it, and
+only the patches whose anchors landed in that range are re-evaluated.
+
+Change notification uses inotify through the optional inotify_simple
+package when it is installed, and falls back to polling mtimes.
+"""
+import argparse
+import ast
+import bisect
+import os
+import runpy
+import sys
+import time
+
+from patch_engine import Scan, common_prefix, common_suffix, splice, tally
+
+try:
+    import inotify_simple
+except ImportError:
+    inotify_simple = None
+
+
+class AnchorIndex:
+    """Sorted (start, needle index) matches of one PatchSet in one file."""
+
+    def __init__(self, patchset, content):
+        self.patchset = patchset
+        self.matches = sorted(patchset.automaton.finditer(content))
+
+    def scan(self):
+        return Scan(self.patchset.needles, self.matches)
+
+    def update(self, content, start, old_end, new_end):
+        """Account for content[start:new_end] replacing the old [start:old_end].
+
+        Returns the needle indices matched inside the edited window.
+        """
+        needles = self.patchset.needles
+        delta = new_end - old_end
+        kept = []
+        for pos, index in self.matches:
+            if pos + len(needles[index]) <= start:
+                kept.append((pos, index))
+            elif pos >= old_end:
+                kept.append((pos + delta, index))
+
+        window_start = max(0, start - self.patchset.longest + 1)
+        window_end = min(len(content), new_end + self.patchset.longest - 1)
+        touched = set()
+        for pos, index in self.patchset.automaton.finditer(content, window_start, window_end):
+            # Anything ending before the edit or starting after it is already indexed
+            if pos + len(needles[index]) > start and pos < new_end:
+                bisect.insort(kept, (pos, index))
+                touched.add(index)
+        self.matches = kept
+        return touched
+
+
+class WatchedFile:
+    def __init__(self, path, patchsets):
+        self.path = path
+        self.content = self.read()
+        self.mtime = os.stat(path).st_mtime_ns
+        self.indexes = [AnchorIndex(patchset, self.content) for patchset in patchsets]
+
+    def read(self):
+        with open(self.path, 'r') as f:
+            return f.read()
+
+    def changed_on_disk(self):
+        mtime = os.stat(self.path).st_mtime_ns
+        if mtime == self.mtime:
+            return False
+        self.mtime = mtime
+        return True
+
+    def edit(self, content):
+        """Update every anchor index for new content; returns touched needles per PatchSet."""
+        prefix = common_prefix(self.content, content)
+        limit = min(len(self.content), len(content)) - prefix
+        suffix = common_suffix(self.content, content, limit)
+        start, old_end, new_end = prefix, len(self.content) - suffix, len(content) - suffix
+        self.content = content
+        if start == old_end == new_end:
+            return [set() for _ in self.indexes]
+        return [index.update(content, start, old_end, new_end) for index in self.indexes]
+
+    def apply(self, touched=None):
+        """Apply the patches (all of them, or only those with touched anchors)."""
+        applied = {}
+        for i, index in enumerate(self.indexes):
+            patchset = index.patchset
+            edits = patchset.select(index.scan(), self.content)
+            if touched is not None:
+                needles = {patchset.needles[n] for n in touched[i]}
+                edits = [edit for edit in edits if edit[2].search in needles]
+            if not edits:
+                continue
+            for name, hits in tally(patchset.patches, edits).items():
+                if hits:
+                    applied[name] = applied.get(name, 0) + hits
+            # Later PatchSets see this one's edits, as if the units ran in sequence
+            new_touched = self.edit(splice(self.content, edits))
+            if touched is not None:
+                for later in range(i + 1, len(touched)):
+                    touched[later] |= new_touched[later]
+        return applied
+
+    def write(self):
+        with open(self.path, 'w') as f:
+            f.write(self.content)
+        self.mtime = os.stat(self.path).st_mtime_ns
+
+
+def defines_targets(unit):
+    """True if the script assigns TARGETS at module level.
+
+    Checked on the source, without running it: line-based scripts edit
+    their files as soon as they are executed.
+    """
+    with open(unit, 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read(), unit)
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            names = [target.id for target in node.targets if isinstance(target, ast.Name)]
+        elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+            names = [node.target.id]
+        else:
+            continue
+        if 'TARGETS' in names:
+            return True
+    return False
+
+
+def load_targets(units):
+    """Collect {path: [PatchSet, ...]} from the TARGETS of each unit, in order."""
+    targets = {}
+    for unit in units:
+        if not defines_targets(unit):
+            print(f"⚠️  {unit} has no TARGETS, skipping (only PatchSet-based fixes can be watched)")
+            continue
+        module = runpy.run_path(unit, run_name='patch_unit')
+        for path, patchset in module['TARGETS'].items():
+            targets.setdefault(path, []).append(patchset)
+    return targets
+
+
+def report(path, applied, started):
+    if not applied:
+        return
+    elapsed = (time.perf_counter() - started) * 1000
+    names = ', '.join(f"{name} x{hits}" if hits > 1 else name for name, hits in applied.items())
+    print(f"🔧 {path}: {names} ({elapsed:.1f} ms)")
+
+
+def changed_files(files, notifier, interval):
+    """Block until at least one watched file changes and return those files."""
+    if notifier is not None:
+        inotify, directories = notifier
+        paths = set()
+        for event in inotify.read():
+            paths.add(os.path.join(directories[event.wd], event.name))
+        return [f for f in files if os.path.abspath(f.path) in paths and f.changed_on_disk()]
+    time.sleep(interval)
+    return [f for f in files if f.changed_on_disk()]
+
+
+def watch(files, interval=0.2):
+    notifier = None
+    if inotify_simple is not None:
+        inotify = inotify_simple.INotify()
+        directories = {}
+        # Editors often save via rename, so watch the directories, not the files
+        flags = inotify_simple.flags.CLOSE_WRITE | inotify_simple.flags.MOVED_TO
+        for directory in {os.path.dirname(os.path.abspath(f.path)) for f in files}:
+            directories[inotify.add_watch(directory, flags)] = directory
+        notifier = (inotify, directories)
+
+    print(f"👀 Watching {len(files)} file(s) ({'inotify' if notifier else 'polling'}), Ctrl+C to stop")
+    while True:
+        for watched in changed_files(files, notifier, interval):
+            started = time.perf_counter()
+            touched = watched.edit(watched.read())
+            if not any(touched):
+                continue
+            applied = watched.apply(touched)
+            if applied:
+                watched.write()
+            report(watched.path, applied, started)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Re-apply PatchSet fixes to edited regions on every save.")
+    parser.add_argument('units', nargs='+', help="Fix scripts that define TARGETS")
+    parser.add_argument('--interval', type=float, default=0.2, help="Polling interval in seconds without inotify")
+    args = parser.parse_args(argv)
+
+    targets = load_targets(args.units)
+    if not targets:
+        print("Nothing to watch")
+        return 1
+
+    files = []
+    for path, patchsets in targets.items():
+        started = time.perf_counter()
+        watched = WatchedFile(path, patchsets)
+        applied = watched.apply()
+        if applied:
+            watched.write()
+        report(path, applied, started)
+        files.append(watched)
+
+    try:
+        watch(files, args.interval)
+    except KeyboardInterrupt:
+        print("\nStopped")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
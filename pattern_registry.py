@@ -0,0 +1,198 @@
+"""
+Registry of precompiled patch patterns for migrate_app.py and friends.
+
+    PATTERNS = PatternRegistry()
+    state = PATTERNS.register('state section', old_state_section, re.DOTALL)
+    content = state.sub(new_state_section, content)
+    PATTERNS.save()
+
+Each pattern is analysed once and the analysis is pickled next to the
+scripts (.pattern_cache.pickle), so later runs skip it:
+
+* Patterns that are pure literals once parsed (e.g. a block run through
+  re.escape by hand) become LiteralAnchors, which search with str.find /
+  str.replace and never touch the regex engine.
+* Patterns with nested unbounded quantifiers, or several unbounded
+  wildcards under DOTALL, raise a BacktrackingWarning because they can
+  backtrack catastrophically on a large App.tsx.
+
+Python's re rebuilds compiled patterns when they are unpickled, so the
+cache stores the analysis and the pattern source, not re's internal code.
+"""
+import os
+import pickle
+import re
+import sys
+import warnings
+
+try:
+    from re import _parser as sre_parse
+except ImportError:
+    import sre_parse
+
+from patch_engine import Patch
+
+CACHE_PATH = '.pattern_cache.pickle'
+CACHE_VERSION = (1, sys.version_info[:2])
+
+
+class BacktrackingWarning(UserWarning):
+    pass
+
+
+class LiteralMatch:
+    def __init__(self, string, start, text):
+        self.string = string
+        self._start = start
+        self._text = text
+
+    def start(self):
+        return self._start
+
+    def end(self):
+        return self._start + len(self._text)
+
+    def span(self):
+        return self.start(), self.end()
+
+    def group(self, index=0):
+        if index:
+            raise IndexError("no such group")
+        return self._text
+
+
+class LiteralAnchor:
+    """A pattern with no regex syntax left, matched with plain string search."""
+
+    def __init__(self, name, text, source=None, flags=0):
+        self.name = name
+        self.text = text
+        self.pattern = source if source is not None else re.escape(text)
+        self.flags = flags
+
+    def __repr__(self):
+        return f"LiteralAnchor({self.name!r})"
+
+    def search(self, string, pos=0):
+        start = string.find(self.text, pos)
+        return None if start < 0 else LiteralMatch(string, start, self.text)
+
+    def subn(self, repl, string, count=0):
+        if callable(repl) or '\\' in repl:
+            # Templates with group references or escapes need re's expansion
+            return re.compile(self.pattern, self.flags).subn(repl, string, count)
+        hits = string.count(self.text)
+        if count:
+            hits = min(hits, count)
+        return string.replace(self.text, repl, count or -1), hits
+
+    def sub(self, repl, string, count=0):
+        return self.subn(repl, string, count)[0]
+
+    def patch(self, replace, **kwargs):
+        """The same edit as a patch_engine.Patch, for single-pass PatchSets."""
+        return Patch(self.text, replace, name=self.name, **kwargs)
+
+
+def literal_text(parsed, flags):
+    """The plain string a parsed pattern matches, or None if it is not a literal."""
+    if flags & re.IGNORECASE or not len(parsed):
+        return None
+    chars = []
+    for op, av in parsed:
+        if op is not sre_parse.LITERAL:
+            return None
+        chars.append(chr(av))
+    return ''.join(chars)
+
+
+def backtracking_risks(parsed, flags):
+    risks = []
+    dotall = bool(flags & re.DOTALL)
+    wildcards = 0
+
+    def walk(items, in_unbounded):
+        nonlocal wildcards
+        for op, av in items:
+            if op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT):
+                low, high, body = av
+                unbounded = high == sre_parse.MAXREPEAT
+                if unbounded and in_unbounded:
+                    risks.append("nested unbounded quantifiers")
+                if unbounded and dotall and len(body) == 1 and body[0][0] is sre_parse.ANY:
+                    wildcards += 1
+                walk(body, in_unbounded or unbounded)
+            elif op is sre_parse.SUBPATTERN:
+                walk(av[-1], in_unbounded)
+            elif op is sre_parse.BRANCH:
+                for branch in av[1]:
+                    walk(branch, in_unbounded)
+
+    walk(parsed, False)
+    if wildcards > 1:
+        risks.append(f"{wildcards} unbounded wildcards under DOTALL")
+    return risks
+
+
+def analyse(pattern, flags):
+    parsed = sre_parse.parse(pattern, flags)
+    text = literal_text(parsed, flags)
+    if text is not None:
+        return 'literal', text
+    return 'regex', backtracking_risks(parsed, flags)
+
+
+class PatternRegistry:
+    def __init__(self, cache_path=CACHE_PATH):
+        self.cache_path = cache_path
+        self.patterns = {}
+        self.analysis = {}
+        self.dirty = False
+        self.load()
+
+    def load(self):
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return
+        try:
+            with open(self.cache_path, 'rb') as f:
+                version, analysis = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+            return
+        if version == CACHE_VERSION:
+            self.analysis = analysis
+
+    def save(self):
+        if not self.cache_path or not self.dirty:
+            return
+        tmp_path = self.cache_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((CACHE_VERSION, self.analysis), f)
+        os.replace(tmp_path, self.cache_path)
+        self.dirty = False
+
+    def register(self, name, pattern, flags=0):
+        key = (pattern, flags)
+        if key not in self.analysis:
+            self.analysis[key] = analyse(pattern, flags)
+            self.dirty = True
+        kind, detail = self.analysis[key]
+
+        if kind == 'literal':
+            compiled = LiteralAnchor(name, detail, pattern, flags)
+        else:
+            for risk in detail:
+                warnings.warn(f"Pattern {name!r} may backtrack catastrophically: {risk}",
+                              BacktrackingWarning, stacklevel=2)
+            compiled = re.compile(pattern, flags)
+
+        self.patterns[name] = compiled
+        return compiled
+
+    def literal(self, name, text):
+        """Register text that should be matched verbatim (no escaping needed)."""
+        anchor = LiteralAnchor(name, text)
+        self.patterns[name] = anchor
+        return anchor
+
+    def __getitem__(self, name):
+        return self.patterns[name]
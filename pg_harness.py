@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+"""
+Local Postgres harness for the Supabase schema: boot, seed, load, report.
+
+The schema and RPCs in supabase/ only run against a live Supabase project
+because they lean on auth.users, auth.uid(), auth.jwt() and the
+anon/authenticated roles. This harness installs small shims for those into
+a plain local Postgres (13+), applies the schema files in order, seeds
+N projects x M experiments and runs a concurrent read/write mix as real
+project members, with RLS enforced, reporting latency per query shape.
+
+    python pg_harness.py --dsn postgresql://postgres@localhost/growth --reset \\
+        --projects 20 --experiments 500 --workers 8 --duration 30
+
+    python pg_harness.py --initdb --projects 5 --experiments 200   # throwaway cluster
+
+--initdb needs initdb/pg_ctl on PATH and starts a temporary cluster that is
+removed afterwards. Requests run the way PostgREST runs them: in a
+transaction with role `authenticated` and request.jwt.claim.sub set to the
+acting user, so every query pays its real RLS cost.
+
+Needs psycopg 3 (pip install "psycopg[binary]").
+"""
+import argparse
+import contextlib
+import json
+import os
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+try:
+    import psycopg
+except ImportError:
+    psycopg = None
+
+from experiment_pages import detail_query, page_query
+from import_project import ProjectGraph, load
+
+SCHEMA_FILES = (
+    'supabase/migration.sql',
+    'supabase/hotfix.sql',
+    'supabase/hotfix_v2.sql',
+    'supabase/fix_duplicate_rpc.sql',
+    'supabase/hotfix_security.sql',
+    'supabase/keyset_index.sql',
+)
+
+# Just enough of Supabase's auth schema for the migrations and policies
+AUTH_SHIM = """
+DO $$ BEGIN CREATE ROLE anon NOLOGIN; EXCEPTION WHEN duplicate_object THEN NULL; END $$;
+DO $$ BEGIN CREATE ROLE authenticated NOLOGIN; EXCEPTION WHEN duplicate_object THEN NULL; END $$;
+DO $$ BEGIN CREATE ROLE service_role NOLOGIN BYPASSRLS; EXCEPTION WHEN duplicate_object THEN NULL; END $$;
+
+CREATE SCHEMA IF NOT EXISTS auth;
+
+CREATE TABLE IF NOT EXISTS auth.users (
+  id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+  email text,
+  raw_user_meta_data jsonb DEFAULT '{}'::jsonb,
+  created_at timestamptz DEFAULT now()
+);
+
+CREATE OR REPLACE FUNCTION auth.uid() RETURNS uuid LANGUAGE sql STABLE AS $$
+  SELECT nullif(current_setting('request.jwt.claim.sub', true), '')::uuid
+$$;
+
+CREATE OR REPLACE FUNCTION auth.role() RETURNS text LANGUAGE sql STABLE AS $$
+  SELECT nullif(current_setting('request.jwt.claim.role', true), '')
+$$;
+
+CREATE OR REPLACE FUNCTION auth.jwt() RETURNS jsonb LANGUAGE sql STABLE AS $$
+  SELECT coalesce(nullif(current_setting('request.jwt.claims', true), ''), '{}')::jsonb
+$$;
+
+GRANT USAGE ON SCHEMA auth TO anon, authenticated, service_role;
+GRANT SELECT ON auth.users TO authenticated, service_role;
+GRANT EXECUTE ON ALL FUNCTIONS IN SCHEMA auth TO anon, authenticated, service_role;
+"""
+
+GRANTS = """
+GRANT USAGE ON SCHEMA public TO anon, authenticated, service_role;
+GRANT ALL ON ALL TABLES IN SCHEMA public TO authenticated, service_role;
+GRANT EXECUTE ON ALL FUNCTIONS IN SCHEMA public TO authenticated, service_role;
+"""
+
+RESET = """
+DROP SCHEMA IF EXISTS auth CASCADE;
+DROP SCHEMA IF EXISTS public CASCADE;
+CREATE SCHEMA public;
+"""
+
+# laboratorioPolancoData-style vocabulary for generated experiments
+STATUSES = ('Idea', 'Prioritized', 'Building', 'Live Testing', 'Analysis',
+            'Finished - Winner', 'Finished - Loser', 'Finished - Inconclusive')
+FUNNEL_STAGES = ('Acquisition', 'Activation', 'Retention', 'Referral', 'Revenue')
+TOPICS = ('landing page', 'email de bienvenida', 'checkout', 'precios', 'onboarding',
+          'programa de referidos', 'contenido SEO', 'notificaciones push', 'prueba gratuita')
+AUDIENCES = ('atletas de alto rendimiento', 'nuevos usuarios', 'clientes recurrentes',
+             'visitantes orgánicos', 'usuarios inactivos')
+OUTCOMES = ('la tasa de conversión', 'la retención a 30 días', 'el ticket promedio',
+            'el tráfico orgánico calificado', 'las recomendaciones')
+LABELS = ('SEO', 'Pricing', 'Email', 'Mobile', 'UX', 'Paid', 'Contenido')
+OWNERS = ('Andrés García', 'Alice Smith', 'María López', 'Carlos Ruiz', 'Sofía Méndez')
+
+
+# -- Local cluster -------------------------------------------------------------
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+@contextlib.contextmanager
+def local_cluster():
+    """Temporary Postgres cluster; yields its DSN and removes it afterwards."""
+    for tool in ('initdb', 'pg_ctl'):
+        if shutil.which(tool) is None:
+            raise RuntimeError(f"{tool} not found on PATH")
+    directory = tempfile.mkdtemp(prefix='pg-harness-')
+    data, port = os.path.join(directory, 'data'), free_port()
+    try:
+        subprocess.run(['initdb', '-D', data, '-U', 'postgres', '--auth=trust'],
+                       check=True, stdout=subprocess.DEVNULL)
+        subprocess.run(['pg_ctl', '-D', data, '-l', os.path.join(directory, 'log'), '-w',
+                        '-o', f"-p {port} -k {directory} -c listen_addresses=''", 'start'],
+                       check=True, stdout=subprocess.DEVNULL)
+        try:
+            yield f"host={directory} port={port} user=postgres dbname=postgres"
+        finally:
+            subprocess.run(['pg_ctl', '-D', data, '-m', 'fast', 'stop'], stdout=subprocess.DEVNULL)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+# -- Schema --------------------------------------------------------------------
+
+def boot(conn, reset=False):
+    """Install the auth shims and every schema file (autocommit connection)."""
+    if reset:
+        conn.execute(RESET)
+    conn.execute(AUTH_SHIM)
+    for path in SCHEMA_FILES:
+        with open(path, 'r') as f:
+            conn.execute(f.read())
+        print(f"   applied {path}")
+    conn.execute(GRANTS)
+
+
+# -- Seeding -------------------------------------------------------------------
+
+def synthetic_project(number, experiments, rng):
+    """A Project JSON (src/types.ts shape) with Spanish growth-experiment text."""
+    objectives = [{'id': f"obj-{i}", 'title': f"Objetivo {i + 1}: crecer {rng.choice(OUTCOMES)}",
+                   'status': 'Active', 'progress': rng.randint(0, 100)} for i in range(3)]
+    strategies = [{'id': f"strat-{i}", 'title': f"Estrategia de {rng.choice(TOPICS)}",
+                   'parentObjectiveId': objectives[i % len(objectives)]['id']} for i in range(6)]
+    rows = []
+    for i in range(experiments):
+        topic, audience, outcome = rng.choice(TOPICS), rng.choice(AUDIENCES), rng.choice(OUTCOMES)
+        impact, confidence, ease = (rng.randint(1, 10) for _ in range(3))
+        status = rng.choice(STATUSES)
+        owner = rng.choice(OWNERS)
+        rows.append({
+            'id': f"exp-{i}",
+            'title': f"{topic.capitalize()} para {audience}",
+            'status': status,
+            'owner': {'name': owner, 'avatar': f"https://i.pravatar.cc/150?u={owner.split()[0].lower()}"},
+            'hypothesis': (f"Si rediseñamos {topic} para {audience}, entonces {outcome} aumentará "
+                           f"{rng.randint(5, 40)}% porque reducimos la fricción en la decisión."),
+            'impact': impact, 'confidence': confidence, 'ease': ease,
+            'iceScore': impact * confidence * ease,
+            'funnelStage': rng.choice(FUNNEL_STAGES),
+            'northStarMetric': 'Ingresos Mensuales',
+            'linkedStrategyId': rng.choice(strategies)['id'],
+            'labels': rng.sample(LABELS, rng.randint(0, 3)) or None,
+            'keyLearnings': f"Aprendimos que {outcome} responde a {topic}." if status.startswith('Finished') else None,
+        })
+    return {
+        'metadata': {'id': f"project-{number}", 'name': f"Laboratorio {number + 1}"},
+        'northStar': {'name': 'Ingresos Mensuales', 'currentValue': rng.randint(0, 50000),
+                      'targetValue': 100000, 'unit': '$', 'type': 'currency'},
+        'objectives': objectives, 'strategies': strategies, 'experiments': rows,
+    }
+
+
+def seed(conn, projects, experiments, members, seed_value=0):
+    """Create users, projects and memberships; returns {user id: [project ids]}."""
+    rng = random.Random(seed_value)
+    users = [row[0] for row in conn.execute(
+        "INSERT INTO auth.users (email) SELECT 'user' || g || '@example.com' "
+        "FROM generate_series(1, %s) g RETURNING id::text", [max(members, projects)]).fetchall()]
+    graphs = [ProjectGraph(synthetic_project(i, experiments, rng), users[i % len(users)]) for i in range(projects)]
+    load(conn, graphs)
+
+    access = {user: [] for user in users}
+    with conn.cursor() as cur:
+        for graph in graphs:
+            owner = graph.members[0][1]
+            access[owner].append(graph.project_id)
+            for user in rng.sample([u for u in users if u != owner], min(members - 1, len(users) - 1)):
+                cur.execute("INSERT INTO project_members (project_id, user_id, role) VALUES (%s, %s, 'editor')",
+                            [graph.project_id, user])
+                access[user].append(graph.project_id)
+    conn.commit()
+    return {user: projects for user, projects in access.items() if projects}
+
+
+def experiment_ids(conn):
+    ids = {}
+    for exp_id, project_id in conn.execute("SELECT id::text, project_id::text FROM experiments"):
+        ids.setdefault(project_id, []).append(exp_id)
+    return ids
+
+
+# -- Query shapes --------------------------------------------------------------
+
+def q_projects(cur, ctx):
+    cur.execute("SELECT * FROM projects ORDER BY created_at")
+    cur.fetchall()
+
+
+def q_experiments_all(cur, ctx):
+    cur.execute("SELECT * FROM experiments WHERE project_id = %s ORDER BY ice_score DESC", [ctx.project])
+    cur.fetchall()
+
+
+def q_experiments_page(cur, ctx):
+    cur.execute(*page_query(ctx.project))
+    cur.fetchall()
+
+
+def q_experiment_detail(cur, ctx):
+    cur.execute(*detail_query([ctx.experiment]))
+    cur.fetchall()
+
+
+def q_update_ice(cur, ctx):
+    impact, confidence, ease = (ctx.rng.randint(1, 10) for _ in range(3))
+    cur.execute("UPDATE experiments SET impact = %s, confidence = %s, ease = %s, ice_score = %s WHERE id = %s",
+                [impact, confidence, ease, impact * confidence * ease, ctx.experiment])
+
+
+def q_insert_experiment(cur, ctx):
+    cur.execute("INSERT INTO experiments (project_id, title, status) VALUES (%s, %s, 'Idea') RETURNING id::text",
+                [ctx.project, f"Idea rápida {ctx.rng.randint(1, 10 ** 6)}"])
+    ctx.created.append(cur.fetchone()[0])
+
+
+def q_delete_experiment(cur, ctx):
+    if ctx.created:
+        cur.execute("DELETE FROM experiments WHERE id = %s", [ctx.created.pop()])
+
+
+SHAPES = {
+    'projects': q_projects,
+    'experiments_all': q_experiments_all,
+    'experiments_page': q_experiments_page,
+    'experiment_detail': q_experiment_detail,
+    'update_ice': q_update_ice,
+    'insert_experiment': q_insert_experiment,
+    'delete_experiment': q_delete_experiment,
+}
+
+PROFILES = {
+    'read-heavy': {'projects': 10, 'experiments_all': 30, 'experiments_page': 30, 'experiment_detail': 15,
+                   'update_ice': 10, 'insert_experiment': 3, 'delete_experiment': 2},
+    'write-heavy': {'projects': 5, 'experiments_all': 10, 'experiments_page': 15, 'experiment_detail': 10,
+                    'update_ice': 40, 'insert_experiment': 12, 'delete_experiment': 8},
+}
+
+
+# -- Load ----------------------------------------------------------------------
+
+class Context:
+    """What the current request acts on."""
+
+    def __init__(self, rng):
+        self.rng = rng
+        self.user = None
+        self.project = None
+        self.experiment = None
+        self.created = []
+
+
+def as_user(cur, user):
+    cur.execute("SELECT set_config('request.jwt.claim.sub', %s, true), set_config('role', 'authenticated', true)",
+                [user])
+
+
+def worker(dsn, access, ids, weights, deadline, timings, errors, seed_value):
+    rng = random.Random(seed_value)
+    ctx = Context(rng)
+    names, cumulative = list(weights), list(weights.values())
+    users = list(access)
+    with psycopg.connect(dsn) as conn:
+        while time.monotonic() < deadline:
+            name = rng.choices(names, cumulative)[0]
+            ctx.user = rng.choice(users)
+            ctx.project = rng.choice(access[ctx.user])
+            ctx.experiment = rng.choice(ids.get(ctx.project) or [None])
+            started = time.perf_counter()
+            try:
+                with conn.transaction(), conn.cursor() as cur:
+                    as_user(cur, ctx.user)
+                    SHAPES[name](cur, ctx)
+            except psycopg.Error as exc:
+                errors[name] = errors.get(name, 0) + 1
+                errors.setdefault('last', {})[name] = str(exc).splitlines()[0]
+                continue
+            timings.setdefault(name, []).append(time.perf_counter() - started)
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return None
+    rank = max(0, min(len(sorted_values) - 1, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def run_load(dsn, access, ids, profile, workers, duration):
+    deadline = time.monotonic() + duration
+    results = [({}, {}) for _ in range(workers)]
+    threads = [threading.Thread(target=worker, args=(dsn, access, ids, PROFILES[profile], deadline,
+                                                      timings, errors, i))
+               for i, (timings, errors) in enumerate(results)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    report = {}
+    for name in SHAPES:
+        samples = sorted(t for timings, _ in results for t in timings.get(name, ()))
+        failed = sum(errors.get(name, 0) for _, errors in results)
+        if not samples and not failed:
+            continue
+        report[name] = {
+            'count': len(samples),
+            'errors': failed,
+            'p50_ms': percentile(samples, 0.50) * 1000 if samples else None,
+            'p99_ms': percentile(samples, 0.99) * 1000 if samples else None,
+            'max_ms': samples[-1] * 1000 if samples else None,
+            'per_second': len(samples) / duration,
+        }
+    last_errors = {}
+    for _, errors in results:
+        last_errors.update(errors.get('last', {}))
+    return report, last_errors
+
+
+def print_report(report):
+    print(f"\n{'shape':<20} {'count':>7} {'err':>5} {'p50 ms':>9} {'p99 ms':>9} {'max ms':>9} {'ops/s':>8}")
+    for name, row in report.items():
+        fmt = lambda v: f"{v:9.2f}" if v is not None else f"{'-':>9}"
+        print(f"{name:<20} {row['count']:>7} {row['errors']:>5} {fmt(row['p50_ms'])} "
+              f"{fmt(row['p99_ms'])} {fmt(row['max_ms'])} {row['per_second']:8.1f}")
+
+
+def run(dsn, args):
+    with psycopg.connect(dsn, autocommit=True) as conn:
+        print("🔧 Installing auth shims and schema")
+        boot(conn, reset=args.reset)
+    with psycopg.connect(dsn) as conn:
+        started = time.perf_counter()
+        access = seed(conn, args.projects, args.experiments, args.members)
+        ids = experiment_ids(conn)
+        print(f"🌱 Seeded {args.projects} projects x {args.experiments} experiments, "
+              f"{len(access)} users in {time.perf_counter() - started:.1f}s")
+
+    print(f"🏃 {args.workers} workers, {args.profile} profile, {args.duration}s")
+    report, last_errors = run_load(dsn, access, ids, args.profile, args.workers, args.duration)
+    print_report(report)
+    for name, message in last_errors.items():
+        print(f"   ⚠️  {name}: {message}")
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'profile': args.profile, 'workers': args.workers, 'duration': args.duration,
+                       'projects': args.projects, 'experiments': args.experiments, 'shapes': report}, f, indent=2)
+        print(f"\n📄 Report written to {args.output}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Boot the Supabase schema locally, seed it and load-test it.")
+    parser.add_argument('--dsn', help="Local Postgres to use (superuser)")
+    parser.add_argument('--initdb', action='store_true', help="Start a throwaway cluster instead of --dsn")
+    parser.add_argument('--reset', action='store_true', help="Drop the public and auth schemas first")
+    parser.add_argument('--projects', type=int, default=10)
+    parser.add_argument('--experiments', type=int, default=200, help="Experiments per project")
+    parser.add_argument('--members', type=int, default=3, help="Members per project (owner included)")
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--duration', type=float, default=10.0, help="Seconds of load")
+    parser.add_argument('--profile', choices=sorted(PROFILES), default='read-heavy')
+    parser.add_argument('--output', help="Write the latency report as JSON")
+    args = parser.parse_args(argv)
+
+    if psycopg is None:
+        print("❌ psycopg is not installed: pip install \"psycopg[binary]\"")
+        return 1
+    if args.initdb:
+        with local_cluster() as dsn:
+            run(dsn, args)
+    elif args.dsn:
+        run(args.dsn, args)
+    else:
+        parser.error("Pass --dsn or --initdb")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Per-project rollups for the portfolio screen, maintained from change events.
+
+PortfolioView computes totalExperiments / totalActive with reduce + filter
+over every project's experiments, each ProjectCard filters them again, and
+fetchProjects loads every objective, strategy and experiment just to draw
+the grid. PortfolioRollups keeps one small summary per project instead:
+
+    experiment counts by status, total / active / finished,
+    win rate, average ICE, objective and strategy counts,
+    North Star value, target and progress.
+
+Each experiment's last contribution (status, ice_score) is remembered, so
+an insert, update or delete event adjusts the counters by the difference.
+No child rows are ever re-read.
+
+    rollups = PortfolioRollups.from_projects(projects)   # Project JSON, once
+    rollups.apply_event(payload)                         # Supabase realtime payload
+    rollups.summaries()                                  # one row per project
+
+    python portfolio_rollups.py portfolio.json --output portfolio_summary.json
+"""
+import argparse
+import json
+import sys
+from collections import Counter
+
+WIN_STATUS = 'Finished - Winner'
+FINISHED_PREFIX = 'Finished'
+
+
+class ProjectRollup:
+    """Running counters for one project."""
+
+    __slots__ = ('project_id', 'name', 'nsm_name', 'nsm_value', 'nsm_target', 'nsm_unit',
+                 'by_status', 'ice_total', 'objectives', 'strategies')
+
+    def __init__(self, project_id):
+        self.project_id = project_id
+        self.name = None
+        self.nsm_name = None
+        self.nsm_value = 0
+        self.nsm_target = 0
+        self.nsm_unit = ''
+        self.by_status = Counter()
+        self.ice_total = 0
+        self.objectives = 0
+        self.strategies = 0
+
+    @property
+    def total(self):
+        return sum(self.by_status.values())
+
+    @property
+    def finished(self):
+        return sum(count for status, count in self.by_status.items() if status.startswith(FINISHED_PREFIX))
+
+    def summary(self):
+        total, finished = self.total, self.finished
+        return {
+            'project_id': self.project_id,
+            'name': self.name,
+            'experiments': total,
+            'active': total - finished,
+            'finished': finished,
+            'by_status': {status: count for status, count in self.by_status.items() if count},
+            'win_rate': self.by_status[WIN_STATUS] / finished if finished else None,
+            'average_ice': self.ice_total / total if total else None,
+            'objectives': self.objectives,
+            'strategies': self.strategies,
+            'north_star': {
+                'name': self.nsm_name,
+                'value': self.nsm_value,
+                'target': self.nsm_target,
+                'unit': self.nsm_unit,
+                'progress': self.nsm_value / self.nsm_target if self.nsm_target else None,
+            },
+        }
+
+
+class PortfolioRollups:
+    """Rollups for every project, updated incrementally from row changes."""
+
+    def __init__(self):
+        self.projects = {}        # project id -> ProjectRollup
+        self.experiments = {}     # experiment id -> (project id, status, ice score)
+        self.children = {}        # (table, id) -> project id, for objectives/strategies
+
+    @classmethod
+    def from_projects(cls, projects):
+        """Build from Project JSON (src/types.ts shape)."""
+        rollups = cls()
+        for project in projects:
+            project_id = project['metadata']['id']
+            north_star = project.get('northStar') or {}
+            rollups.apply('projects', 'INSERT', project_id, {
+                'name': project['metadata']['name'],
+                'nsm_name': north_star.get('name'),
+                'nsm_value': north_star.get('currentValue', 0),
+                'nsm_target': north_star.get('targetValue', 0),
+                'nsm_unit': north_star.get('unit', ''),
+            })
+            for table, rows in (('objectives', project.get('objectives')), ('strategies', project.get('strategies'))):
+                for row in rows or []:
+                    rollups.apply(table, 'INSERT', row['id'], {'project_id': project_id})
+            for exp in project.get('experiments') or []:
+                rollups.apply('experiments', 'INSERT', exp['id'], {
+                    'project_id': project_id, 'status': exp['status'], 'ice_score': exp.get('iceScore') or 125,
+                })
+        return rollups
+
+    def rollup(self, project_id):
+        rollup = self.projects.get(project_id)
+        if rollup is None:
+            rollup = self.projects[project_id] = ProjectRollup(project_id)
+        return rollup
+
+    # -- Updates ---------------------------------------------------------------
+
+    def apply_event(self, event):
+        """Apply one Supabase realtime payload ({'table', 'eventType', 'new', 'old'})."""
+        new, old = event.get('new') or {}, event.get('old') or {}
+        key = new.get('id', old.get('id'))
+        self.apply(event['table'], event['eventType'].upper(), key, new or old)
+
+    def apply_patches(self, project_id, patches):
+        """Apply change_feed patches published for one project."""
+        for patch in patches:
+            values = dict(patch.get('values') or {})
+            values.setdefault('project_id', project_id)
+            self.apply(patch['table'], patch['op'].upper(), patch['id'], values)
+
+    def apply(self, table, op, key, values):
+        if table == 'projects':
+            self.apply_project(op, key, values)
+        elif table == 'experiments':
+            self.apply_experiment(op, key, values)
+        elif table in ('objectives', 'strategies'):
+            self.apply_child(table, op, key, values)
+
+    def apply_project(self, op, key, values):
+        if op == 'DELETE':
+            self.projects.pop(key, None)
+            # Forget its rows so later events for them can't bring the project back
+            self.experiments = {exp_id: row for exp_id, row in self.experiments.items() if row[0] != key}
+            self.children = {slot: project_id for slot, project_id in self.children.items() if project_id != key}
+            return
+        rollup = self.rollup(key)
+        for column in ('name', 'nsm_name', 'nsm_value', 'nsm_target', 'nsm_unit'):
+            if column in values:
+                setattr(rollup, column, values[column])
+
+    def apply_experiment(self, op, key, values):
+        previous = self.experiments.pop(key, None)
+        if previous is not None:
+            project_id, status, ice = previous
+            rollup = self.projects.get(project_id)
+            if rollup is not None:
+                rollup.by_status[status] -= 1
+                rollup.ice_total -= ice
+        else:
+            project_id, status, ice = None, None, None
+        if op == 'DELETE':
+            return
+        # Updates may carry only the changed columns; keep the rest
+        project_id = values.get('project_id', project_id)
+        if project_id is None:
+            return          # partial update for a row we never saw; the next full row places it
+        # A row seen without a status counts as '' rather than None
+        status = str(values.get('status', status) or '')
+        ice = values.get('ice_score', ice)
+        if ice is None:
+            ice = 125
+        self.experiments[key] = (project_id, status, ice)
+        rollup = self.rollup(project_id)
+        rollup.by_status[status] += 1
+        rollup.ice_total += ice
+
+    def apply_child(self, table, op, key, values):
+        slot = (table, key)
+        project_id = self.children.pop(slot, None)
+        if project_id is not None and project_id in self.projects:
+            setattr(self.projects[project_id], table, getattr(self.projects[project_id], table) - 1)
+        if op == 'DELETE':
+            return
+        project_id = values.get('project_id', project_id)
+        if project_id is None:
+            return
+        self.children[slot] = project_id
+        rollup = self.rollup(project_id)
+        setattr(rollup, table, getattr(rollup, table) + 1)
+
+    def consume(self, inbox, stop=None):
+        """Apply raw change events from a queue until a None sentinel or stop is set.
+
+        With change_feed's LocalBroker: rollups.consume(broker.subscribe(CHANGES_TOPIC)).
+        """
+        while stop is None or not stop.is_set():
+            event = inbox.get()
+            if event is None:
+                break
+            self.apply_event(event)
+
+    # -- Reads -----------------------------------------------------------------
+
+    def summaries(self):
+        return [rollup.summary() for rollup in self.projects.values()]
+
+    def totals(self):
+        """Portfolio header figures (totalExperiments / totalActive in PortfolioView)."""
+        total = sum(rollup.total for rollup in self.projects.values())
+        finished = sum(rollup.finished for rollup in self.projects.values())
+        return {'projects': len(self.projects), 'experiments': total, 'active': total - finished}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Materialize per-project portfolio rollups.")
+    parser.add_argument('source', help="Project JSON (one Project or a list)")
+    parser.add_argument('--output', help="Write the summaries as JSON here instead of printing")
+    args = parser.parse_args(argv)
+
+    with open(args.source, 'r') as f:
+        data = json.load(f)
+    rollups = PortfolioRollups.from_projects(data if isinstance(data, list) else [data])
+    report = {'totals': rollups.totals(), 'projects': rollups.summaries()}
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"📊 {len(report['projects'])} project summaries written to {args.output}")
+    else:
+        print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+RLS policy cost profiler for the project_members-gated tables.
+
+Every read of projects, objectives, strategies and experiments is filtered
+by a policy that checks project_members, and those policies have been
+rewritten several times (supabase/migration.sql, FIX_RLS_RECURSION.sql,
+SUPABASE_FIX_RLS.sql, supabase/hotfix_security.sql). This tool measures
+what each variant costs on a local database:
+
+* every representative query is run under EXPLAIN (ANALYZE, FORMAT JSON)
+  as a real member (role authenticated, request.jwt.claim.sub set), once
+  per policy variant and once with RLS bypassed as the baseline;
+* variants are installed inside the measuring transaction and rolled back,
+  so the database keeps whatever policies it had;
+* plans are scanned for per-row SubPlans, per-row calls of SECURITY
+  DEFINER helpers, per-row auth.uid() evaluation and large filtered
+  sequential scans; pg_policies is scanned for self-referencing policies
+  (the 42P17 infinite recursion the fix files were written for);
+* each finding comes with the rewrite or index that removes it.
+
+    python rls_profiler.py --initdb --seed-projects 20 --experiments 500
+    python rls_profiler.py --dsn postgresql://postgres@localhost/growth --repeat 5 --plans plans/
+
+Use a superuser DSN with the schema loaded (pg_harness.py does both).
+Needs psycopg 3 (pip install "psycopg[binary]").
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import sys
+
+try:
+    import psycopg
+except ImportError:
+    psycopg = None
+
+from pg_harness import as_user, boot, local_cluster, seed
+
+# Column each table is gated on
+GATED = {'projects': 'id', 'objectives': 'project_id', 'strategies': 'project_id', 'experiments': 'project_id'}
+
+HELPERS = """
+CREATE OR REPLACE FUNCTION is_project_member(p_project_id uuid, p_user_id uuid)
+RETURNS boolean LANGUAGE sql SECURITY DEFINER SET search_path = public STABLE AS $$
+  SELECT EXISTS (SELECT 1 FROM project_members WHERE project_id = p_project_id AND user_id = p_user_id);
+$$;
+
+CREATE OR REPLACE FUNCTION rls_user_project_ids()
+RETURNS SETOF uuid LANGUAGE sql SECURITY DEFINER SET search_path = public STABLE AS $$
+  SELECT project_id FROM project_members WHERE user_id = auth.uid();
+$$;
+
+CREATE OR REPLACE FUNCTION rls_is_superadmin()
+RETURNS boolean LANGUAGE sql SECURITY DEFINER SET search_path = public STABLE AS $$
+  SELECT EXISTS (SELECT 1 FROM profiles WHERE id = auth.uid() AND global_role = 'superadmin');
+$$;
+"""
+
+# SELECT policy bodies; {table} and {key} are filled in per gated table
+VARIANTS = {
+    # supabase/migration.sql: correlated EXISTS plus a superadmin lookup
+    'member_exists': """
+        EXISTS (SELECT 1 FROM project_members
+                WHERE project_members.project_id = {table}.{key}
+                AND project_members.user_id = auth.uid())
+        OR EXISTS (SELECT 1 FROM profiles WHERE id = auth.uid() AND global_role = 'superadmin')""",
+    # FIX_RLS_RECURSION.sql: SECURITY DEFINER helper called per row
+    'definer_function': "is_project_member({key}, auth.uid())",
+    # Same rule as migration.sql, with the membership set and auth.uid() computed once
+    'member_in_initplan': """
+        {key} IN (SELECT pm.project_id FROM project_members pm WHERE pm.user_id = (SELECT auth.uid()))
+        OR (SELECT rls_is_superadmin())""",
+    # Same rule, membership set from a SECURITY DEFINER set-returning helper
+    'definer_set': "{key} IN (SELECT rls_user_project_ids()) OR (SELECT rls_is_superadmin())",
+}
+
+QUERIES = {
+    'projects_list': "SELECT * FROM projects ORDER BY created_at",
+    'experiments_by_project': "SELECT * FROM experiments WHERE project_id = %(project)s ORDER BY ice_score DESC",
+    'experiments_all_projects': ("SELECT * FROM experiments WHERE project_id = ANY(%(projects)s::uuid[]) "
+                                 "ORDER BY ice_score DESC"),
+    'objectives_by_project': "SELECT * FROM objectives WHERE project_id = %(project)s",
+    'strategies_by_project': "SELECT * FROM strategies WHERE project_id = %(project)s",
+}
+
+SEQ_SCAN_REMOVED = 1000
+
+
+# -- Variants --------------------------------------------------------------------
+
+def install_variant(cur, name):
+    """Replace the SELECT policies of every gated table (inside the caller's transaction)."""
+    cur.execute(HELPERS)
+    body = VARIANTS[name]
+    for table, key in GATED.items():
+        cur.execute("SELECT policyname FROM pg_policies WHERE schemaname = 'public' AND tablename = %s "
+                    "AND cmd IN ('SELECT', 'ALL')", [table])
+        for (policy,) in cur.fetchall():
+            cur.execute(f'DROP POLICY "{policy}" ON {table}')
+        cur.execute(f'CREATE POLICY "profile {name}" ON {table} FOR SELECT USING ({body.format(table=table, key=key)})')
+
+
+def self_referencing_policies(cur):
+    """Policies whose expression queries their own table directly (42P17 risk)."""
+    cur.execute("SELECT tablename, policyname, coalesce(qual, '') || ' ' || coalesce(with_check, '') "
+                "FROM pg_policies WHERE schemaname = 'public'")
+    found = []
+    for table, policy, expression in cur.fetchall():
+        if re.search(rf'\b(FROM|JOIN)\s+(public\.)?{table}\b', expression, re.IGNORECASE):
+            found.append((table, policy))
+    return found
+
+
+def definer_functions(cur):
+    cur.execute("SELECT proname FROM pg_proc p JOIN pg_namespace n ON n.oid = p.pronamespace "
+                "WHERE n.nspname = 'public' AND p.prosecdef")
+    return {name for (name,) in cur.fetchall()}
+
+
+# -- Plan analysis -----------------------------------------------------------------
+
+def walk(node):
+    yield node
+    for child in node.get('Plans', ()):
+        yield from walk(child)
+
+
+def findings(plan, definers):
+    """(kind, detail, suggestion) tuples for one EXPLAIN ANALYZE JSON plan."""
+    found = []
+    for node in walk(plan['Plan']):
+        loops = node.get('Actual Loops', 1)
+        name = node.get('Subplan Name', '')
+        relation = node.get('Relation Name')
+        condition = node.get('Filter', '') + ' ' + node.get('Index Cond', '')
+        examined = (node.get('Actual Rows', 0) + node.get('Rows Removed by Filter', 0)) * loops
+        key = GATED.get(relation, 'project_id')
+
+        if name.startswith('SubPlan') and loops > 1:
+            found.append(('per-row subplan', f"{name} ran {loops} times",
+                          f"rewrite the correlated EXISTS as `{key} IN (SELECT project_id FROM "
+                          "project_members WHERE user_id = (SELECT auth.uid()))` so it runs once"))
+        for function in sorted(definers):
+            if f"{function}(" in condition and examined > 1:
+                found.append(('per-row definer call', f"{function}() evaluated for ~{examined} rows on {relation}",
+                              "call a set-returning SECURITY DEFINER helper once: "
+                              f"`{key} IN (SELECT rls_user_project_ids())`"))
+        if 'auth.uid()' in condition and examined > 1 and not name.startswith('InitPlan'):
+            found.append(('per-row auth.uid()', f"auth.uid() in a filter over ~{examined} rows of {relation}",
+                          "wrap it as `(SELECT auth.uid())` so it becomes a one-off InitPlan"))
+        if node.get('Node Type') == 'Seq Scan' and node.get('Rows Removed by Filter', 0) * loops >= SEQ_SCAN_REMOVED:
+            columns = sorted(set(re.findall(r'\((\w+) = ', node.get('Filter', '')))) or ['<filter columns>']
+            found.append(('filtered seq scan', f"{relation}: {node['Rows Removed by Filter'] * loops} rows removed",
+                          f"CREATE INDEX ON {relation} ({', '.join(columns)})"))
+    return found
+
+
+# -- Measuring -------------------------------------------------------------------
+
+def pick_member(conn):
+    """The user with the most project memberships, and their projects."""
+    row = conn.execute("SELECT user_id::text, array_agg(project_id::text) FROM project_members "
+                       "GROUP BY user_id ORDER BY count(*) DESC LIMIT 1").fetchone()
+    if row is None:
+        raise RuntimeError("No project_members rows: seed the database first (--seed-projects)")
+    return row[0], row[1]
+
+
+def explain(cur, sql, params):
+    cur.execute("EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + sql, params)
+    return cur.fetchone()[0][0]
+
+
+def measure(conn, variant, user, params, repeat):
+    """{query: result} for one variant; every change is rolled back."""
+    results = {}
+    for query, sql in QUERIES.items():
+        try:
+            with conn.cursor() as cur:
+                definers = set()
+                if variant not in ('bypass', 'current'):
+                    install_variant(cur, variant)
+                if variant != 'bypass':
+                    definers = definer_functions(cur)
+                    as_user(cur, user)
+                plans = [explain(cur, sql, params) for _ in range(repeat)]
+            timings = [plan['Execution Time'] for plan in plans]
+            results[query] = {
+                'ms': statistics.median(timings),
+                'rows': plans[-1]['Plan'].get('Actual Rows'),
+                'findings': findings(plans[-1], definers),
+                'plan': plans[-1],
+            }
+        except psycopg.Error as exc:
+            error = str(exc).splitlines()[0]
+            if exc.sqlstate == '42P17':
+                error = 'infinite recursion in policy: ' + error
+            results[query] = {'ms': None, 'rows': None, 'findings': [], 'error': error}
+        finally:
+            conn.rollback()
+    return results
+
+
+def profile(conn, variants, repeat):
+    user, projects = pick_member(conn)
+    conn.rollback()
+    params = {'project': projects[0], 'projects': projects}
+    return {variant: measure(conn, variant, user, params, repeat) for variant in variants}
+
+
+def print_report(report):
+    queries = list(QUERIES)
+    baseline = report.get('bypass', {})
+    print(f"\n{'variant':<20}" + ''.join(f"{q[:24]:>26}" for q in queries))
+    for variant, results in report.items():
+        cells = []
+        for query in queries:
+            result = results[query]
+            if result['ms'] is None:
+                cells.append(f"{'error':>26}")
+                continue
+            base = (baseline.get(query) or {}).get('ms')
+            ratio = f" ({result['ms'] / base:.1f}x)" if base and variant != 'bypass' else ''
+            cells.append(f"{result['ms']:>15.2f} ms{ratio:>9}")
+        print(f"{variant:<20}" + ''.join(cells))
+
+    for variant, results in report.items():
+        lines = []
+        for query, result in results.items():
+            if 'error' in result:
+                lines.append(f"   ❌ {query}: {result['error']}")
+            seen = set()
+            for kind, detail, suggestion in result['findings']:
+                if (kind, suggestion) in seen:
+                    continue
+                seen.add((kind, suggestion))
+                lines.append(f"   ⚠️  {query}: {kind}: {detail}\n      -> {suggestion}")
+        if lines:
+            print(f"\n{variant}:")
+            print('\n'.join(lines))
+
+
+def write_plans(report, directory):
+    os.makedirs(directory, exist_ok=True)
+    for variant, results in report.items():
+        for query, result in results.items():
+            if 'plan' in result:
+                with open(os.path.join(directory, f"{variant}.{query}.json"), 'w') as f:
+                    json.dump(result['plan'], f, indent=2)
+
+
+def run(dsn, args):
+    if args.seed_projects:
+        with psycopg.connect(dsn, autocommit=True) as conn:
+            boot(conn, reset=args.reset)
+        with psycopg.connect(dsn) as conn:
+            seed(conn, args.seed_projects, args.experiments, args.members)
+
+    with psycopg.connect(dsn) as conn:
+        with conn.cursor() as cur:
+            recursive = self_referencing_policies(cur)
+        conn.rollback()
+        variants = ['bypass', 'current'] + (args.variant or list(VARIANTS))
+        report = profile(conn, variants, args.repeat)
+
+    print_report(report)
+    if recursive:
+        print("\nSelf-referencing policies (42P17 recursion risk):")
+        for table, policy in recursive:
+            print(f"   ⚠️  {table}: \"{policy}\" -> move the {table} lookup into a SECURITY DEFINER helper")
+    if args.plans:
+        write_plans(report, args.plans)
+        print(f"\n📄 Plans written to {args.plans}/")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure RLS policy variants with EXPLAIN ANALYZE.")
+    parser.add_argument('--dsn', help="Local Postgres (superuser) with the schema loaded")
+    parser.add_argument('--initdb', action='store_true', help="Use a throwaway cluster (implies seeding)")
+    parser.add_argument('--reset', action='store_true', help="Drop the public and auth schemas before seeding")
+    parser.add_argument('--seed-projects', type=int, help="Install the schema and seed this many projects first")
+    parser.add_argument('--experiments', type=int, default=500, help="Experiments per seeded project")
+    parser.add_argument('--members', type=int, default=3, help="Members per seeded project")
+    parser.add_argument('--variant', action='append', choices=sorted(VARIANTS), help="Only these variants")
+    parser.add_argument('--repeat', type=int, default=3, help="EXPLAIN ANALYZE runs per query (median kept)")
+    parser.add_argument('--plans', metavar='DIR', help="Write every JSON plan here")
+    args = parser.parse_args(argv)
+
+    if psycopg is None:
+        print("❌ psycopg is not installed: pip install \"psycopg[binary]\"")
+        return 1
+    if args.initdb:
+        args.seed_projects = args.seed_projects or 10
+        with local_cluster() as dsn:
+            run(dsn, args)
+    elif args.dsn:
+        run(args.dsn, args)
+    else:
+        parser.error("Pass --dsn or --initdb")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
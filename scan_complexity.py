@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+"""
+Find O(n·m) collection scans in TSX render paths.
+
+A `.filter/.find/.some` over a prop or state array inside a `.map`
+callback runs once per mapped item: RoadmapView filters `experiments` for
+every strategy of every objective, the Kanban filters the board once per
+column. This pass walks the TsxIndex of each file and reports every scan
+that sits inside one or more loop callbacks (also through component
+helpers such as countLinkedExperiments that are called from a loop),
+ranked by the number of collections multiplied together. Scans inside an
+event handler in the loop (onClick={() => ...}) run per click, not per
+render, and are listed last:
+
+    📊 src/RoadmapView.tsx
+       1. O(objectives·objectiveStrategies·experiments)  line 1166  countLinkedExperiments → experiments.filter  [group-by]
+
+Constant-size loops (module constants, array literals) count as their
+length rather than as a collection.
+
+With --rewrite, scans whose predicate is `x => x.field === value` are
+replaced by a lookup in a Map that useMemo rebuilds only when the array
+changes (event-handler scans are left alone):
+
+    experiments.filter(exp => exp.linkedStrategyId === strategy.id)
+    -> experimentsByLinkedStrategyId.get(strategy.id) ?? []
+
+`.find` becomes `.get(value)?.[0]` and `.some` becomes `.has(value)`. The
+grouped arrays are shared between lookups, so callers must not mutate
+what a rewritten `.filter` returns. Lookups by `id` that are only ever
+`.find`/`.some` get a one-to-one Map instead, typed with the element type
+(e.g. `Map<string, Strategy>`, added to the `./types` import if needed):
+
+    strategies.find(s => s.id === exp.linkedStrategyId)
+    -> strategiesById.get(exp.linkedStrategyId)
+ The Map is declared before the
+component's first return; if the scanned array is declared after that the
+scan is reported but not rewritten.
+
+    python scan_complexity.py                           # App.tsx and RoadmapView.tsx
+    python scan_complexity.py --glob 'src/**/*.tsx'
+    python scan_complexity.py src/RoadmapView.tsx --rewrite
+"""
+import argparse
+import collections
+import glob
+import os
+import re
+import sys
+
+from hoist_styles import component_name
+from memoize_app import react_import_patch, statements
+from minimal_write import report, write_minimal
+from patch_engine import Patch, splice
+from patch_runner import FileCache
+from tsx_index import TsxIndex
+
+DEFAULT_TARGETS = ('src/App.tsx', 'src/RoadmapView.tsx')
+LOOP_METHODS = {'map', 'forEach', 'flatMap', 'filter', 'find', 'some', 'every', 'reduce', 'findIndex'}
+SCAN_METHODS = {'filter', 'find', 'some', 'every', 'findIndex'}
+BLOCK_KEYWORDS = {'if', 'for', 'while', 'switch', 'catch', 'else', 'try', 'finally', 'do'}
+EQUALITY = re.compile(r'\s*\(?\s*([\w$]+)\s*\)?\s*=>\s*(.+?)\s*', re.S)
+
+Call = collections.namedtuple('Call', 'method receiver start dot args')
+Finding = collections.namedtuple('Finding', 'path line component loops scan via lookup deferred')
+Lookup = collections.namedtuple('Lookup', 'field value')
+UNIQUE_FIELDS = {'id'}
+UNIQUE_METHODS = {'find', 'some'}
+
+
+def calls(index, methods):
+    """Every `<receiver>.method(...)` call, receiver as dotted text (None for chains)."""
+    tokens = index.tokens
+    for i in range(1, len(tokens) - 2):
+        if tokens[i].text != '.' or tokens[i + 1].text not in methods or tokens[i + 2].text != '(':
+            continue
+        args = index.by_start.get(tokens[i + 2].start)
+        j = i - 1
+        if tokens[j].kind != 'ident':
+            literal = index.enclosing(tokens[j].start) if tokens[j].text == ']' else None
+            if literal is not None and literal.kind == '[' and tokens[index.token_at(literal.start) - 1].kind != 'ident':
+                size = index.text[literal.inner_start:literal.inner_end].count(',') + 1
+                yield Call(tokens[i + 1].text, f"[{size}]", literal.start, tokens[i].start, args)
+            else:
+                yield Call(tokens[i + 1].text, None, tokens[j].start, tokens[i].start, args)
+            continue
+        while j >= 2 and tokens[j - 1].text == '.' and tokens[j - 2].kind == 'ident':
+            j -= 2
+        receiver = index.text[tokens[j].start:tokens[i - 1].end]
+        yield Call(tokens[i + 1].text, receiver, tokens[j].start, tokens[i].start, args)
+
+
+def constant_sizes(index):
+    """Length of each module-level `const NAME = [...]` array."""
+    sizes = {}
+    tokens = index.tokens
+    for i, token in enumerate(tokens[:-1]):
+        if token.text != 'const' or index.enclosing(token.start) is not None:
+            continue
+        equals = index.next_token(i, '=')
+        if equals is not None and tokens[equals + 1].text == '[':
+            literal = index.by_start[tokens[equals + 1].start]
+            sizes[tokens[i + 1].text] = index.text[literal.inner_start:literal.inner_end].count(',') + 1
+    return sizes
+
+
+def component_returns(index, body):
+    """Offsets of `return` statements that belong to the component itself (not nested functions)."""
+    tokens = index.tokens
+    found = []
+    for i in range(index.token_at(body.start) + 1, len(tokens)):
+        token = tokens[i]
+        if token.start >= body.inner_end:
+            break
+        if token.kind != 'ident' or token.text != 'return':
+            continue
+        node = index.enclosing(token.start)
+        while node is not body:
+            if node.kind != '{':
+                break
+            before = tokens[index.token_at(node.start) - 1]
+            if before.text == ')':
+                head = tokens[index.token_at(index.enclosing(before.start).start) - 1]
+                if head.text not in BLOCK_KEYWORDS:
+                    break
+            elif before.text not in BLOCK_KEYWORDS:
+                break
+            node = node.parent
+        if node is body:
+            found.append(token.start)
+    return found
+
+
+def statement_start(index, body, pos):
+    """Start of the top-level statement of body containing pos, leading comments included."""
+    tokens = index.tokens
+    i = index.token_at(pos) if index.token_at(pos) is not None else index.token_at(body.start)
+    while i > 0 and tokens[i - 1].start > body.start:
+        previous = tokens[i - 1]
+        if previous.text == ';' and index.enclosing(previous.start) is body:
+            break
+        i -= 1
+    return tokens[i].start
+
+
+def lookup(index, call):
+    """Lookup(field, value) when the predicate is `x => x.field === value` (either side)."""
+    if call.method not in ('filter', 'find', 'some') or call.receiver is None or call.receiver.startswith('['):
+        return None
+    match = EQUALITY.fullmatch(index.text[call.args.inner_start:call.args.inner_end])
+    if match is None:
+        return None
+    param, body = match.groups()
+    for left, right in (body.split('===', 1), body.split('===', 1)[::-1]) if body.count('===') == 1 else ():
+        field = re.fullmatch(rf'{re.escape(param)}\.([\w$]+)', left.strip())
+        value = right.strip()
+        if field and not re.search(rf'(?<![\w$.]){re.escape(param)}\b', value) and not re.search(r'[&|?]|=>', value):
+            return Lookup(field.group(1), value)
+    return None
+
+
+def scope_names(index, body):
+    """Names a component can scan: its destructured props and top-level declarations."""
+    tokens = index.tokens
+    names = set()
+    declarations, _ = statements(index, body)
+    for declaration in declarations:
+        names.update(declaration.names()[0])
+    i = index.token_at(body.start) - 1
+    if tokens[i].text == '=>' and tokens[i - 1].text == ')':
+        params = index.enclosing(tokens[i - 1].start)
+        first = tokens[index.token_at(params.start) + 1]
+        pattern = index.by_start.get(first.start) if first.text == '{' else None
+        for j in range(index.token_at(params.start) + 1, len(tokens)):
+            token = tokens[j]
+            if token.start >= params.inner_end:
+                break
+            if pattern is None:
+                if token.kind == 'ident' and index.enclosing(token.start) is params and tokens[j - 1].text in ('(', ','):
+                    names.add(token.text)
+            elif token.kind == 'ident' and index.enclosing(token.start) is pattern and tokens[j + 1].text != ':':
+                names.add(token.text)
+    return names, declarations
+
+
+def analyze(path, content):
+    """Findings for one file, plus the per-component context needed to rewrite them."""
+    index = TsxIndex(content)
+    sizes = constant_sizes(index)
+    loops = [call for call in calls(index, LOOP_METHODS) if call.args is not None]
+    components = {}
+
+    def context(pos):
+        name = component_name(index, pos)
+        if name not in components:
+            body = index.function_body(name)
+            names, declarations = scope_names(index, body) if body is not None else (set(), [])
+            components[name] = (body, names, declarations)
+        return name, components[name]
+
+    def enclosing_loops(pos, exclude=None):
+        return [loop for loop in loops if loop is not exclude and loop.args.start < pos < loop.args.end]
+
+    def deferred(pos, nested):
+        """True when pos sits in a function that isn't a loop callback (an event handler)."""
+        callbacks = {loop.args.start for loop in nested}
+        tokens = index.tokens
+        for i in range(index.token_at(nested[0].args.start), index.token_at(pos)):
+            if tokens[i].text != '=>':
+                continue
+            scope = index.enclosing(tokens[i].start)
+            body = index.by_start.get(tokens[i + 1].start)
+            end = body.end if body is not None else scope.inner_end
+            if tokens[i].start < pos < end and scope.start not in callbacks:
+                return True
+        return False
+
+    def scannable(call):
+        if call.receiver is None or call.receiver.startswith('[') or call.args is None:
+            return False
+        _, (body, names, _) = context(call.dot)
+        return body is not None and call.receiver.split('.')[0] in names
+
+    findings = []
+    helpers = collections.defaultdict(list)    # (component, helper name) -> scans in its body
+    for call in calls(index, SCAN_METHODS):
+        if not scannable(call):
+            continue
+        name, (body, names, declarations) = context(call.dot)
+        nested = enclosing_loops(call.dot, exclude=call)
+        if nested:
+            findings.append(Finding(path, index.text.count('\n', 0, call.dot) + 1, name, nested, call, None,
+                                    lookup(index, call), deferred(call.dot, nested)))
+            continue
+        for declaration in declarations:
+            if declaration.start < call.dot < declaration.end and '=>' in declaration.value[:200]:
+                helpers[(name, declaration.names()[0][0])].append(call)
+
+    for (name, helper), scans in helpers.items():
+        for i in index.identifiers.get(helper, ()):
+            token = index.tokens[i]
+            if index.tokens[i - 1].text in ('.', 'const') or index.tokens[i + 1].text != '(':
+                continue
+            nested = enclosing_loops(token.start)
+            for call in scans if nested else ():
+                findings.append(Finding(path, index.text.count('\n', 0, token.start) + 1, name, nested, call, helper,
+                                        lookup(index, call), deferred(token.start, nested)))
+
+    def factors(finding):
+        labels = []
+        for loop in finding.loops:
+            size = sizes.get(loop.receiver) if loop.receiver else None
+            if loop.receiver and loop.receiver.startswith('['):
+                size = int(loop.receiver[1:-1])
+            labels.append(str(size) if size else (loop.receiver or '…'))
+        return labels + [finding.scan.receiver]
+
+    ranked = sorted(findings, key=lambda f: (f.deferred, -sum(not label.isdigit() for label in factors(f)), f.line))
+    return index, ranked, components, factors
+
+
+def group_name(receiver, field):
+    return f"{receiver.replace('.', '_')}By{field[0].upper()}{field[1:]}"
+
+
+def group_declaration(indent, name, receiver, field):
+    lines = [
+        f"const {name} = useMemo(() => {{",
+        f"  const groups = new Map<unknown, typeof {receiver}>();",
+        f"  for (const item of {receiver}) {{",
+        f"    const group = groups.get(item.{field});",
+        f"    if (group) group.push(item);",
+        f"    else groups.set(item.{field}, [item]);",
+        f"  }}",
+        f"  return groups;",
+        f"}}, [{receiver}]);",
+    ]
+    return ''.join(f"{indent}{line}\n" for line in lines)
+
+
+def unique_declaration(indent, name, receiver, field, element):
+    return (f"{indent}const {name} = useMemo(() => new Map<string, {element}>("
+            f"{receiver}.map(item => [item.{field}, item])), [{receiver}]);\n")
+
+
+def element_type(content, receiver, path=None):
+    """(element type of the receiver array, Patch adding it to the ./types import or None)."""
+    name = re.escape(receiver.split('.')[-1])
+    declared = re.search(rf'\b{name}\s*:\s*([A-Z][\w$]*)\[\]|\[{name},\s*[\w$]+\]\s*=\s*useState<([A-Z][\w$]*)\[\]>',
+                         content)
+    if declared:
+        return declared.group(1) or declared.group(2), None
+    fallback = f"(typeof {receiver})[number]", None
+    base = receiver.split('.')[-1]
+    singular = base[:-3] + 'y' if base.endswith('ies') else base[:-1] if base.endswith('s') else None
+    if not singular:
+        return fallback
+    element = singular[0].upper() + singular[1:]
+    if re.search(rf'\b(?:interface|type|class)\s+{element}\b|import[^;]*\b{element}\b[^;]*from', content):
+        return element, None
+    types = re.search(r"import type \{([^}]*)\} from '(\./types)';", content)
+    if types is None or path is None:
+        return fallback
+    module = os.path.join(os.path.dirname(path), types.group(2) + '.ts')
+    try:
+        with open(module, 'r', encoding='utf-8') as f:
+            exported = re.search(rf'^export (?:interface|type) {element}\b', f.read(), re.M)
+    except FileNotFoundError:
+        exported = None
+    if not exported:
+        return fallback
+    names = types.group(1).rstrip().rstrip(',')
+    statement = types.group(0)
+    return element, Patch(statement, statement.replace(types.group(1), f"{names}, {element} "),
+                          name=f"import {element}")
+
+
+def rewrite(content, index, findings, components, path=None):
+    """Replace group-by-able scans with Map lookups; returns (content, notes)."""
+    edits, notes, done = [], [], set()
+    groups = collections.defaultdict(dict)       # component -> {(receiver, field): name}
+    first_use = {}
+    methods = collections.defaultdict(set)       # (component, (receiver, field)) -> scan methods
+    for finding in findings:
+        if finding.lookup is not None and not finding.deferred:
+            methods[(finding.component, (finding.scan.receiver, finding.lookup.field))].add(finding.scan.method)
+    unique = {key for key, used in methods.items() if key[1][1] in UNIQUE_FIELDS and used <= UNIQUE_METHODS}
+    for finding in findings:
+        call = finding.scan
+        if finding.lookup is None or finding.deferred or call.dot in done:
+            continue
+        body, names, declarations = components[finding.component]
+        returns = component_returns(index, body)
+        declared = [d.end for d in declarations if call.receiver.split('.')[0] in d.names()[0]]
+        limit = statement_start(index, body, returns[0]) if returns else body.inner_end
+        if declared and declared[0] > limit:
+            notes.append(f"⚠️  line {finding.line}: {call.receiver} is declared after the first return, not rewritten")
+            continue
+        done.add(call.dot)
+        key = (call.receiver, finding.lookup.field)
+        name = groups[finding.component].setdefault(key, group_name(*key))
+        use = statement_start(index, body, call.start)
+        at = min(use, limit)
+        if declared:
+            at = max(at, declared[0])
+        first_use[(finding.component, key)] = min(first_use.get((finding.component, key), at), at)
+
+        value = finding.lookup.value
+        chained = content[call.args.end:call.args.end + 20].lstrip()[:1] in ('.', '[', '(')
+        replacement = {
+            'filter': f"({name}.get({value}) ?? [])" if chained else f"{name}.get({value}) ?? []",
+            'find': f"{name}.get({value})" if (finding.component, key) in unique else f"{name}.get({value})?.[0]",
+            'some': f"{name}.has({value})",
+        }[call.method]
+        edits.append((call.start, call.args.end, Patch(content[call.start:call.args.end], replacement,
+                                                       name=f"lookup {call.dot}")))
+        notes.append(f"✂️  line {finding.line}: {call.receiver}.{call.method}(...) -> {replacement}")
+
+    blocks = collections.defaultdict(list)       # insertion offset -> declarations
+    imports = {}
+    for (component, key), at in first_use.items():
+        name = groups[component][key]
+        if not re.search(rf'\bconst {re.escape(name)}\b', content):
+            element = None
+            if (component, key) in unique:
+                element, import_patch = element_type(content, key[0], path)
+                if import_patch is not None:
+                    imports[import_patch.name] = import_patch
+            blocks[at].append((name, key, element))
+    for at, declared in blocks.items():
+        line_start = content.rfind('\n', 0, at) + 1
+        indent = content[line_start:at] if not content[line_start:at].strip() else '  '
+        text = f"{indent}// Group-by indexes for scans nested in render loops (scan_complexity.py)\n"
+        text += ''.join(unique_declaration(indent, name, *key, element) if element else
+                        group_declaration(indent, name, *key) for name, key, element in declared) + '\n'
+        edits.append((line_start, line_start, Patch('', text, name=f"groups {at}")))
+    for patch in imports.values():
+        start = content.find(patch.search)
+        edits.append((start, start + len(patch.search), patch))
+
+    if edits:
+        hook = react_import_patch(content, 'useMemo')
+        if hook is not None:
+            start = content.find(hook.search)
+            edits.append((start, start + len(hook.search), hook))
+    edits.sort(key=lambda edit: (edit[0], edit[1]))
+    return splice(content, edits), notes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report (and optionally rewrite) nested collection scans in TSX.")
+    parser.add_argument('paths', nargs='*', help="TSX files (default: App.tsx and RoadmapView.tsx)")
+    parser.add_argument('--glob', help="Analyze every file matching this pattern (e.g. 'src/**/*.tsx')")
+    parser.add_argument('--rewrite', action='store_true', help="Replace equality scans with group-by Map lookups")
+    args = parser.parse_args(argv)
+
+    paths = list(args.paths)
+    if args.glob:
+        paths.extend(sorted(path for path in glob.glob(args.glob, recursive=True) if os.path.isfile(path)))
+    if not paths:
+        paths = list(DEFAULT_TARGETS)
+
+    cache = FileCache()
+    total = 0
+    for path in paths:
+        content = cache.read(path)
+        index, findings, components, factors = analyze(path, content)
+        total += len(findings)
+        if not findings:
+            continue
+        print(f"📊 {path}")
+        for rank, finding in enumerate(findings, 1):
+            via = f"{finding.via} → " if finding.via else ''
+            tag = ('  [group-by]' if finding.lookup else '') + ('  (in an event handler, not per render)' if finding.deferred else '')
+            print(f"   {rank}. O({'·'.join(factors(finding))})  line {finding.line}  "
+                  f"{via}{finding.scan.receiver}.{finding.scan.method}{tag}")
+        if args.rewrite:
+            new, notes = rewrite(content, index, findings, components, path)
+            for note in notes:
+                print(f"   {note}")
+            cache.store(path, new)
+
+    if args.rewrite:
+        for key in cache.dirty():
+            report(os.path.relpath(key), write_minimal(key, cache.files[key]))
+    print(f"🔎 {total} nested scan(s) in {len(paths)} file(s)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
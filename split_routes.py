@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+"""
+Codemod: load views and modals that sit behind state with React.lazy.
+
+App.tsx statically imports every view and modal, so the board pays for
+Settings, the roadmap and five modals before it can render. This builds
+the import graph of src/ from main.tsx and, for each component App
+imports, looks at every place it is rendered:
+
+* behind a condition on state (`view === 'roadmap' ? <RoadmapView/>`,
+  `{selectedExperiment && <ExperimentDrawer/>}`, `if (view === ...) return`),
+* or with an `isOpen={state}` prop on a component that starts with
+  `if (!isOpen) return null`.
+
+A component is split when every render site is gated and none of the
+gates holds for the initial useState values (the default view stays in
+the entry chunk), and when nothing else in the entry graph imports its
+module statically (SectionGuide is also imported by PortfolioView, so
+lazy-loading it would move nothing). Projected chunk sizes (source bytes
+and gzip) are printed for the entry and for each new chunk.
+
+With --write, split components become
+
+    const RoadmapView = lazy(() => import('./RoadmapView').then(module => ({ default: module.RoadmapView })));
+
+and each render site is wrapped in <Suspense fallback={null}>. Modals
+gated through isOpen are mounted only while open (`{isOpen && ...}`), so
+their local state resets between openings.
+
+    python split_routes.py                    # report
+    python split_routes.py --write
+    python split_routes.py --fallback '<div className="loading" />'
+"""
+import argparse
+import collections
+import os
+import re
+import sys
+import zlib
+
+from hoist_styles import component_name
+from memoize_app import react_import_patch
+from minimal_write import report, write_minimal
+from patch_engine import Patch, splice
+from patch_runner import FileCache
+from tsx_index import TsxIndex
+
+SRC = 'src'
+ENTRY = 'src/main.tsx'
+DEFAULT_FILE = 'src/App.tsx'
+EXTENSIONS = ('', '.tsx', '.ts', '.jsx', '.js', '/index.tsx', '/index.ts')
+PROP_GATES = ('isOpen',)
+CONDITION_STOPS = {'{', '(', '[', '?', ':', ',', '||', 'return', '=>', ';'}
+
+IMPORT = re.compile(r'''^[ \t]*(import|export)\s+(type\s+)?(?:([\w\s{},*$]*?)\s+from\s+)?['"]([^'"]+)['"];?[ \t]*\n?''', re.M)
+DYNAMIC_IMPORT = re.compile(r'''import\(\s*['"]([^'"]+)['"]\s*\)''')
+
+Edge = collections.namedtuple('Edge', 'target names dynamic start end')
+Site = collections.namedtuple('Site', 'element gates prop_gate')
+
+
+class ImportGraph:
+    """Static and dynamic imports between the modules under src/."""
+
+    def __init__(self, cache, root=SRC):
+        self.cache = cache
+        self.edges = {}                     # path -> [Edge]
+        for path in self.sources(root):
+            self.add(os.path.normpath(path))
+
+    @staticmethod
+    def sources(root):
+        for directory, _, files in os.walk(root):
+            for name in sorted(files):
+                if name.endswith(('.ts', '.tsx', '.js', '.jsx')) and not name.endswith('.d.ts'):
+                    yield os.path.join(directory, name)
+
+    def resolve(self, importer, specifier):
+        base = os.path.normpath(os.path.join(os.path.dirname(importer), specifier))
+        for extension in EXTENSIONS:
+            if os.path.isfile(base + extension):
+                return base + extension
+        return None
+
+    def add(self, path):
+        content = self.cache.read(path)
+        edges = []
+        for match in IMPORT.finditer(content):
+            keyword, type_only, names, specifier = match.groups()
+            if type_only or (keyword == 'export' and names is None):
+                continue
+            if not specifier.startswith('.'):
+                continue            # packages are not measured
+            target = self.resolve(path, specifier)
+            if target is not None:
+                edges.append(Edge(target, names or '', False, match.start(), match.end()))
+        for match in DYNAMIC_IMPORT.finditer(content):
+            target = self.resolve(path, match.group(1))
+            if target is not None:
+                edges.append(Edge(target, '', True, match.start(), match.end()))
+        self.edges[path] = edges
+
+    def reachable(self, start, skip=()):
+        """Modules loaded with start through static imports, ignoring skipped (importer, target) edges."""
+        seen, stack = set(), [start]
+        while stack:
+            path = stack.pop()
+            if path in seen:
+                continue
+            seen.add(path)
+            if path not in self.edges and os.path.isfile(path) and path.endswith(('.ts', '.tsx', '.js', '.jsx')):
+                self.add(path)
+            for edge in self.edges.get(path, ()):
+                if not edge.dynamic and (path, edge.target) not in skip:
+                    stack.append(edge.target)
+        return seen
+
+    def importers(self, target, within):
+        return [path for path in within for edge in self.edges.get(path, ()) if edge.target == target and not edge.dynamic]
+
+    def size(self, modules):
+        """(source bytes, gzip bytes) of a set of modules."""
+        data = b''.join(open(path, 'rb').read() for path in sorted(modules))
+        return len(data), len(zlib.compress(data, 9)) if data else 0
+
+
+def state_initials(index, body):
+    """{state name: initial value source} for `const [x, setX] = useState(...)` in a component."""
+    initials = {}
+    pattern = re.compile(r'const \[\s*([\w$]+)\s*,\s*[\w$]+\s*\]\s*=\s*useState(?:<[^;]*?>)?\((.*?)\);')
+    for match in pattern.finditer(index.text, body.start, body.end):
+        initials[match.group(1)] = match.group(2).strip() or 'undefined'
+    return initials
+
+
+def truth(condition, initials):
+    """Value of a simple condition on the initial state: True, False or None (unknown)."""
+    parts = re.split(r'\s*&&\s*', condition.strip().strip('()'))
+    values = []
+    for part in parts:
+        part = part.strip()
+        negate = part.startswith('!') and not part.startswith('!=')
+        name = part.lstrip('!').strip()
+        compare = re.fullmatch(r'([\w$]+)\s*(===|!==)\s*([\'"][^\'"]*[\'"])', part)
+        if compare:
+            name, operator, literal = compare.groups()
+            if name not in initials:
+                values.append(None)
+                continue
+            equal = initials[name].strip('\'"') == literal.strip('\'"') and initials[name][:1] in '\'"'
+            values.append(equal if operator == '===' else not equal)
+        elif name in initials:
+            value = initials[name] not in ('false', 'null', 'undefined', "''", '""', '0')
+            values.append(not value if negate else value)
+        else:
+            values.append(None)
+    if False in values:
+        return False
+    return True if all(value is True for value in values) else None
+
+
+def condition_before(index, i):
+    """Start offset and text of the operand chain that ends just before token i."""
+    tokens = index.tokens
+    scope = index.enclosing(tokens[i].start)
+    j = i - 1
+    while j > 0:
+        token = tokens[j]
+        if index.enclosing(token.start) is scope and (token.text in CONDITION_STOPS or token.kind == 'jsx-text'):
+            break
+        if token.kind in ('jsx-open', 'jsx-close') and index.enclosing(token.start) is scope:
+            break
+        j -= 1
+    start = tokens[j + 1].start
+    return start, index.text[start:tokens[i].start].strip()
+
+
+def matching_question(index, i):
+    """Token index of the `?` whose `:` is token i."""
+    tokens = index.tokens
+    scope = index.enclosing(tokens[i].start)
+    depth = 0
+    for j in range(i - 1, 0, -1):
+        if index.enclosing(tokens[j].start) is not scope:
+            continue
+        if tokens[j].text == ':':
+            depth += 1
+        elif tokens[j].text == '?':
+            if depth == 0:
+                return j
+            depth -= 1
+    return None
+
+
+def gates(index, element, body):
+    """[(condition text, holds)] that must be true for the element to render."""
+    tokens = index.tokens
+    found = []
+    start, end = element.start, element.end
+    while start > body.start:
+        i = index.token_at(start) - 1
+        wrapper = index.enclosing(tokens[i].start) if tokens[i].text == '(' else None
+        if wrapper is not None and wrapper.start == tokens[i].start and \
+                not index.text[end:wrapper.inner_end].strip():
+            start, end = wrapper.start, wrapper.end
+            continue
+        if tokens[i].text in ('&&', '?'):
+            start, condition = condition_before(index, i)
+            found.append((condition, True))
+            continue
+        if tokens[i].text == ':':
+            question = matching_question(index, i)
+            if question is not None:
+                start, condition = condition_before(index, question)
+                found.append((condition, False))
+                continue
+        parent = index.enclosing(start - 1) if start > 0 else None
+        while parent is not None and parent.end < end:
+            parent = parent.parent
+        if parent is None or parent is body:
+            break
+        if parent.kind == '{':
+            k = index.token_at(parent.start) - 1
+            if tokens[k].text == ')':
+                paren = index.enclosing(tokens[k].start)
+                if tokens[index.token_at(paren.start) - 1].text == 'if':
+                    found.append((index.text[paren.inner_start:paren.inner_end].strip(), True))
+        start, end = parent.start, parent.end
+    return found
+
+
+def prop_gate(index, element, target_source):
+    """The expression of an isOpen-style prop when the component renders null without it."""
+    tokens = index.tokens
+    i = index.token_at(element.start) + 1
+    while i < len(tokens) - 1 and tokens[i].start < element.inner_start:
+        if tokens[i].kind == 'jsx-attr' and tokens[i].text in PROP_GATES and tokens[i + 1].text == '{':
+            prop = tokens[i].text
+            if re.search(rf'if \(!{prop}\) return null', target_source):
+                container = index.by_start[tokens[i + 1].start]
+                return index.text[container.inner_start:container.inner_end].strip()
+        i += 1
+    return None
+
+
+def candidates(path, cache, graph):
+    """[(name, edge, sites, reason)] for each component App imports from a local module."""
+    content = cache.read(path)
+    index = TsxIndex(content)
+    found = []
+    for edge in graph.edges[path]:
+        if edge.dynamic or not edge.names.strip().startswith('{'):
+            continue
+        for name in re.findall(r'[\w$]+', edge.names):
+            elements = index.elements(name)
+            if not elements or len(index.identifiers.get(name, ())) > 1:
+                continue        # not rendered, or used as a value somewhere
+            body = index.function_body(component_name(index, elements[0].start))
+            initials = state_initials(index, body)
+            sites, reason = [], None
+            for element in elements:
+                conditions = gates(index, element, body)
+                gate = prop_gate(index, element, cache.read(edge.target))
+                checks = conditions + ([(gate, True)] if gate else [])
+                if not checks:
+                    reason = f"always rendered (line {line_of(content, element.start)})"
+                    break
+                values = [truth(text, initials) if holds else negated(truth(text, initials)) for text, holds in checks]
+                if all(value is True for value in values):
+                    reason = f"visible on the initial state (line {line_of(content, element.start)})"
+                    break
+                sites.append(Site(element, conditions, gate))
+            found.append((name, edge, sites, reason))
+    return index, found
+
+
+def negated(value):
+    return None if value is None else not value
+
+
+def line_of(content, pos):
+    return content.count('\n', 0, pos) + 1
+
+
+def plan(path, cache, graph):
+    """Decide what to split and project the chunks; returns (index, split, skipped, projection)."""
+    index, found = candidates(path, cache, graph)
+    initial_before = graph.reachable(ENTRY)
+    split, skipped = [], []
+    for name, edge, sites, reason in found:
+        if reason:
+            skipped.append((name, reason))
+        else:
+            split.append((name, edge, sites))
+
+    while True:
+        skip = {(path, edge.target) for _, edge, _ in split}
+        initial = graph.reachable(ENTRY, skip)
+        still = [(name, edge, sites) for name, edge, sites in split if edge.target in initial]
+        if not still:
+            break
+        for name, edge, sites in still:
+            importers = [p for p in graph.importers(edge.target, initial) if p != path]
+            skipped.append((name, f"still imported statically by {', '.join(sorted(importers))}"))
+            split.remove((name, edge, sites))
+
+    chunks = {name: graph.reachable(edge.target, skip) - initial for name, edge, _ in split}
+    counts = collections.Counter(module for modules in chunks.values() for module in modules)
+    shared = {module for module, count in counts.items() if count > 1}
+    projection = {
+        'before': graph.size(initial_before),
+        'after': graph.size(initial),
+        'chunks': {name: (graph.size(modules - shared), sorted(modules - shared)) for name, modules in chunks.items()},
+        'shared': (graph.size(shared), sorted(shared)),
+    }
+    return index, split, skipped, projection
+
+
+def rewrite(content, index, path, split, fallback):
+    edits = []
+    by_edge = collections.defaultdict(list)
+    for name, edge, sites in split:
+        by_edge[edge].append(name)
+        for site in sites:
+            open_tag, close_tag = f"<Suspense fallback={{{fallback}}}>", "</Suspense>"
+            if site.prop_gate:
+                child = index.enclosing(site.element.start - 1)
+                in_jsx = child is not None and child.kind == 'jsx'
+                open_tag = f"{{{site.prop_gate} && (" + open_tag if in_jsx else f"{site.prop_gate} && (" + open_tag
+                close_tag += ")}" if in_jsx else ")"
+            edits.append((site.element.start, site.element.start, Patch('', open_tag, name=f"open {name} {site.element.start}")))
+            edits.append((site.element.end, site.element.end, Patch('', close_tag, name=f"close {name} {site.element.start}")))
+
+    declarations = []
+    for edge, names in by_edge.items():
+        statement = content[edge.start:edge.end]
+        keep = [n.strip() for n in re.search(r'\{([^}]*)\}', edge.names).group(1).split(',')
+                if n.strip() and n.strip() not in names]
+        specifier = re.search(r'''['"]([^'"]+)['"]''', statement).group(1)
+        replace = re.sub(r'\{[^}]*\}', '{ ' + ', '.join(keep) + ' }', statement, count=1) if keep else ''
+        edits.append((edge.start, edge.end, Patch(statement, replace, name=f"import {specifier}")))
+        for name in names:
+            declarations.append(f"const {name} = lazy(() => import('{specifier}').then(module => ({{ default: module.{name} }})));")
+
+    if declarations:
+        last = max(match.end() for match in IMPORT.finditer(content))
+        text = "\n// Loaded on first use (split_routes.py)\n" + '\n'.join(declarations) + '\n'
+        edits.append((last, last, Patch('', text, name='lazy declarations')))
+        hook = react_import_patch(content, 'lazy', 'Suspense')
+        if hook is not None:
+            start = content.find(hook.search)
+            edits.append((start, start + len(hook.search), hook))
+    edits.sort(key=lambda edit: (edit[0], edit[1]))
+    return splice(content, edits)
+
+
+def kib(size):
+    source, gzipped = size
+    return f"{source / 1024:7.1f} KiB source, {gzipped / 1024:6.1f} KiB gzip"
+
+
+def print_plan(path, split, skipped, projection, content):
+    print(f"🗺️  {path}")
+    for name, edge, sites in split:
+        where = ', '.join(str(line_of(content, site.element.start)) for site in sites)
+        print(f"   ✂️  {name} ({os.path.relpath(edge.target)}) behind state at line(s) {where}")
+    for name, reason in skipped:
+        print(f"   ⏭️  {name}: {reason}")
+    print(f"📦 entry chunk: {kib(projection['before'])} -> {kib(projection['after'])}")
+    for name, (size, modules) in projection['chunks'].items():
+        print(f"   {name:<20} {kib(size)}  ({len(modules)} module(s))")
+    size, modules = projection['shared']
+    if modules:
+        print(f"   {'(shared)':<20} {kib(size)}  {', '.join(os.path.relpath(m) for m in modules)}")
+    print("   Sizes are of the TS sources under src/; packages are not counted.")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Split state-gated views and modals into lazy chunks.")
+    parser.add_argument('--file', default=DEFAULT_FILE, help="Module whose imports are split")
+    parser.add_argument('--fallback', default='null', help="Suspense fallback expression")
+    parser.add_argument('--write', action='store_true', help="Rewrite the file (default: report only)")
+    args = parser.parse_args(argv)
+
+    cache = FileCache()
+    graph = ImportGraph(cache)
+    path = os.path.normpath(args.file)
+    index, split, skipped, projection = plan(path, cache, graph)
+    content = cache.read(path)
+    print_plan(path, split, skipped, projection, content)
+    if args.write and split:
+        report(path, write_minimal(path, rewrite(content, index, path, split, args.fallback)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
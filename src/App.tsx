@@ -1,4 +1,4 @@
-import React, { useState } from 'react';
+import React, { useState, useMemo, lazy, Suspense } from 'react';
 import {
   Plus,
   LayoutDashboard,
@@ -13,7 +13,6 @@ import {
   Settings,
   LogOut
 } from 'lucide-react';
-import { MethodologyToolkit } from './components/MethodologyToolkit';
 import {
   DndContext,
   closestCorners,
@@ -37,20 +36,23 @@ import {
   useSortable
 } from '@dnd-kit/sortable';
 import { CSS } from '@dnd-kit/utilities';
-import type { Status, Experiment, NorthStarMetric, FunnelStage, Project, TeamMember } from './types';
-import { CreateProjectModal } from './CreateProjectModal';
-import { SettingsView } from './SettingsView';
+import type { Status, Experiment, NorthStarMetric, FunnelStage, Project, TeamMember, Strategy } from './types';
 import { PortfolioView } from './PortfolioView';
-import { ExperimentDrawer } from './ExperimentDrawer';
-import { RoadmapView } from './RoadmapView';
-import { ExperimentModal } from './ExperimentModal';
 import type { ExperimentFormData } from './ExperimentModal';
-import { KeyLearningModal } from './KeyLearningModal';
 import { SectionGuide } from './components/SectionGuide';
 import { InfoTooltip } from './components/InfoTooltip';
 import { useProjectContext } from './contexts/ProjectContext';
 import { useAuth } from './contexts/AuthContext';
 
+// Loaded on first use (split_routes.py)
+const MethodologyToolkit = lazy(() => import('./components/MethodologyToolkit').then(module => ({ default: module.MethodologyToolkit })));
+const CreateProjectModal = lazy(() => import('./CreateProjectModal').then(module => ({ default: module.CreateProjectModal })));
+const SettingsView = lazy(() => import('./SettingsView').then(module => ({ default: module.SettingsView })));
+const ExperimentDrawer = lazy(() => import('./ExperimentDrawer').then(module => ({ default: module.ExperimentDrawer })));
+const RoadmapView = lazy(() => import('./RoadmapView').then(module => ({ default: module.RoadmapView })));
+const ExperimentModal = lazy(() => import('./ExperimentModal').then(module => ({ default: module.ExperimentModal })));
+const KeyLearningModal = lazy(() => import('./KeyLearningModal').then(module => ({ default: module.KeyLearningModal })));
+
 
 // Original MOCK_EXPERIMENTS replaced with Laboratorio Polanco data
 // See laboratorioPolancoData.ts for the data source
@@ -72,7 +74,7 @@ const getStatusColor = (status: Status) => {
 };
 
 
-const IceBadge = ({ impact, confidence, ease, score }: { impact: number, confidence: number, ease: number, score: number }) => {
+const IceBadge = React.memo(({ impact, confidence, ease, score }: { impact: number, confidence: number, ease: number, score: number }) => {
   const getICEColor = (s: number) => {
     if (s >= 500) return 'ice-high';
     if (s >= 250) return 'ice-medium';
@@ -89,12 +91,12 @@ const IceBadge = ({ impact, confidence, ease, score }: { impact: number, confide
       <span style={{ marginLeft: '4px', opacity: 0.6 }}>({score})</span>
     </div>
   );
-};
+});
 
 
 const isUrl = (s: string) => s.startsWith('http://') || s.startsWith('https://') || s.startsWith('data:');
 
-const OwnerAvatar = ({ avatar, name, size = 20 }: { avatar: string; name: string; size?: number }) => {
+const OwnerAvatar = React.memo(({ avatar, name, size = 20 }: { avatar: string; name: string; size?: number }) => {
   if (avatar && isUrl(avatar)) {
     return <img src={avatar} alt="" style={{ width: size, height: size, borderRadius: '50%', objectFit: 'cover' }} />;
   }
@@ -106,9 +108,9 @@ const OwnerAvatar = ({ avatar, name, size = 20 }: { avatar: string; name: string
       {name?.charAt(0)?.toUpperCase() || '?'}
     </div>
   );
-};
+});
 
-const ExperimentCard = ({
+const ExperimentCard = React.memo(({
   experiment,
   onClick,
   isOverlay,
@@ -135,7 +137,7 @@ const ExperimentCard = ({
       <OwnerAvatar avatar={experiment.owner.avatar} name={experiment.owner.name} size={20} />
     </div>
   </div>
-);
+));
 
 const SortableExperimentCard = ({ experiment, onClick }: { experiment: Experiment; onClick: () => void }) => {
   const {
@@ -456,20 +458,14 @@ const App: React.FC = () => {
 
   // COMMITMENT FILTER IMPLEMENTATION
 
-  // 02. Explore (Table): Show Idea, Prioritized, Live Testing, Analysis
-  const exploreExperiments = experiments.filter(e =>
-    (e.status === 'Idea' || e.status === 'Prioritized' || e.status === 'Live Testing' || e.status === 'Analysis') &&
-    e.title.toLowerCase().includes(searchQuery.toLowerCase())
-  );
-
   // 03. Be Agile (Board): Show ONLY committed experiments (Prioritized, Building, Live Testing, Analysis - NO Idea)
-  const boardExperiments = experiments.filter(e =>
+  const boardExperiments = useMemo(() => experiments.filter(e =>
     BOARD_COLUMNS.includes(e.status) &&
     e.title.toLowerCase().includes(searchQuery.toLowerCase())
-  );
+  ), [experiments, searchQuery]);
 
   // 04. Learning (Library): Show ONLY Finished experiments
-  const libraryExperiments = experiments
+  const libraryExperiments = useMemo(() => experiments
     .filter(e => e.status.includes('Finished'))
     .filter(e => {
       if (libraryFilterResult === 'Winners') return e.status === 'Finished - Winner';
@@ -487,12 +483,17 @@ const App: React.FC = () => {
     .sort((a, b) => {
       if (a.endDate && b.endDate) return b.endDate.localeCompare(a.endDate);
       return 0;
-    });
+    }), [experiments, libraryFilterResult, libraryFilterStage, searchQuery]);
 
   // Sort Explore table by ICE Score
-  const tableExperiments = [...exploreExperiments].sort((a, b) =>
+  const tableExperimentsOrder = useMemo(() => [...experiments].sort((a, b) =>
     iceSortDirection === 'desc' ? b.iceScore - a.iceScore : a.iceScore - b.iceScore
-  );
+  ), [experiments, iceSortDirection]);
+  // 02. Explore (Table): Show Idea, Prioritized, Live Testing, Analysis
+  const tableExperiments = useMemo(() => tableExperimentsOrder.filter(e =>
+    (e.status === 'Idea' || e.status === 'Prioritized' || e.status === 'Live Testing' || e.status === 'Analysis') &&
+    e.title.toLowerCase().includes(searchQuery.toLowerCase())
+  ), [tableExperimentsOrder, searchQuery]);
 
 
   const updateFunnelStage = (id: string, stage: FunnelStage) => {
@@ -723,6 +724,18 @@ const App: React.FC = () => {
 
 
 
+  // Group-by indexes for scans nested in render loops (scan_complexity.py)
+  const strategiesById = useMemo(() => new Map<string, Strategy>(strategies.map(item => [item.id, item])), [strategies]);
+  const boardExperimentsByStatus = useMemo(() => {
+    const groups = new Map<unknown, typeof boardExperiments>();
+    for (const item of boardExperiments) {
+      const group = groups.get(item.status);
+      if (group) group.push(item);
+      else groups.set(item.status, [item]);
+    }
+    return groups;
+  }, [boardExperiments]);
+
   // ============================================================================
   // RENDER
   // ============================================================================
@@ -737,11 +750,11 @@ const App: React.FC = () => {
           onCreateProject={() => setIsCreateProjectOpen(true)}
           onDeleteProject={handleDeleteProject}
         />
-        <CreateProjectModal
+        {isCreateProjectOpen && (<Suspense fallback={null}><CreateProjectModal
           isOpen={isCreateProjectOpen}
           onClose={() => setIsCreateProjectOpen(false)}
           onSave={handleCreateProject}
-        />
+        /></Suspense>)}
       </>
     );
   }
@@ -1043,7 +1056,7 @@ const App: React.FC = () => {
                 <KanbanColumn
                   key={status}
                   status={status}
-                  experiments={boardExperiments.filter(e => e.status === status)}
+                  experiments={boardExperimentsByStatus.get(status) ?? []}
                   onClickExperiment={setSelectedExperiment}
                 />
               ))}
@@ -1095,7 +1108,7 @@ const App: React.FC = () => {
               </thead>
               <tbody>
                 {tableExperiments.map(exp => {
-                  const linkedStrategy = strategies.find(s => s.id === exp.linkedStrategyId);
+                  const linkedStrategy = strategiesById.get(exp.linkedStrategyId);
 
                   return (
                     <tr key={exp.id} onClick={() => setSelectedExperiment(exp)} style={{ cursor: 'pointer' }}>
@@ -1255,7 +1268,7 @@ const App: React.FC = () => {
             )}
           </div>
         ) : view === 'roadmap' ? (
-          <RoadmapView
+          <Suspense fallback={null}><RoadmapView
             northStar={northStar}
             onUpdateNorthStar={handleUpdateNorthStar}
             objectives={objectives}
@@ -1268,14 +1281,14 @@ const App: React.FC = () => {
             onDeleteObjective={handleDeleteObjective}
             onDeleteStrategy={deleteStrategy}
             onSelectExperiment={setSelectedExperiment}
-          />
+          /></Suspense>
         ) : (
           <div>Invalid view</div>
         )}
       </main>
 
       {selectedExperiment && !selectedCaseStudy && (
-        <ExperimentDrawer
+        <Suspense fallback={null}><ExperimentDrawer
           experiment={selectedExperiment}
           onClose={() => setSelectedExperiment(null)}
           onStatusChange={handleStatusChangeAttempt}
@@ -1284,14 +1297,14 @@ const App: React.FC = () => {
           strategies={strategies}
           onExperimentUpdate={handleExperimentUpdate}
           teamMembers={teamMembers}
-        />
+        /></Suspense>
       )}
 
       {selectedCaseStudy && (
         <CaseStudyModal experiment={selectedCaseStudy} onClose={() => setSelectedCaseStudy(null)} />
       )}
 
-      <ExperimentModal
+      {isNewModalOpen && (<Suspense fallback={null}><ExperimentModal
         isOpen={isNewModalOpen}
         onClose={() => setIsNewModalOpen(false)}
         onSave={(data) => {
@@ -1300,26 +1313,26 @@ const App: React.FC = () => {
         }}
         strategies={strategies}
         teamMembers={teamMembers}
-      />
+      /></Suspense>)}
 
-      <KeyLearningModal
+      {isLearningModalOpen && (<Suspense fallback={null}><KeyLearningModal
         isOpen={isLearningModalOpen}
         onClose={() => setIsLearningModalOpen(false)}
         onSave={handleLearningSave}
-      />
+      /></Suspense>)}
 
-      <MethodologyToolkit
+      {isMethodologyOpen && (<Suspense fallback={null}><MethodologyToolkit
         isOpen={isMethodologyOpen}
         onClose={() => setIsMethodologyOpen(false)}
-      />
+      /></Suspense>)}
 
-      <CreateProjectModal
+      {isCreateProjectOpen && (<Suspense fallback={null}><CreateProjectModal
         isOpen={isCreateProjectOpen}
         onClose={() => setIsCreateProjectOpen(false)}
         onSave={handleCreateProject}
-      />
+      /></Suspense>)}
 
-      <SettingsView
+      {isSettingsOpen && (<Suspense fallback={null}><SettingsView
         isOpen={isSettingsOpen}
         onClose={() => setIsSettingsOpen(false)}
         teamMembers={teamMembers}
@@ -1329,7 +1342,7 @@ const App: React.FC = () => {
         onUpdateMember={handleUpdateTeamMember}
         onSignOut={signOut}
         onDeleteProject={activeProjectId ? () => handleDeleteProject(activeProjectId) : undefined}
-      />
+      /></Suspense>)}
     </div>
   );
 };
@@ -1,4 +1,4 @@
-import React, { useState } from 'react';
+import React, { useState, useMemo } from 'react';
 import { Target, Edit2, Plus, TrendingUp, X, Lightbulb, Trash2 } from 'lucide-react';
 import type { NorthStarMetric, Objective, Strategy, Experiment, MetricType } from './types';
 import { formatMetricValue, getUnitLabel, calculateProgress as calcProgress } from './utils/metricFormatters';
@@ -41,6 +41,26 @@ export const RoadmapView: React.FC<RoadmapViewProps> = ({
   onDeleteStrategy
 }) => {
   const [modalState, setModalState] = useState<ModalState>({ type: 'none' });
+  // Group-by indexes for scans nested in render loops (scan_complexity.py)
+  const experimentsByLinkedStrategyId = useMemo(() => {
+    const groups = new Map<unknown, typeof experiments>();
+    for (const item of experiments) {
+      const group = groups.get(item.linkedStrategyId);
+      if (group) group.push(item);
+      else groups.set(item.linkedStrategyId, [item]);
+    }
+    return groups;
+  }, [experiments]);
+  const strategiesByParentObjectiveId = useMemo(() => {
+    const groups = new Map<unknown, typeof strategies>();
+    for (const item of strategies) {
+      const group = groups.get(item.parentObjectiveId);
+      if (group) group.push(item);
+      else groups.set(item.parentObjectiveId, [item]);
+    }
+    return groups;
+  }, [strategies]);
+
   // Safety check: Strategy-First Empty State
   if (!northStar) {
     return (
@@ -77,7 +97,7 @@ export const RoadmapView: React.FC<RoadmapViewProps> = ({
 
   // Count experiments linked to a strategy
   const countLinkedExperiments = (strategyId: string): number => {
-    return experiments.filter(exp => exp.linkedStrategyId === strategyId).length;
+    return (experimentsByLinkedStrategyId.get(strategyId) ?? []).length;
   };
 
   // Handlers
@@ -1033,7 +1053,7 @@ export const RoadmapView: React.FC<RoadmapViewProps> = ({
         )}
 
         {objectives.map(objective => {
-          const objectiveStrategies = strategies.filter(s => s.parentObjectiveId === objective.id);
+          const objectiveStrategies = strategiesByParentObjectiveId.get(objective.id) ?? [];
 
           return (
             <div key={objective.id} style={{
@@ -77,7 +77,7 @@ export function AuthProvider({ children }: { children: React.ReactNode }) {
     const checkOnboarding = async (_userId: string) => {
         // NOTE: clone_demo_project RPC was removed. New users start with an empty portfolio.
         // If you want to re-enable demo project cloning, create the RPC function in Supabase first.
-        console.log('ℹ️ New user onboarding: starting with empty portfolio')
+        if (import.meta.env.DEV) console.log('ℹ️ New user onboarding: starting with empty portfolio')
     }
 
     // Prevent duplicate onboarding calls
@@ -132,7 +132,7 @@ export function AuthProvider({ children }: { children: React.ReactNode }) {
         const { data: { subscription } } = supabase.auth.onAuthStateChange(
             (event, newSession) => {
                 if (cancelled) return
-                console.log('🔐 Auth event:', event)
+                if (import.meta.env.DEV) console.log('🔐 Auth event:', event)
                 setSession(newSession)
                 // Finish loading immediately – don't block on profile fetch
                 finishLoading()
@@ -8,14 +8,14 @@ export function useExperiments(projectId: string | null) {
 
   const fetchExperiments = async () => {
     if (!projectId) {
-      console.log('⚠️ useExperiments: No projectId');
+      if (import.meta.env.DEV) console.log('⚠️ useExperiments: No projectId');
       setExperiments([]);
       setLoading(false);
       return;
     }
 
     try {
-      console.log(`🔄 Fetching experiments for project: ${projectId}`);
+      if (import.meta.env.DEV) console.log(`🔄 Fetching experiments for project: ${projectId}`);
       setLoading(true);
       const { data, error } = await supabase
         .from('experiments')
@@ -23,12 +23,12 @@ export function useExperiments(projectId: string | null) {
         .eq('project_id', projectId)
         .order('ice_score', { ascending: false });
 
-      console.log('📦 Supabase response:', { data, error });
+      if (import.meta.env.DEV) console.log('📦 Supabase response:', { data, error });
 
       if (error) throw error;
       setExperiments(data || []);
       setError(null);
-      console.log(`✅ Loaded ${data?.length || 0} experiments`);
+      if (import.meta.env.DEV) console.log(`✅ Loaded ${data?.length || 0} experiments`);
     } catch (err: any) {
       console.error('❌ Error fetching experiments:', err);
       setError(err);
@@ -8,19 +8,19 @@ export function useProjects() {
 
   const fetchProjects = async () => {
     try {
-      console.log('🔄 Fetching projects...');
+      if (import.meta.env.DEV) console.log('🔄 Fetching projects...');
       setLoading(true);
       const { data, error } = await supabase
         .from('projects')
         .select('*')
         .order('created_at', { ascending: false });
 
-      console.log('📦 Projects response:', { data, error });
+      if (import.meta.env.DEV) console.log('📦 Projects response:', { data, error });
 
       if (error) throw error;
       setProjects(data || []);
       setError(null);
-      console.log(`✅ Loaded ${data?.length || 0} projects`);
+      if (import.meta.env.DEV) console.log(`✅ Loaded ${data?.length || 0} projects`);
     } catch (err: any) {
       console.error('❌ Error fetching projects:', err);
       setError(err);
@@ -84,7 +84,7 @@ export const supabase = createClient(supabaseUrl, supabaseAnonKey, {
 supabase.auth.onAuthStateChange((_event, session) => {
   cachedAccessToken = session?.access_token ?? null
   if (session) {
-    console.log('🔑 Auth token updated via state change')
+    if (import.meta.env.DEV) console.log('🔑 Auth token updated via state change')
   }
 })
 
@@ -0,0 +1,14 @@
+-- ============================================================================
+-- KEYSET PAGINATION INDEX
+--
+-- Experiments are listed per project ordered by ice_score DESC, id DESC and
+-- paged with WHERE (ice_score, id) < (last_ice, last_id) (experiment_pages.py).
+-- This index serves both the filter and the order, so every page is an
+-- index range scan of page_size rows instead of a sort of the whole project.
+--
+-- Assumes ice_score is never NULL (the app always writes it, default 125);
+-- a NULL row compares as unknown in the keyset condition and would be skipped.
+-- ============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_experiments_project_ice_id
+  ON experiments (project_id, ice_score DESC, id DESC);
@@ -0,0 +1,140 @@
+import queue
+
+import pytest
+
+from change_feed import CHANGES_TOPIC, ChangeFeed, Coalescer, LocalBroker, apply_patches, patch_topic
+
+
+def test_stop_flushes_pending_windows_once():
+    broker = LocalBroker()
+    feed = ChangeFeed(broker, Coalescer(debounce=60, max_delay=60))
+    client = broker.subscribe(patch_topic('p1'))
+    feed.start()
+    for i in range(50):
+        row = {'id': f'exp-{i}', 'project_id': 'p1', 'impact': i}
+        broker.publish(CHANGES_TOPIC, {'table': 'experiments', 'eventType': 'INSERT', 'new': row})
+
+    feed.stop()
+
+    batch = client.get_nowait()
+    assert sorted(patch['id'] for patch in batch) == sorted(f'exp-{i}' for i in range(50))
+    assert feed.thread is None
+    with pytest.raises(queue.Empty):
+        client.get_nowait()
+
+
+def event(op, new=None, old=None, table='experiments'):
+    return {'table': table, 'eventType': op, 'new': new, 'old': old}
+
+
+ROW = {'id': 'exp-1', 'project_id': 'p1', 'title': 'Pricing', 'impact': 5, 'ice_score': 125}
+
+
+def test_insert_then_update_is_one_insert():
+    coalescer = Coalescer()
+    coalescer.add(event('INSERT', ROW), now=0)
+    coalescer.add(event('UPDATE', dict(ROW, impact=7)), now=0.01)
+
+    assert coalescer.flush('p1') == [{'table': 'experiments', 'op': 'insert', 'id': 'exp-1',
+                                      'values': dict(ROW, impact=7)}]
+
+
+def test_insert_then_delete_sends_nothing():
+    coalescer = Coalescer()
+    coalescer.add(event('INSERT', ROW), now=0)
+    coalescer.add(event('DELETE', old={'id': 'exp-1', 'project_id': 'p1'}), now=0.01)
+
+    assert coalescer.flush('p1') == []
+    assert ('experiments', 'exp-1') not in coalescer.known
+
+
+def test_update_carries_only_changed_columns():
+    coalescer = Coalescer(snapshot=[('experiments', ROW)])
+    for impact in (6, 7, 8):
+        coalescer.add(event('UPDATE', dict(ROW, impact=impact, ice_score=impact * 25)), now=0)
+
+    assert coalescer.flush('p1') == [{'table': 'experiments', 'op': 'update', 'id': 'exp-1',
+                                      'values': {'impact': 8, 'ice_score': 200}}]
+    assert (coalescer.events, coalescer.patches) == (3, 1)
+
+
+def test_update_back_to_sent_values_sends_nothing():
+    coalescer = Coalescer(snapshot=[('experiments', ROW)])
+    coalescer.add(event('UPDATE', dict(ROW, impact=9)), now=0)
+    coalescer.add(event('UPDATE', ROW), now=0.01)
+
+    assert coalescer.flush('p1') == []
+
+
+def test_delete_and_reinsert_sends_whole_row():
+    coalescer = Coalescer(snapshot=[('experiments', ROW)])
+    coalescer.add(event('DELETE', old={'id': 'exp-1'}), now=0)
+    coalescer.add(event('INSERT', dict(ROW, title='Pricing v2')), now=0.01)
+
+    [patch] = coalescer.flush('p1')
+    assert patch['op'] == 'insert' and patch['values'] == dict(ROW, title='Pricing v2')
+
+
+def test_delete_without_project_id_routes_to_known_project():
+    coalescer = Coalescer(snapshot=[('experiments', ROW)])
+    change = coalescer.add(event('DELETE', old={'id': 'exp-1'}), now=0)
+
+    assert change.project_id == 'p1'
+    assert coalescer.flush('p1') == [{'table': 'experiments', 'op': 'delete', 'id': 'exp-1'}]
+
+
+def test_delete_without_project_id_routes_to_open_window():
+    coalescer = Coalescer()
+    coalescer.add(event('INSERT', ROW), now=0)
+    coalescer.add(event('DELETE', old={'id': 'exp-1'}), now=0.01)
+
+    assert list(coalescer.windows) == ['p1']
+    assert coalescer.flush('p1') == []
+
+
+def test_flush_ready_waits_for_quiet_debounce():
+    coalescer = Coalescer(debounce=0.05, max_delay=0.5)
+    coalescer.add(event('INSERT', ROW), now=0)
+    coalescer.add(event('UPDATE', dict(ROW, impact=6)), now=0.04)
+
+    assert coalescer.flush_ready(now=0.08) == []
+    assert coalescer.next_deadline() == pytest.approx(0.09)
+    [(project_id, patches)] = coalescer.flush_ready(now=0.09)
+    assert project_id == 'p1' and patches[0]['values']['impact'] == 6
+    assert coalescer.windows == {}
+
+
+def test_flush_ready_caps_a_steady_stream_at_max_delay():
+    coalescer = Coalescer(debounce=0.05, max_delay=0.2)
+    now = 0.0
+    while now < 0.2:
+        coalescer.add(event('UPDATE', dict(ROW, impact=int(now * 100))), now=now)
+        assert coalescer.flush_ready(now=now) == []
+        now += 0.03
+
+    assert coalescer.deadline('p1') == pytest.approx(0.2)
+    assert [project_id for project_id, _ in coalescer.flush_ready(now=0.2)] == ['p1']
+
+
+def test_projects_flush_independently():
+    coalescer = Coalescer(debounce=0.05)
+    coalescer.add(event('INSERT', ROW), now=0)
+    coalescer.add(event('INSERT', dict(ROW, id='exp-2', project_id='p2')), now=0.03)
+
+    assert [project_id for project_id, _ in coalescer.flush_ready(now=0.05)] == ['p1']
+    assert list(coalescer.windows) == ['p2']
+
+
+def test_apply_patches_replays_a_window_on_client_rows():
+    coalescer = Coalescer(snapshot=[('experiments', ROW)])
+    client = {('experiments', 'exp-1'): dict(ROW)}
+    draft = {'id': 'exp-2', 'project_id': 'p1', 'title': 'Draft'}
+    coalescer.add(event('UPDATE', dict(ROW, impact=9, ice_score=225)), now=0)
+    coalescer.add(event('INSERT', draft), now=0)
+
+    apply_patches(client, coalescer.flush('p1'))
+
+    assert client == {('experiments', 'exp-1'): dict(ROW, impact=9, ice_score=225),
+                      ('experiments', 'exp-2'): draft}
+    apply_patches(client, [{'table': 'experiments', 'op': 'delete', 'id': 'exp-2'}])
+    assert list(client) == [('experiments', 'exp-1')]
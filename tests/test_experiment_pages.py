@@ -0,0 +1,142 @@
+import pytest
+
+from experiment_pages import CARD_COLUMNS, ExperimentPages, decode_cursor, encode_cursor, page_query
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.description = None
+        self.result = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params):
+        self.conn.queries.append((sql, params))
+        rows = self.conn.rows
+        names = [name.strip() for name in sql[len('SELECT '):sql.index(' FROM')].split(',')]
+        if 'ANY(' in sql:
+            wanted = set(params[0])
+            found = [row for row in rows if row['id'] in wanted]
+        else:
+            project_id, *bound, limit = params
+            found = [row for row in rows if row['project_id'] == project_id]
+            if bound:
+                found = [row for row in found if (row['ice_score'], row['id']) < tuple(bound)]
+            found = sorted(found, key=lambda row: (row['ice_score'], row['id']), reverse=True)[:limit]
+        self.description = [(name,) for name in names]
+        self.result = [tuple(row.get(name) for name in names) for row in found]
+
+    def fetchall(self):
+        return self.result
+
+
+class FakeConnection:
+    """Evaluates the keyset page and detail queries over in-memory rows."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+
+    def cursor(self):
+        return FakeCursor(self)
+
+
+def make_rows(count, project_id='p1', scores=None):
+    rows = []
+    for i in range(count):
+        row = {column: None for column in CARD_COLUMNS}
+        row.update(id=f'{i:08d}-0000-0000-0000-000000000000', project_id=project_id,
+                   ice_score=scores[i] if scores else i * 7 % 50, title=f'Test {i}',
+                   hypothesis=f'Hypothesis {i}', key_learnings=None, visual_proof=[])
+        rows.append(row)
+    return rows
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor({'ice_score': 336, 'id': 'abc'})
+
+    assert decode_cursor(cursor) == (336, 'abc')
+    assert 'abc' not in cursor
+
+
+def test_page_query_is_keyset_not_offset():
+    sql, params = page_query('p1', columns=('title',), limit=20)
+    assert sql.startswith('SELECT title, ice_score, id FROM experiments')
+    assert 'OFFSET' not in sql and params == ['p1', 21]
+
+    sql, params = page_query('p1', limit=20, cursor=encode_cursor({'ice_score': 12, 'id': 'x'}))
+    assert '(ice_score, id) < (%s, %s::uuid)' in sql
+    assert sql.endswith('ORDER BY ice_score DESC, id DESC LIMIT %s')
+    assert params == ['p1', 12, 'x', 21]
+
+
+def test_unknown_columns_are_rejected():
+    with pytest.raises(ValueError, match='nope'):
+        page_query('p1', columns=('title', 'nope'))
+
+
+def test_pages_cover_every_row_once_in_order():
+    rows = make_rows(23) + make_rows(5, project_id='p2')
+    pages = ExperimentPages(FakeConnection(rows), 'p1', page_size=10)
+
+    sizes, seen, cursor = [], [], None
+    while True:
+        page = pages.page(cursor)
+        sizes.append(len(page.rows))
+        seen.extend(page.rows)
+        if page.next_cursor is None:
+            break
+        cursor = page.next_cursor
+
+    assert sizes == [10, 10, 3]
+    keys = [(row['ice_score'], row['id']) for row in seen]
+    assert keys == sorted(keys, reverse=True) and len(set(keys)) == 23
+
+
+def test_ties_on_ice_score_are_broken_by_id():
+    rows = make_rows(7, scores=[100] * 7)
+    pages = ExperimentPages(FakeConnection(rows), 'p1', page_size=3)
+
+    assert [row['id'] for row in pages] == sorted((row['id'] for row in rows), reverse=True)
+
+
+def test_exact_multiple_of_page_size_has_no_empty_trailing_page():
+    conn = FakeConnection(make_rows(6))
+    pages = ExperimentPages(conn, 'p1', page_size=3)
+
+    first = pages.page()
+    second = pages.page(first.next_cursor)
+    assert len(second.rows) == 3 and second.next_cursor is None
+    assert len(conn.queries) == 2
+
+
+def test_insert_ahead_of_cursor_does_not_shift_later_pages():
+    rows = make_rows(6, scores=[60, 50, 40, 30, 20, 10])
+    conn = FakeConnection(rows)
+    pages = ExperimentPages(conn, 'p1', page_size=3)
+
+    first = pages.page()
+    rows.append(dict(rows[0], id='99999999-0000-0000-0000-000000000000', ice_score=55))
+    second = pages.page(first.next_cursor)
+
+    assert [row['ice_score'] for row in second.rows] == [30, 20, 10]
+
+
+def test_details_are_fetched_once_and_cached():
+    conn = FakeConnection(make_rows(3))
+    pages = ExperimentPages(conn, 'p1')
+    a, b = (row['id'] for row in conn.rows[:2])
+
+    first, second = pages.details(a, b)
+    assert (first['hypothesis'], second['hypothesis']) == ('Hypothesis 0', 'Hypothesis 1')
+    assert pages.details(a) == first
+    assert len(conn.queries) == 1
+
+    pages.forget(a)
+    pages.details(a, b)
+    assert conn.queries[-1][1] == [[a]]
@@ -0,0 +1,74 @@
+import pytest
+
+from experiment_search import SearchIndex
+
+
+def test_search_over_empty_documents():
+    index = SearchIndex(fields={'name': 1.0})
+    index.add('a', {'name': ''})
+    index.add('b', {'name': '   '})
+    assert index.search('growth') == []
+
+
+def test_search_after_removing_everything():
+    index = SearchIndex()
+    index.add('a', {'title': 'Checkout test', 'hypothesis': 'Más conversión'})
+    index.add('b', {'title': 'Pricing page'})
+    assert [doc_id for doc_id, _ in index.search('checkout')] == ['a']
+
+    index.remove('a')
+    index.remove('b')
+    assert index.total_length == 0
+    assert index.search('checkout') == []
+
+
+EXPERIMENTS = {
+    'a': {'title': 'Búsqueda en el checkout', 'hypothesis': 'Menos fricción, más conversión'},
+    'b': {'title': 'Pricing page', 'keyLearnings': 'La conversión subió con precio anual'},
+    'c': {'title': 'Onboarding emails', 'hypothesis': 'Conversaciones de soporte'},
+}
+
+
+def build():
+    index = SearchIndex()
+    for doc_id, record in EXPERIMENTS.items():
+        index.add(doc_id, record)
+    return index
+
+
+def ranked(index, query, **kwargs):
+    return [doc_id for doc_id, _ in index.search(query, **kwargs)]
+
+
+def test_accent_and_case_folding():
+    index = build()
+    assert ranked(index, 'busqueda') == ['a']
+    assert ranked(index, 'CONVERSION')[0] in ('a', 'b')
+    assert set(ranked(index, 'conversion')) == {'a', 'b'}
+
+
+def test_title_matches_outrank_body_matches():
+    index = SearchIndex()
+    index.add('title', {'title': 'Pricing test', 'hypothesis': 'other words here'})
+    index.add('body', {'title': 'Other test', 'hypothesis': 'pricing words here'})
+    assert ranked(index, 'pricing') == ['title', 'body']
+
+
+def test_last_word_is_a_prefix():
+    index = build()
+    assert set(ranked(index, 'conver')) == {'a', 'b', 'c'}
+    assert ranked(index, 'conver', prefix=False) == []
+    assert index.complete('conv') == ['conversión', 'conversaciones']
+
+
+def test_add_reindexes_and_remove_drops_postings():
+    index = build()
+    index.add('a', {'title': 'Nuevo título'})
+    assert ranked(index, 'busqueda') == []
+    assert ranked(index, 'nuevo') == ['a']
+
+    index.remove('c')
+    assert 'c' not in index and len(index) == 2
+    assert 'conversaciones' not in index.terms and 'onboarding' not in index.postings
+    assert index.total_length == pytest.approx(sum(index.lengths.values()))
+    index.remove('missing')     # no-op
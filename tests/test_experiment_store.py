@@ -0,0 +1,121 @@
+import pytest
+
+from experiment_store import BOARD_COLUMNS, ExperimentStore, HashIndex, db_row_to_experiment, synthetic_experiments
+
+
+def experiment(exp_id, **fields):
+    base = {'id': exp_id, 'title': f'Test {exp_id}', 'status': 'Idea', 'owner': {'name': 'Ana', 'avatar': 'a.png'},
+            'hypothesis': '', 'impact': 5, 'confidence': 5, 'ease': 5, 'iceScore': 125,
+            'funnelStage': 'Acquisition', 'northStarMetric': 'Revenue'}
+    return {**base, **fields}
+
+
+def test_round_trip_to_types_shape():
+    source = experiment('e1', labels=['Pricing', 'Web'], visualProof=['https://x/1.png'], endDate='2025-01-02')
+    store = ExperimentStore([source])
+
+    assert store.to_dicts() == [source]
+    view = store['e1']
+    assert (view.title, view.iceScore, view.owner) == ('Test e1', 125, {'name': 'Ana', 'avatar': 'a.png'})
+
+
+def test_low_cardinality_fields_are_dictionary_encoded():
+    store = ExperimentStore(experiment(f'e{i}', labels=['Pricing', 'Web']) for i in range(100))
+
+    assert len(store.tables['status']) == 1
+    assert len(store.tables['ownerName']) == 1
+    assert store.columns['status'].typecode == 'I'
+    first, last = store['e0'].labels, store['e99'].labels
+    assert first == ('Pricing', 'Web') and first is last
+
+
+def test_missing_numbers_take_the_app_defaults():
+    store = ExperimentStore([{'id': 'e1', 'title': 'Bare', 'status': 'Idea'}])
+    assert (store['e1'].impact, store['e1'].iceScore, store['e1'].ownerName) == (5, 125, '')
+
+
+def test_update_and_remove():
+    store = ExperimentStore([experiment('e1'), experiment('e2')])
+    store.update('e1', status='Building', impact=9)
+    store.remove('e2')
+
+    assert (store['e1'].status, store['e1'].impact) == ('Building', 9)
+    assert 'e2' not in store and len(store) == 1
+    assert [view.id for view in store] == ['e1']
+    assert store.get('e2') is None
+    with pytest.raises(KeyError):
+        store.append(experiment('e1'))
+    with pytest.raises(KeyError):
+        store.update('e1', id='other')
+
+
+def test_db_rows_use_the_dbRowToExperiment_defaults():
+    store = ExperimentStore.from_db_rows([{'id': 'e1', 'title': 'From DB', 'status': 'Idea', 'ice_score': None}])
+    exported = store.to_dict(0)
+    assert exported['iceScore'] == 125 and exported['funnelStage'] == 'Acquisition'
+    assert db_row_to_experiment({'id': 'x', 'title': 't', 'status': 'Idea'})['owner'] == {'name': '', 'avatar': ''}
+
+
+def test_synthetic_round_trip():
+    experiments = list(synthetic_experiments(500))
+    assert ExperimentStore(experiments).to_dicts() == [
+        {name: value for name, value in exp.items() if value is not None} for exp in experiments]
+
+
+# -- Secondary indexes ----------------------------------------------------------
+
+
+def test_hash_index_add_discard_lookup():
+    index = HashIndex()
+    index.add(1, 10)
+    index.add(1, 11)
+    index.add(2, 12)
+
+    assert index.lookup([1]) == {10, 11}
+    assert index.lookup([1, 2, 3]) == {10, 11, 12}
+    index.discard(2, 12)
+    assert 2 not in index.rows
+    index.discard(7, 1)         # unknown code is a no-op
+
+
+@pytest.fixture
+def store():
+    return ExperimentStore([
+        experiment('e1', status='Idea', iceScore=300, linkedStrategyId='s1'),
+        experiment('e2', status='Prioritized', iceScore=500, funnelStage='Activation', linkedStrategyId='s1'),
+        experiment('e3', status='Finished - Winner', funnelStage='Activation', endDate='2025-03-01',
+                   keyLearnings='Precio anual gana'),
+        experiment('e4', status='Finished - Loser', endDate='2025-04-01', owner={'name': 'Luis', 'avatar': ''}),
+        experiment('e5', status='Live Testing', iceScore=100, title='Checkout copy'),
+    ])
+
+
+def ids(views):
+    return [view.id for view in views]
+
+
+def test_where_intersects_indexes_and_filters_other_fields(store):
+    assert ids(store.where(status=['Idea', 'Prioritized'])) == ['e1', 'e2']
+    assert ids(store.where(status='Finished - Winner', funnelStage='Activation')) == ['e3']
+    assert ids(store.where(funnelStage='Activation', iceScore=500)) == ['e2']
+    assert store.where(status='Unknown') == []
+    assert store.count(status='Idea') == 1 and store.count(ownerName='Luis') == 1
+
+
+def test_indexes_follow_updates_and_removals(store):
+    store.update('e1', status='Building', linkedStrategyId='s2')
+    store.remove('e2')
+
+    assert store.count(status='Idea') == 0
+    assert ids(store.where(status='Building')) == ['e1']
+    assert {k: ids(v) for k, v in store.by_strategy(['s1', 's2']).items()} == {'s1': [], 's2': ['e1']}
+
+
+def test_app_views(store):
+    board = store.board()
+    assert list(board) == list(BOARD_COLUMNS)
+    assert ids(board['Prioritized']) == ['e2'] and ids(store.board('checkout')['Live Testing']) == ['e5']
+    assert ids(store.explore()) == ['e2', 'e1', 'e5']
+    assert ids(store.archive()) == ['e4', 'e3']
+    assert ids(store.archive(result='Winners', stage='Activation')) == ['e3']
+    assert ids(store.archive(search='precio')) == ['e3']
@@ -0,0 +1,108 @@
+from hoist_styles import HEADER, css_rule, hoist, style_literals
+from tsx_index import TsxIndex
+
+SOURCE = """import React from 'react';
+const A = () => <div style={{ color: 'red' }} className="x">hi</div>;
+const B = () => <p style={{ margin: 0 }}>t</p>;
+"""
+
+
+def test_css_mode_keeps_constant_when_class_follows_style():
+    content, hoisted, dynamic, rules = hoist(SOURCE, 'src/A.tsx', 'src/a.css')
+
+    assert hoisted == 2 and not dynamic
+    assert '<div style={A_DIV_STYLE} className="x">' in content
+    assert '<p className="b-p">' in content
+    assert len(rules) == 1
+
+
+def test_constants_are_named_after_component_and_element():
+    source = """import React from 'react';
+const KanbanCard = () => <div style={{ display: 'flex', gap: '8px' }}><span style={{ fontWeight: 700 }}>x</span></div>;
+"""
+    content, hoisted, _, _ = hoist(source, 'src/App.tsx')
+
+    assert hoisted == 2
+    assert "const KANBAN_CARD_DIV_STYLE = Object.freeze<React.CSSProperties>({ display: 'flex', gap: '8px' });" in content
+    assert 'const KANBAN_CARD_SPAN_STYLE = Object.freeze<React.CSSProperties>({ fontWeight: 700 });' in content
+    assert '<div style={KANBAN_CARD_DIV_STYLE}><span style={KANBAN_CARD_SPAN_STYLE}>' in content
+    assert content.index(HEADER) > content.index("import React from 'react';")
+
+
+def test_identical_literals_share_one_constant_and_others_get_suffixes():
+    source = """import React from 'react';
+const Row = () => (
+  <div>
+    <p style={{ margin: 0 }}>a</p>
+    <p style={{  margin: 0 }}>b</p>
+    <p style={{ margin: 4 }}>c</p>
+  </div>
+);
+"""
+    content, hoisted, _, _ = hoist(source, 'src/App.tsx')
+
+    assert hoisted == 3
+    assert content.count('style={ROW_P_STYLE}') == 2
+    assert 'style={ROW_P_STYLE_2}' in content
+    assert content.count('Object.freeze') == 2
+
+
+def test_names_taken_by_existing_identifiers_are_skipped():
+    source = """import React from 'react';
+const ROW_P_STYLE = 1;
+const Row = () => <p style={{ margin: 0 }}>a</p>;
+"""
+    content, _, _, _ = hoist(source, 'src/App.tsx')
+
+    assert 'style={ROW_P_STYLE_2}' in content
+
+
+def test_without_react_default_import_the_type_is_imported():
+    source = """import { useState } from 'react';
+export function Panel() { return <div style={{ padding: 8 }} />; }
+"""
+    content, _, _, _ = hoist(source, 'src/Panel.tsx')
+
+    assert "import type { CSSProperties } from 'react';" in content
+    assert 'const PANEL_DIV_STYLE = Object.freeze<CSSProperties>({ padding: 8 });' in content
+
+
+def test_dynamic_styles_stay_inline_with_their_free_identifiers():
+    source = """import React from 'react';
+const Bar = ({ width, color }) => <div style={{ width: `${width}%`, background: theme.colors.bar, color, opacity: 1 }} />;
+"""
+    content, hoisted, dynamic, _ = hoist(source, 'src/App.tsx')
+
+    assert hoisted == 0 and content == source
+    (literal,) = dynamic
+    free = {prop.key: prop.free for prop in literal.properties}
+    assert free == {'width': ['width'], 'background': ['theme'], 'color': ['color'], 'opacity': []}
+
+
+def test_css_rule_units_and_property_names():
+    source = """const A = () => <div style={{ marginTop: 12, padding: 0, zIndex: 3, lineHeight: 1.5, WebkitLineClamp: '2', color: "red" }} />;"""
+    index = TsxIndex(source)
+    (literal,) = style_literals(index)
+
+    assert css_rule('a-div', literal) == (".a-div {\n  margin-top: 12px;\n  padding: 0;\n  z-index: 3;\n"
+                                          "  line-height: 1.5;\n  -webkit-line-clamp: 2;\n  color: red;\n}\n")
+
+
+def test_css_mode_imports_the_stylesheet_relative_to_the_file():
+    source = """import React from 'react';
+const Card = () => <div style={{ display: 'flex' }}><b style={{ display: 'flex' }}>x</b><i style={{ gap: 2 }} /></div>;
+"""
+    content, hoisted, _, rules = hoist(source, 'src/components/Card.tsx', 'src/hoisted.css')
+
+    assert hoisted == 3
+    assert "import React from 'react';\nimport '../hoisted.css';\n" in content
+    assert '<div className="card-div"><b className="card-div">x</b><i className="card-i" /></div>' in content
+    assert 'Object.freeze' not in content and HEADER not in content
+    assert rules == [".card-div {\n  display: flex;\n}\n", ".card-i {\n  gap: 2px;\n}\n"]
+
+
+def test_css_mode_import_next_to_the_file_is_dot_relative():
+    source = "const A = () => <i style={{ color: 'red' }} />;\n"
+    content, _, _, _ = hoist(source, 'src/A.tsx', 'src/a.css')
+
+    assert content == "import './a.css';\nconst A = () => <i className=\"a-i\" />;\n"
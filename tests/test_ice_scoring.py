@@ -0,0 +1,56 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from ice_scoring import ScoreBoard  # noqa: E402
+
+
+@pytest.fixture
+def board():
+    experiments = [
+        {'id': 'a', 'impact': 10, 'confidence': 10, 'ease': 10},    # 1000
+        {'id': 'b', 'impact': 5, 'confidence': 5, 'ease': 5},       # 125
+        {'id': 'c', 'impact': 8, 'confidence': 8, 'ease': 5},       # 320
+        {'id': 'd', 'impact': 5, 'confidence': 5, 'ease': 5},       # 125, ties with b
+        {'id': 'e', 'impact': 10, 'confidence': 5, 'ease': 10},     # 500
+    ]
+    return ScoreBoard.from_experiments(experiments)
+
+
+def test_ice_scores_match_the_app(board):
+    assert board.score('ice').tolist() == [1000, 125, 320, 125, 500]
+
+
+def test_rice_and_pie_models(board):
+    rice = board.score('rice')
+    assert rice[1] == pytest.approx(1 * 5 * 0.5 / 6)
+    assert board.score('pie')[2] == pytest.approx(7.0)
+
+
+def test_buckets_use_the_ice_badge_thresholds(board):
+    assert board.buckets('ice').tolist() == [2, 0, 1, 0, 2]
+    assert board.bucket_counts('ice') == {'ice-low': 2, 'ice-medium': 1, 'ice-high': 2}
+
+
+def test_top_k_is_ordered_and_breaks_ties_by_position(board):
+    assert [exp_id for exp_id, _ in board.ranking(3)] == ['a', 'e', 'c']
+    assert [exp_id for exp_id, _ in board.ranking(5)] == ['a', 'e', 'c', 'b', 'd']
+    assert [exp_id for exp_id, _ in board.ranking(2, descending=False)] == ['b', 'd']
+    assert board.ranking(0) == []
+
+
+def test_top_k_matches_a_full_sort():
+    board = ScoreBoard.random(2000, seed=3)
+    scores = board.score('ice')
+    expected = sorted(range(len(board)), key=lambda i: (-scores[i], i))[:50]
+    assert board.top(50).tolist() == expected
+
+
+def test_update_patches_cached_scores(board):
+    board.score('ice')
+    board.score('pie')
+    board.update('b', impact=10, ease=10)
+
+    assert board.score('ice')[1] == 500
+    assert board.score('pie')[1] == pytest.approx(25 / 3)
+    assert board.ranking(2) == [('a', 1000.0), ('b', 500.0)]
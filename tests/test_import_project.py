@@ -0,0 +1,73 @@
+import io
+import json
+
+from import_project import (EXPERIMENT_COLUMNS, SCHEMAS, ProjectGraph, copy_batches, copy_field, emit_sql,
+                            schema_from_columns)
+
+PROJECT = {
+    'metadata': {'id': 'old-p', 'name': 'Polanco'},
+    'northStar': {'name': 'Revenue', 'currentValue': 10, 'targetValue': 100},
+    'objectives': [{'id': 'o1', 'title': 'Grow'}],
+    'strategies': [{'id': 's1', 'parentObjectiveId': 'o1', 'title': 'SEO'},
+                   {'id': 's2', 'parentObjectiveId': 'missing', 'title': 'Orphan'}],
+    'experiments': [{'id': 'e1', 'title': 'Tab\there', 'status': 'Idea', 'linkedStrategyId': 's1',
+                     'labels': ['a"b', None], 'iceScore': 200, 'visualProof': ['https://x/1.png']}],
+}
+
+
+def test_copy_field_encoding():
+    assert copy_field(None) == '\\N'
+    assert copy_field(True) == 't'
+    assert copy_field('a\\b\tc\nd') == 'a\\\\b\\tc\\nd'
+    assert copy_field(['a"b', None]) == '{"a\\\\"b",NULL}'
+
+
+def test_graph_resolves_ids_locally():
+    graph = ProjectGraph(PROJECT, owner_id='user-1')
+    (strategy,) = graph.strategies
+    (experiment,) = graph.experiments
+
+    assert strategy[2] == graph.objective_ids['o1']
+    assert experiment[EXPERIMENT_COLUMNS.index('linked_strategy_id')] == strategy[0]
+    assert graph.members == [(graph.project_id, 'user-1', 'admin')]
+
+
+def test_copy_batches_split_rows():
+    chunks = list(copy_batches([(1, 'a'), (2, 'b'), (3, None)], batch_rows=2))
+    assert chunks == ['1\ta\n2\tb\n', '3\t\\N\n']
+
+
+def experiment_copy(schema):
+    out = io.StringIO()
+    emit_sql(out, [ProjectGraph(PROJECT)], schema=schema)
+    lines = out.getvalue().splitlines()
+    start = next(i for i, line in enumerate(lines) if line.startswith('COPY public.experiments'))
+    return lines[start], lines[start + 1].split('\t')
+
+
+def test_emit_sql_for_migration_schema():
+    statement, row = experiment_copy(SCHEMAS['migration'])
+
+    assert 'ice_score' in statement
+    columns = statement[statement.index('(') + 1:statement.index(')')].split(', ')
+    assert row[columns.index('ice_score')] == '200'
+    assert row[columns.index('visual_proof')] == '{"https://x/1.png"}'
+    assert row[columns.index('title')] == 'Tab\\there'
+
+
+def test_emit_sql_for_generated_ice_and_jsonb_proof():
+    statement, row = experiment_copy(SCHEMAS['schema'])
+
+    columns = statement[statement.index('(') + 1:statement.index(')')].split(', ')
+    assert 'ice_score' not in columns
+    assert len(row) == len(columns)
+    assert json.loads(row[columns.index('visual_proof')]) == ['https://x/1.png']
+
+
+def test_schema_detected_from_information_schema():
+    schema = schema_from_columns([
+        ('experiments', 'ice_score', 'ALWAYS', 'integer'),
+        ('experiments', 'visual_proof', 'NEVER', 'jsonb'),
+        ('experiments', 'labels', 'NEVER', 'ARRAY'),
+    ])
+    assert schema == SCHEMAS['schema']
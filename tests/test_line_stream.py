@@ -0,0 +1,47 @@
+import pytest
+
+from line_stream import drop_render_log, is_console_statement, rewrite, strip_debug_logs
+
+
+@pytest.mark.parametrize('line', [
+    "    console.log('🔄 Fetching projects...');\n",
+    "console.debug(`rows: ${rows.map((r) => r.id).join(')')}`)\n",
+    "  console.info('done (ok);', { data, error });  \n",
+])
+def test_single_call_lines_are_stripped(line):
+    assert is_console_statement(line)
+
+
+@pytest.mark.parametrize('line', [
+    "console.log(x); doThing();\n",
+    "console.log(a), b();\n",
+    "console.log(a) || reset();\n",
+    "console.log('multi',\n",
+    "console.warn('kept');\n",
+])
+def test_lines_with_other_code_are_kept(line):
+    assert not is_console_statement(line)
+
+
+def test_strip_debug_logs_keeps_real_code():
+    lines = ["console.log('a');\n", "console.log(x); doThing();\n", "save();\n"]
+    assert list(strip_debug_logs()(lines)) == ["console.log(x); doThing();\n", "save();\n"]
+
+
+@pytest.mark.parametrize('line, expected', [
+    ('  if (import.meta.env.DEV) console.log("App rendering");\n', []),
+    ("  if (isDev(env)) console.log('App rendering')\n", []),
+    ('const App: React.FC = () => { console.log("App rendering");\n', ['const App: React.FC = () => {\n']),
+])
+def test_drop_render_log_removes_the_guard_with_the_call(line, expected):
+    lines = [line, '  const [view, setView] = useState(0);\n']
+    assert list(drop_render_log()(lines)) == expected + lines[1:]
+
+
+def test_rewrite_round_trips_utf8(tmp_path):
+    path = tmp_path / 'App.tsx'
+    path.write_text('  if (import.meta.env.DEV) console.log("App rendering");\n  const label = "🚀 Lanzar";\n',
+                    encoding='utf-8')
+
+    assert rewrite(str(path), drop_render_log())
+    assert path.read_text(encoding='utf-8') == '  const label = "🚀 Lanzar";\n'
@@ -0,0 +1,48 @@
+from memoize_app import build_patches
+
+APP = """import { useState } from 'react';
+
+export default function App() {
+  const [experiments] = useState([]);
+  const [searchQuery] = useState('');
+  const [direction] = useState('desc');
+
+  // Explore: open experiments
+  const explore = experiments.filter(e => e.open && e.title.includes(searchQuery));
+
+  const table = [...explore].sort((a, b) => direction === 'desc' ? b.ice - a.ice : a.ice - b.ice);
+  return <Table rows={table} />;
+}
+"""
+
+
+def rewrite(content):
+    patches, notes = build_patches(content, 'App', ())
+    result = patches.apply(content)
+    assert not result.missing
+    return result.content, notes
+
+
+def test_sort_split_moves_the_filter_instead_of_copying_it():
+    content, _ = rewrite(APP)
+
+    assert 'const explore' not in content
+    assert content.count('e.open && e.title.includes(searchQuery)') == 1
+    assert 'const tableOrder = useMemo(() => [...experiments].sort(' in content
+    assert '  // Explore: open experiments\n  const table = useMemo(() => tableOrder.filter(' in content
+    assert '[tableOrder, searchQuery]' in content
+
+
+def test_sort_of_a_list_read_elsewhere_memoizes_over_it():
+    app = APP.replace('<Table rows={table} />', '<Table rows={table} count={explore.length} />')
+    content, _ = rewrite(app)
+
+    assert 'const explore = useMemo(() => experiments.filter(' in content
+    assert 'const table = useMemo(() => [...explore].sort(' in content
+    assert 'Order' not in content
+
+
+def test_rerun_is_a_no_op():
+    content, _ = rewrite(APP)
+    patches, _ = build_patches(content, 'App', ())
+    assert not patches.patches
@@ -0,0 +1,46 @@
+import pytest
+
+import App_emergency_fix
+from patch_engine import Patch, PatchSet
+
+HANDLERS = """  const handleUpdateNorthStar = () => {
+    if (ok) {
+{state}
+    }
+  };
+
+  const handleReset = () => {
+{state}
+  };
+"""
+
+
+def test_within_limits_a_patch_to_the_range():
+    content = 'a x b x c'
+    patches = PatchSet([Patch('x', 'y', name='x', within=lambda text: (text.index('b'), len(text)))])
+    assert patches.apply(content).content == 'a x b y c'
+
+
+def test_within_requires_content_to_select():
+    patches = PatchSet([Patch('x', 'y', name='x', within=lambda text: (0, len(text)))])
+    with pytest.raises(ValueError):
+        patches.select(patches.scan('x'))
+
+
+def test_emergency_state_patch_is_exported_and_stays_in_its_handler():
+    content = HANDLERS.replace('{state}', App_emergency_fix.state_search)
+    (patches,) = App_emergency_fix.TARGETS.values()
+
+    result = patches.apply(content)
+
+    assert result.applied['north star state'] == 1
+    north_star, reset = result.content.split('const handleReset')
+    assert App_emergency_fix.state_replace in north_star
+    assert App_emergency_fix.state_search in reset
+
+
+def test_emergency_state_patch_needs_the_handler_signature():
+    content = HANDLERS.replace('{state}', App_emergency_fix.state_search).replace(
+        'handleUpdateNorthStar = () =>', 'handleUpdateNorthStar = async () =>')
+    (patches,) = App_emergency_fix.TARGETS.values()
+    assert patches.apply(content).applied['north star state'] == 0
@@ -0,0 +1,76 @@
+import os
+import shutil
+
+import pytest
+
+import patch_runner
+from conftest import ROOT
+
+GUARD = 'if (import.meta.env.DEV) '
+
+
+@pytest.fixture
+def tree(tmp_path, monkeypatch):
+    """Copy of the cleanup script and the files it guards, with the guards taken out."""
+    shutil.copy(os.path.join(ROOT, 'App_cleanup_logs.py'), tmp_path)
+    for name in ('App.tsx', 'hooks', 'contexts', 'lib'):
+        source = os.path.join(ROOT, 'src', name)
+        target = tmp_path / 'src' / name
+        if os.path.isdir(source):
+            shutil.copytree(source, target)
+        else:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy(source, target)
+    for path in (tmp_path / 'src' / 'hooks').glob('*.ts'):
+        path.write_text(path.read_text(encoding='utf-8').replace(GUARD, ''), encoding='utf-8')
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def snapshot(root):
+    return {path: path.read_bytes() for path in sorted((root / 'src').rglob('*')) if path.is_file()}
+
+
+def test_dry_run_leaves_hooks_untouched(tree, capsys):
+    before = snapshot(tree)
+
+    assert patch_runner.main(['--dry-run', '--no-ledger', 'App_cleanup_logs.py']) == 0
+
+    assert snapshot(tree) == before
+    output = capsys.readouterr().out
+    assert 'src/hooks/useProjects.ts' in output
+    assert '0 file(s) would change' not in output
+
+
+def test_run_guards_hooks_once(tree):
+    assert patch_runner.main(['--no-ledger', 'App_cleanup_logs.py']) == 0
+
+    hook = (tree / 'src' / 'hooks' / 'useProjects.ts').read_text(encoding='utf-8')
+    assert f"{GUARD}console.log('🔄 Fetching projects...');" in hook
+    assert GUARD + GUARD not in hook
+
+
+FOO_FIX = """\
+with open('src/App.tsx', 'r') as f:
+    content = f.read()
+with open('src/App.tsx', 'w') as f:
+    f.write(content.replace('foo', 'bar'))
+"""
+
+
+def test_glob_ledger_is_kept_per_target(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'App_foo_fix.py').write_text(FOO_FIX)
+    (tmp_path / 'src').mkdir()
+    a, b = tmp_path / 'src' / 'a.tsx', tmp_path / 'src' / 'b.tsx'
+    a.write_text('const a = 1;\n')
+    b.write_text('const b = 2;\n')
+
+    # First run: a no-op on both files, recorded in the ledger
+    assert patch_runner.main(['App_foo_fix.py', '--glob', 'src/*.tsx', '--jobs', '2']) == 0
+
+    a.write_text('const foo = 1;\n')
+    assert patch_runner.main(['App_foo_fix.py', '--glob', 'src/*.tsx', '--jobs', '2']) == 0
+
+    assert a.read_text() == 'const bar = 1;\n'
+    assert b.read_text() == 'const b = 2;\n'
@@ -0,0 +1,38 @@
+import os
+
+import patch_watch
+from conftest import ROOT
+
+
+def test_scripts_without_targets_are_not_run(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'App.tsx').write_text('original\n')
+    (tmp_path / 'App_line_fix.py').write_text("with open('App.tsx', 'w') as f:\n    f.write('rewritten\\n')\n")
+
+    assert patch_watch.load_targets(['App_line_fix.py']) == {}
+    assert (tmp_path / 'App.tsx').read_text() == 'original\n'
+    assert 'has no TARGETS' in capsys.readouterr().out
+
+
+def test_repair_scripts_are_watchable(monkeypatch):
+    monkeypatch.chdir(ROOT)
+    targets = patch_watch.load_targets(['App_fixer.py', 'repair_app.py'])
+    assert list(targets) == ['src/App.tsx']
+    assert len(targets['src/App.tsx']) == 2
+
+
+def test_watched_file_removes_injected_handler(tmp_path, monkeypatch):
+    monkeypatch.chdir(ROOT)
+    (patchset,) = patch_watch.load_targets(['repair_app.py'])['src/App.tsx']
+    handler = ("  const updateFunnelStage = (id: string, stage: FunnelStage) => {\n"
+               "    updateExperiment(id, { funnelStage: stage });\n"
+               "  };\n")
+    injected = ("  };\n\n  const updateFunnelStage = (id: string, stage: FunnelStage) => {\n"
+                "    setExperiments(prev => prev.map(e => e.id === id ? { ...e, funnelStage: stage } : e));\n"
+                "  };\n")
+    path = tmp_path / 'App.tsx'
+    path.write_text(handler + injected)
+
+    watched = patch_watch.WatchedFile(os.fspath(path), [patchset])
+    assert watched.apply() == {'injected updateFunnelStage': 1}
+    assert watched.content == handler + '  };\n'
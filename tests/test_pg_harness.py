@@ -0,0 +1,122 @@
+import os
+import random
+
+import pytest
+
+from conftest import ROOT
+from import_project import ProjectGraph
+from pg_harness import (AUTH_SHIM, GRANTS, PROFILES, RESET, SCHEMA_FILES, SHAPES, STATUSES, Context, as_user, boot,
+                        percentile, synthetic_project)
+
+
+class RecordingCursor:
+    def __init__(self, rows=()):
+        self.executed = []
+        self.rows = list(rows)
+
+    def execute(self, sql, params=None):
+        self.executed.append((sql, params))
+
+    def fetchall(self):
+        return self.rows
+
+    def fetchone(self):
+        return self.rows[0]
+
+
+class RecordingConnection:
+    def __init__(self):
+        self.executed = []
+
+    def execute(self, sql, params=None):
+        self.executed.append(sql)
+
+
+def test_schema_files_exist_in_order():
+    for path in SCHEMA_FILES:
+        assert os.path.isfile(os.path.join(ROOT, path)), path
+    assert SCHEMA_FILES[0] == 'supabase/migration.sql'
+
+
+def test_auth_shim_defines_what_the_policies_call():
+    for name in ('auth.uid()', 'auth.role()', 'auth.jwt()', 'auth.users'):
+        assert name in AUTH_SHIM
+    assert "request.jwt.claim.sub" in AUTH_SHIM
+
+
+def test_boot_applies_shims_then_schema_then_grants(monkeypatch):
+    monkeypatch.chdir(ROOT)
+    conn = RecordingConnection()
+
+    boot(conn, reset=True)
+
+    assert conn.executed[0] == RESET and conn.executed[1] == AUTH_SHIM
+    assert len(conn.executed) == 2 + len(SCHEMA_FILES) + 1
+    assert conn.executed[-1] == GRANTS
+
+    conn = RecordingConnection()
+    boot(conn)
+    assert conn.executed[0] == AUTH_SHIM
+
+
+def test_synthetic_project_matches_types_shape_and_loads():
+    project = synthetic_project(2, 40, random.Random(7))
+
+    assert project['metadata'] == {'id': 'project-2', 'name': 'Laboratorio 3'}
+    experiments = project['experiments']
+    assert len(experiments) == 40
+    for exp in experiments:
+        assert exp['status'] in STATUSES
+        assert exp['iceScore'] == exp['impact'] * exp['confidence'] * exp['ease']
+        assert (exp['keyLearnings'] is not None) == exp['status'].startswith('Finished')
+    graph = ProjectGraph(project, owner_id='user-1')
+    assert len(graph.experiments) == 40 and len(graph.strategies) == 6
+    assert all(row[17] is not None for row in graph.experiments)   # linked strategy resolved
+
+
+def test_synthetic_project_is_deterministic_per_seed():
+    assert synthetic_project(0, 10, random.Random(1)) == synthetic_project(0, 10, random.Random(1))
+
+
+def test_profiles_only_use_known_shapes():
+    for weights in PROFILES.values():
+        assert set(weights) <= set(SHAPES)
+        assert all(weight > 0 for weight in weights.values())
+
+
+def test_as_user_sets_role_and_subject_for_the_transaction():
+    cur = RecordingCursor()
+    as_user(cur, 'user-1')
+
+    ((sql, params),) = cur.executed
+    assert "set_config('request.jwt.claim.sub', %s, true)" in sql
+    assert "set_config('role', 'authenticated', true)" in sql
+    assert params == ['user-1']
+
+
+def test_shapes_act_on_the_context():
+    ctx = Context(random.Random(3))
+    ctx.project, ctx.experiment = 'p1', 'e1'
+    cur = RecordingCursor(rows=[('new-id',)])
+
+    SHAPES['experiments_page'](cur, ctx)
+    SHAPES['update_ice'](cur, ctx)
+    SHAPES['insert_experiment'](cur, ctx)
+    SHAPES['delete_experiment'](cur, ctx)
+    SHAPES['delete_experiment'](cur, ctx)   # nothing left to delete: no query
+
+    page, update, insert, delete = cur.executed
+    assert page[1][0] == 'p1' and 'ORDER BY ice_score DESC, id DESC' in page[0]
+    impact, confidence, ease, score, exp_id = update[1]
+    assert score == impact * confidence * ease and exp_id == 'e1'
+    assert insert[1][0] == 'p1'
+    assert delete[1] == ['new-id'] and ctx.created == []
+
+
+@pytest.mark.parametrize('fraction, expected', [(0.5, 50), (0.99, 99), (1.0, 100), (0.0, 1)])
+def test_percentile_is_nearest_rank(fraction, expected):
+    assert percentile(list(range(1, 101)), fraction) == expected
+
+
+def test_percentile_of_nothing_is_none():
+    assert percentile([], 0.5) is None
@@ -0,0 +1,42 @@
+from portfolio_rollups import PortfolioRollups
+
+PROJECT = {
+    'metadata': {'id': 'p1', 'name': 'Growth'},
+    'objectives': [{'id': 'o1'}],
+    'strategies': [],
+    'experiments': [{'id': 'e1', 'status': 'Idea', 'iceScore': 100}],
+}
+
+
+def test_event_without_project_is_skipped():
+    rollups = PortfolioRollups.from_projects([PROJECT])
+    rollups.apply_event({'table': 'experiments', 'eventType': 'UPDATE', 'new': {'id': 'e9', 'status': 'Idea'}})
+
+    assert [summary['project_id'] for summary in rollups.summaries()] == ['p1']
+    assert rollups.totals() == {'projects': 1, 'experiments': 1, 'active': 1}
+
+
+def test_deleted_project_is_not_revived():
+    rollups = PortfolioRollups.from_projects([PROJECT])
+    rollups.apply_event({'table': 'projects', 'eventType': 'DELETE', 'old': {'id': 'p1'}})
+    rollups.apply_event({'table': 'experiments', 'eventType': 'UPDATE',
+                         'new': {'id': 'e1', 'status': 'Finished - Winner'}})
+    rollups.apply_event({'table': 'objectives', 'eventType': 'UPDATE', 'new': {'id': 'o1', 'title': 'x'}})
+
+    assert rollups.summaries() == []
+    assert rollups.totals() == {'projects': 0, 'experiments': 0, 'active': 0}
+
+
+def test_event_without_status_counts_as_active():
+    rollups = PortfolioRollups.from_projects([PROJECT])
+    rollups.apply_event({'table': 'experiments', 'eventType': 'INSERT', 'new': {'id': 'e2', 'project_id': 'p1'}})
+
+    (summary,) = rollups.summaries()
+    assert summary['experiments'] == 2 and summary['active'] == 2 and summary['finished'] == 0
+    assert rollups.totals() == {'projects': 1, 'experiments': 2, 'active': 2}
+
+    rollups.apply_event({'table': 'experiments', 'eventType': 'UPDATE',
+                         'new': {'id': 'e2', 'status': 'Finished - Winner'}})
+    (summary,) = rollups.summaries()
+    assert summary['finished'] == 1 and summary['win_rate'] == 1.0
+    assert '' not in summary['by_status']
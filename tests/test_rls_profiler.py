@@ -0,0 +1,130 @@
+import json
+
+from rls_profiler import (GATED, QUERIES, VARIANTS, findings, install_variant, print_report,
+                          self_referencing_policies, write_plans)
+
+
+class ScriptedCursor:
+    """Records statements; fetchall() returns the next scripted result."""
+
+    def __init__(self, results=()):
+        self.executed = []
+        self.results = list(results)
+
+    def execute(self, sql, params=None):
+        self.executed.append((sql, params))
+
+    def fetchall(self):
+        return self.results.pop(0) if self.results else []
+
+
+def plan(root, execution_ms=1.0):
+    return {'Plan': root, 'Execution Time': execution_ms}
+
+
+def kinds(found):
+    return [kind for kind, _, _ in found]
+
+
+def test_correlated_exists_is_a_per_row_subplan():
+    root = {'Node Type': 'Seq Scan', 'Relation Name': 'experiments', 'Actual Rows': 40, 'Actual Loops': 1,
+            'Filter': '(alternatives: SubPlan 1 or hashed SubPlan 2)',
+            'Plans': [{'Node Type': 'Index Scan', 'Subplan Name': 'SubPlan 1', 'Actual Rows': 1,
+                       'Actual Loops': 500, 'Relation Name': 'project_members',
+                       'Index Cond': '(project_id = experiments.project_id)'}]}
+
+    found = findings(plan(root), definers=set())
+
+    assert kinds(found) == ['per-row subplan']
+    assert 'ran 500 times' in found[0][1]
+    assert '(SELECT auth.uid())' in found[0][2]
+
+
+def test_definer_helper_in_a_filter_is_flagged_per_row():
+    root = {'Node Type': 'Index Scan', 'Relation Name': 'objectives', 'Actual Rows': 30,
+            'Rows Removed by Filter': 0, 'Filter': 'is_project_member(project_id, auth.uid())'}
+
+    found = findings(plan(root), definers={'is_project_member', 'rls_user_project_ids'})
+
+    assert kinds(found) == ['per-row definer call', 'per-row auth.uid()']
+    assert 'rls_user_project_ids()' in found[0][2]
+
+
+def test_initplan_auth_uid_and_single_rows_are_not_flagged():
+    root = {'Node Type': 'Index Scan', 'Relation Name': 'projects', 'Actual Rows': 1,
+            'Filter': 'is_project_member(id, auth.uid())',
+            'Plans': [{'Node Type': 'Result', 'Subplan Name': 'InitPlan 1', 'Actual Rows': 1, 'Actual Loops': 1,
+                       'Filter': 'auth.uid()'}]}
+
+    assert findings(plan(root), definers={'is_project_member'}) == []
+
+
+def test_large_filtered_seq_scan_suggests_an_index():
+    root = {'Node Type': 'Seq Scan', 'Relation Name': 'experiments', 'Actual Rows': 200,
+            'Rows Removed by Filter': 9800, 'Filter': '(project_id = $0)'}
+
+    ((kind, detail, suggestion),) = findings(plan(root), definers=set())
+
+    assert kind == 'filtered seq scan' and '9800 rows removed' in detail
+    assert suggestion == 'CREATE INDEX ON experiments (project_id)'
+
+
+def test_install_variant_replaces_select_policies_on_every_gated_table():
+    existing = [[('Members can view',)], [('Members can view objectives',), ('All for members',)], [], []]
+    cur = ScriptedCursor(existing)
+
+    install_variant(cur, 'member_in_initplan')
+
+    statements = [sql for sql, _ in cur.executed]
+    assert statements[0].lstrip().startswith('CREATE OR REPLACE FUNCTION is_project_member')
+    assert 'DROP POLICY "Members can view" ON projects' in statements
+    assert 'DROP POLICY "All for members" ON objectives' in statements
+    created = [sql for sql in statements if sql.startswith('CREATE POLICY')]
+    assert len(created) == len(GATED)
+    assert 'ON projects FOR SELECT USING (' in created[0] and 'id IN (SELECT pm.project_id' in created[0]
+    assert all('{' not in sql for sql in created)
+
+
+def test_every_variant_formats_for_every_table():
+    for body in VARIANTS.values():
+        for table, key in GATED.items():
+            assert key in body.format(table=table, key=key)
+
+
+def test_self_referencing_policies_match_their_own_table_only():
+    cur = ScriptedCursor([[
+        ('project_members', 'Members see members',
+         'EXISTS (SELECT 1 FROM project_members pm WHERE pm.project_id = project_members.project_id)'),
+        ('experiments', 'Members see experiments', 'EXISTS (SELECT 1 FROM public.project_members pm)'),
+        ('projects', 'Admins', 'id IN (SELECT project_id FROM public.projects_admins)'),
+    ]])
+
+    assert self_referencing_policies(cur) == [('project_members', 'Members see members')]
+
+
+def report():
+    results = {query: {'ms': 2.0, 'rows': 10, 'findings': [], 'plan': {'Plan': {}}} for query in QUERIES}
+    slow = dict(results, experiments_by_project={
+        'ms': 8.0, 'rows': 10, 'plan': {'Plan': {}},
+        'findings': [('per-row auth.uid()', 'over ~500 rows', 'wrap it')] * 2})
+    broken = dict(results, projects_list={'ms': None, 'rows': None, 'findings': [],
+                                          'error': 'infinite recursion in policy: ...'})
+    return {'bypass': results, 'member_exists': slow, 'definer_function': broken}
+
+
+def test_print_report_shows_ratios_errors_and_deduplicated_findings(capsys):
+    print_report(report())
+    out = capsys.readouterr().out
+
+    assert '(4.0x)' in out
+    assert 'error' in out and '❌ projects_list: infinite recursion' in out
+    assert out.count('per-row auth.uid()') == 1
+
+
+def test_write_plans_skips_errored_queries(tmp_path):
+    write_plans(report(), tmp_path)
+
+    written = sorted(path.name for path in tmp_path.iterdir())
+    assert 'definer_function.projects_list.json' not in written
+    assert len(written) == 3 * len(QUERIES) - 1
+    assert json.loads((tmp_path / 'bypass.projects_list.json').read_text()) == {'Plan': {}}
@@ -0,0 +1,58 @@
+from scan_complexity import analyze, rewrite
+
+VIEW = """import { useMemo } from 'react';
+import type { Experiment, Strategy } from './types';
+
+export const Table = ({ experiments, strategies }: { experiments: Experiment[]; strategies: Strategy[] }) => {
+  return (
+    <ul>
+      {experiments.map(exp => {
+        const strategy = strategies.find(s => s.id === exp.linkedStrategyId);
+        const siblings = experiments.filter(e => e.status === exp.status);
+        return <li key={exp.id}>{strategy?.title} {siblings.length}</li>;
+      })}
+    </ul>
+  );
+};
+"""
+
+
+def run(content, path='src/Table.tsx'):
+    index, findings, components, _ = analyze(path, content)
+    return rewrite(content, index, findings, components, path)[0]
+
+
+def test_id_lookups_use_a_one_to_one_typed_map():
+    content = run(VIEW)
+
+    assert 'const strategiesById = useMemo(() => new Map<string, Strategy>(strategies.map(item => [item.id, item])), [strategies]);' in content
+    assert 'const strategy = strategiesById.get(exp.linkedStrategyId);' in content
+
+
+def test_non_unique_fields_keep_the_group_by():
+    content = run(VIEW)
+
+    assert 'const experimentsByStatus = useMemo(() => {' in content
+    assert 'new Map<unknown, typeof experiments>()' in content
+    assert 'const siblings = experimentsByStatus.get(exp.status) ?? [];' in content
+
+
+def test_id_filter_keeps_the_group_by():
+    view = VIEW.replace('strategies.find(s => s.id === exp.linkedStrategyId)',
+                        'strategies.filter(s => s.id === exp.linkedStrategyId)[0]')
+    content = run(view)
+
+    assert 'new Map<unknown, typeof strategies>()' in content
+    assert '(strategiesById.get(exp.linkedStrategyId) ?? [])[0]' in content
+
+
+def test_element_type_is_imported_from_types(tmp_path):
+    (tmp_path / 'types.ts').write_text('export interface Strategy {\n  id: string;\n}\n')
+    view = VIEW.replace("import type { Experiment, Strategy } from './types';",
+                        "import type { Experiment } from './types';").replace(
+        '{ experiments: Experiment[]; strategies: Strategy[] }', 'any')
+
+    content = run(view, str(tmp_path / 'Table.tsx'))
+
+    assert "import type { Experiment, Strategy } from './types';" in content
+    assert 'new Map<string, Strategy>(strategies.map(' in content
@@ -0,0 +1,19 @@
+from tsx_index import TsxIndex
+
+SOURCE = """const Row = ({ onPick }: { onPick: (id: string) => void }) => {
+  return <p onClick={() => onPick('a')} />;
+};
+const Card = React.memo(({ title }: { title: string }) => {
+  return <div>{title}</div>;
+});
+"""
+
+
+def test_function_body_skips_arrows_in_parameter_types():
+    index = TsxIndex(SOURCE)
+    body = index.function_body('Row')
+    assert SOURCE[body.start:body.end].startswith("{\n  return <p")
+
+
+def test_function_body_does_not_follow_memo_wrappers():
+    assert TsxIndex(SOURCE).function_body('Card') is None
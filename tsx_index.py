@@ -0,0 +1,454 @@
+"""
+Tokenizer and brace/JSX interval index for the TS/TSX subset this app uses.
+
+One pass over a file produces its tokens and every (), [], {} and JSX
+element as an interval, nested through parent links. Patches can then ask
+for "the body of function X" or "the <button> containing text Y" instead
+of relying on exact multi-line strings:
+
+    index = TsxIndex(content)
+    body = index.function_body('handleUpdateNorthStar')
+    result = PATCHES.apply(content, body.start, body.end)
+
+    button = index.element_containing('button', 'New Objective')
+    content[button.start:button.end]
+
+Lookups go through sorted start offsets (bisect) and parent links, so
+they cost O(log n + depth) rather than a rescan of the file.
+
+This is not a full TypeScript parser. It knows enough to keep strings,
+template literals, comments, regex literals and JSX text out of the
+brace structure; `<` starts JSX only where an expression can start
+(after `(`, `=`, `return`, `&&`, `?`, `=>` ...), so generics such as
+useState<Experiment | null>(null) are left alone.
+"""
+import bisect
+import re
+from collections import namedtuple
+
+Token = namedtuple('Token', 'kind text start end')
+
+IDENT = re.compile(r'[A-Za-z_$][\w$]*')
+NUMBER = re.compile(r'(?:0[xX][\da-fA-F_]+|\d[\d_]*(?:\.\d*)?(?:[eE][+-]?\d+)?|\.\d+)n?')
+JSX_NAME = re.compile(r'[A-Za-z_$][\w$.:-]*')
+PUNCT = sorted("""
+    >>>= ... === !== **= <<= >>= >>> &&= ||= ??= => == != <= >= && || ?? ?.
+    ++ -- += -= *= /= %= &= |= ^= ** << >> ; , < > + - * / % & | ^ ! ~ ? : = . @ #
+""".split(), key=len, reverse=True)
+
+# After these tokens an expression can start, so `/` is a regex and `<` may open JSX
+EXPRESSION_KEYWORDS = {'return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'new',
+                       'delete', 'void', 'throw', 'yield', 'await', 'default'}
+NOT_EXPRESSION_PUNCT = {')', ']', '}', '++', '--'}
+
+CLOSERS = {'(': ')', '[': ']', '{': '}'}
+
+
+class Interval:
+    """A bracketed region or JSX element: text[start:end] includes the delimiters."""
+
+    __slots__ = ('kind', 'start', 'end', 'name', 'inner_start', 'inner_end', 'parent')
+
+    def __init__(self, kind, start, end=None, name=None):
+        self.kind = kind
+        self.start = start
+        self.end = end
+        self.name = name
+        self.inner_start = start + 1
+        self.inner_end = None
+        self.parent = None
+
+    def __repr__(self):
+        label = f"<{self.name}>" if self.kind == 'jsx' else self.kind
+        return f"Interval({label}, {self.start}, {self.end})"
+
+    def contains(self, pos):
+        return self.start <= pos < self.end
+
+    def ancestors(self):
+        node = self.parent
+        while node is not None:
+            yield node
+            node = node.parent
+
+
+class TsxSyntaxError(ValueError):
+    pass
+
+
+class Scanner:
+    def __init__(self, text):
+        self.text = text
+        self.pos = 0
+        self.tokens = []
+        self.intervals = []
+
+    def error(self, message, pos=None):
+        pos = self.pos if pos is None else pos
+        line = self.text.count('\n', 0, pos) + 1
+        raise TsxSyntaxError(f"{message} at line {line}")
+
+    def emit(self, kind, start, end):
+        self.tokens.append(Token(kind, self.text[start:end], start, end))
+
+    def last_significant(self):
+        for token in reversed(self.tokens):
+            if token.kind != 'comment':
+                return token
+        return None
+
+    def expression_allowed(self):
+        prev = self.last_significant()
+        if prev is None:
+            return True
+        if prev.kind == 'ident':
+            return prev.text in EXPRESSION_KEYWORDS
+        if prev.kind == 'punct':
+            return prev.text not in NOT_EXPRESSION_PUNCT
+        return prev.kind == 'jsx-close'
+
+    # -- JS / TS ---------------------------------------------------------
+
+    def scan(self):
+        self.scan_js(stop=None)
+        return self
+
+    def scan_js(self, stop):
+        """Scan code until the unmatched `stop` bracket (not consumed)."""
+        text = self.text
+        n = len(text)
+        stack = []
+        while self.pos < n:
+            c = text[self.pos]
+            start = self.pos
+            if c in ' \t\r\n':
+                self.pos += 1
+            elif text.startswith('//', start):
+                end = text.find('\n', start)
+                self.pos = n if end < 0 else end
+                self.emit('comment', start, self.pos)
+            elif text.startswith('/*', start):
+                end = text.find('*/', start + 2)
+                if end < 0:
+                    self.error("Unterminated comment")
+                self.pos = end + 2
+                self.emit('comment', start, self.pos)
+            elif c in '"\'':
+                self.scan_string(c)
+            elif c == '`':
+                self.scan_template()
+            elif c in '([{':
+                interval = Interval(c, start)
+                self.intervals.append(interval)
+                stack.append(interval)
+                self.pos += 1
+                self.emit('punct', start, self.pos)
+            elif c in ')]}':
+                if not stack:
+                    if c == stop:
+                        return
+                    self.error(f"Unmatched {c!r}")
+                interval = stack.pop()
+                if CLOSERS[interval.kind] != c:
+                    self.error(f"Expected {CLOSERS[interval.kind]!r} but found {c!r}")
+                self.pos += 1
+                interval.end = self.pos
+                interval.inner_end = start
+                self.emit('punct', start, self.pos)
+            elif c == '/' and self.expression_allowed():
+                self.scan_regex()
+            elif c == '<' and self.expression_allowed() and (
+                    text.startswith('>', start + 1) or IDENT.match(text, start + 1)):
+                self.scan_jsx_element()
+            elif IDENT.match(text, start):
+                self.pos = IDENT.match(text, start).end()
+                self.emit('ident', start, self.pos)
+            elif NUMBER.match(text, start):
+                self.pos = NUMBER.match(text, start).end()
+                self.emit('number', start, self.pos)
+            else:
+                for op in PUNCT:
+                    if text.startswith(op, start):
+                        break
+                else:
+                    op = c
+                self.pos += len(op)
+                self.emit('punct', start, self.pos)
+        if stack:
+            self.error(f"Unclosed {stack[-1].kind!r}", stack[-1].start)
+        if stop:
+            self.error(f"Expected {stop!r} before end of file")
+
+    def scan_string(self, quote):
+        text = self.text
+        start = self.pos
+        pos = start + 1
+        while pos < len(text):
+            c = text[pos]
+            if c == '\\':
+                pos += 2
+            elif c == quote:
+                self.pos = pos + 1
+                self.emit('string', start, self.pos)
+                return
+            elif c == '\n':
+                break
+            else:
+                pos += 1
+        self.error("Unterminated string", start)
+
+    def scan_template(self):
+        text = self.text
+        start = self.pos
+        pos = start + 1
+        while pos < len(text):
+            c = text[pos]
+            if c == '\\':
+                pos += 2
+            elif c == '`':
+                self.pos = pos + 1
+                self.emit('template', start, self.pos)
+                return
+            elif text.startswith('${', pos):
+                self.emit('template', start, pos)
+                self.pos = pos + 1
+                interval = Interval('{', self.pos)
+                self.intervals.append(interval)
+                self.pos += 1
+                self.scan_js(stop='}')
+                interval.inner_end = self.pos
+                self.pos += 1
+                interval.end = self.pos
+                start = pos = self.pos
+            else:
+                pos += 1
+        self.error("Unterminated template literal", start)
+
+    def scan_regex(self):
+        text = self.text
+        start = self.pos
+        pos = start + 1
+        in_class = False
+        while pos < len(text):
+            c = text[pos]
+            if c == '\\':
+                pos += 2
+                continue
+            if c == '\n':
+                break
+            if c == '[':
+                in_class = True
+            elif c == ']':
+                in_class = False
+            elif c == '/' and not in_class:
+                pos += 1
+                while pos < len(text) and text[pos].isalpha():
+                    pos += 1
+                self.pos = pos
+                self.emit('regex', start, pos)
+                return
+            pos += 1
+        self.error("Unterminated regex literal", start)
+
+    # -- JSX -------------------------------------------------------------
+
+    def skip_space(self):
+        text = self.text
+        while self.pos < len(text) and text[self.pos] in ' \t\r\n':
+            self.pos += 1
+
+    def scan_expression_container(self):
+        """Scan `{ ... }` inside JSX, starting on the `{`."""
+        interval = Interval('{', self.pos)
+        self.intervals.append(interval)
+        self.emit('punct', self.pos, self.pos + 1)
+        self.pos += 1
+        self.scan_js(stop='}')
+        interval.inner_end = self.pos
+        self.emit('punct', self.pos, self.pos + 1)
+        self.pos += 1
+        interval.end = self.pos
+
+    def scan_jsx_element(self):
+        text = self.text
+        start = self.pos
+        self.pos += 1
+        if text.startswith('>', self.pos):
+            name = ''
+        else:
+            match = JSX_NAME.match(text, self.pos)
+            name = match.group()
+            self.pos = match.end()
+        element = Interval('jsx', start, name=name)
+        self.intervals.append(element)
+        self.emit('jsx-open', start, self.pos)
+
+        # Attributes
+        while True:
+            self.skip_space()
+            if self.pos >= len(text):
+                self.error(f"Unterminated <{name}> tag", start)
+            if text.startswith('/>', self.pos):
+                self.pos += 2
+                self.emit('jsx-close', self.pos - 2, self.pos)
+                element.end = self.pos
+                element.inner_start = element.inner_end = self.pos
+                return
+            if text[self.pos] == '>':
+                self.pos += 1
+                element.inner_start = self.pos
+                break
+            if text[self.pos] == '{':
+                self.scan_expression_container()
+                continue
+            match = JSX_NAME.match(text, self.pos)
+            if not match:
+                self.error(f"Unexpected {text[self.pos]!r} in <{name}> tag")
+            self.emit('jsx-attr', match.start(), match.end())
+            self.pos = match.end()
+            self.skip_space()
+            if not text.startswith('=', self.pos):
+                continue
+            self.pos += 1
+            self.skip_space()
+            if text[self.pos] in '"\'':
+                quote = text[self.pos]
+                end = text.find(quote, self.pos + 1)
+                if end < 0:
+                    self.error("Unterminated attribute value")
+                self.emit('string', self.pos, end + 1)
+                self.pos = end + 1
+            elif text[self.pos] == '{':
+                self.scan_expression_container()
+            elif text[self.pos] == '<':
+                self.scan_jsx_element()
+            else:
+                self.error(f"Unexpected attribute value in <{name}> tag")
+
+        # Children
+        while True:
+            if self.pos >= len(text):
+                self.error(f"Unclosed <{name}>", start)
+            if text.startswith('</', self.pos):
+                element.inner_end = self.pos
+                end = text.find('>', self.pos)
+                closing = text[self.pos + 2:end].strip()
+                if closing != name:
+                    self.error(f"Expected </{name}> but found </{closing}>")
+                self.pos = end + 1
+                self.emit('jsx-close', element.inner_end, self.pos)
+                element.end = self.pos
+                return
+            c = text[self.pos]
+            if c == '<':
+                self.scan_jsx_element()
+            elif c == '{':
+                self.scan_expression_container()
+            else:
+                end = self.pos
+                while end < len(text) and text[end] not in '<{':
+                    end += 1
+                if text[self.pos:end].strip():
+                    self.emit('jsx-text', self.pos, end)
+                self.pos = end
+
+
+class TsxIndex:
+    def __init__(self, text):
+        scanner = Scanner(text).scan()
+        self.text = text
+        self.tokens = scanner.tokens
+        self.token_starts = [token.start for token in self.tokens]
+        self.intervals = sorted(scanner.intervals, key=lambda iv: (iv.start, -iv.end))
+        self.starts = [iv.start for iv in self.intervals]
+        self.by_start = {}
+
+        stack = []
+        for interval in self.intervals:
+            while stack and stack[-1].end <= interval.start:
+                stack.pop()
+            interval.parent = stack[-1] if stack else None
+            stack.append(interval)
+            self.by_start.setdefault(interval.start, interval)
+
+        self.identifiers = {}
+        for i, token in enumerate(self.tokens):
+            if token.kind == 'ident':
+                self.identifiers.setdefault(token.text, []).append(i)
+
+    @classmethod
+    def from_file(cls, path):
+        with open(path, 'r') as f:
+            return cls(f.read())
+
+    def enclosing(self, pos, kind=None, name=None):
+        """Innermost interval containing pos, optionally of a given kind/tag name."""
+        i = bisect.bisect_right(self.starts, pos) - 1
+        if i < 0:
+            return None
+        node = self.intervals[i]
+        while node is not None:
+            if node.contains(pos) and (kind is None or node.kind == kind) and (name is None or node.name == name):
+                return node
+            node = node.parent
+        return None
+
+    def token_at(self, pos):
+        i = bisect.bisect_right(self.token_starts, pos) - 1
+        if i >= 0 and self.tokens[i].start <= pos < self.tokens[i].end:
+            return i
+        return None
+
+    def next_token(self, i, text):
+        """Index of the first token after token i whose text is `text`."""
+        for j in range(i + 1, len(self.tokens)):
+            if self.tokens[j].text == text and self.tokens[j].kind == 'punct':
+                return j
+        return None
+
+    def function_body(self, name):
+        """The `{...}` (or expression) body of `function name` or `const name = (...) => ...`.
+
+        Arrows inside parameter type annotations (`(p: { onPick: (id) => void }) =>`)
+        are skipped. Wrapped components such as `const Card = React.memo((...) => ...)`
+        are not followed and return None, so memoize_app.py can only analyse the
+        body of a component it has not wrapped in React.memo.
+        """
+        tokens = self.tokens
+        for i in self.identifiers.get(name, ()):
+            prev = tokens[i - 1].text if i else None
+            if prev == 'function':
+                paren = self.next_token(i, '(')
+                params = self.by_start[tokens[paren].start]
+                j = bisect.bisect_left(self.token_starts, params.end)
+                brace = self.next_token(j - 1, '{')
+                return self.by_start[tokens[brace].start]
+            if prev in ('const', 'let', 'var'):
+                # The first `=>` at the declaration's own nesting level, so
+                # arrows inside parameter type annotations are skipped
+                scope = self.enclosing(tokens[i].start)
+                for j in range(i + 1, len(tokens) - 1):
+                    token = tokens[j]
+                    if token.kind != 'punct' or self.enclosing(token.start) is not scope:
+                        continue
+                    if token.text == ';':
+                        break
+                    if token.text == '=>':
+                        body = self.by_start.get(tokens[j + 1].start)
+                        if body is not None:
+                            return body
+                        break
+        return None
+
+    def elements(self, name=None):
+        return [iv for iv in self.intervals if iv.kind == 'jsx' and (name is None or iv.name == name)]
+
+    def element_containing(self, name, text, start=0):
+        """First <name> element whose contents include `text`."""
+        pos = self.text.find(text, start)
+        while pos >= 0:
+            element = self.enclosing(pos, kind='jsx', name=name)
+            if element is not None and element.end >= pos + len(text):
+                return element
+            pos = self.text.find(text, pos + 1)
+        return None